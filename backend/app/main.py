@@ -2,9 +2,16 @@
 from fastapi import FastAPI
 import logging
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from app.routers import auth, profile_router, analysis, files, feedback_router
 from app.routers.explanation_router import router as explanation_router
+from app.services.linter_config import materialize_default_configs
+from app.services.pipeline_log import log_queue_depth, start_log_listener, stop_log_listener
+from app.services.metrics import CONTENT_TYPE, REGISTRY
+from app.services.pylint_pool import get_pylint_pool, shutdown_pylint_pool
+from app.services.ast_checks import shutdown_ast_executor
 import asyncio
+from typing import Optional
 
 logger = logging.getLogger("uvicorn.error")
 
@@ -38,14 +45,54 @@ app.include_router(profile_router.router, prefix="/api/v1")
 async def health_check():
     return {"status": "healthy"}
 
+SESSION_SWEEP_INTERVAL = 300  # seconds between session expiry / blob GC passes
+_sweeper: Optional[asyncio.Task] = None
+
+async def sweep_sessions():
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL)
+        try:
+            # Bookkeeping stays on the loop; only rmtree and blob GC go to a thread
+            await analysis.expire_sessions()
+        except Exception as e:
+            logger.error(f"Session sweep failed: {e}")
+
+REGISTRY.gauge("pink_queue_depth", "Items waiting in internal queues", ["queue"],
+               callback=lambda: {("log",): log_queue_depth()})
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus scrape endpoint"""
+    await analysis.refresh_storage_gauges()
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+@app.on_event("startup")
+async def startup_event():
+    # Application log records are formatted and written off the event loop
+    start_log_listener()
+    # Linter configs are immutable, content-hashed files written once per process
+    materialize_default_configs(project_type.value for project_type in analysis.ProjectType)
+    # Warm pylint workers import astroid and the checkers once, in the background
+    pool = get_pylint_pool()
+    if pool is not None:
+        pool.start()
+    # Expired sessions release their blob links; unreferenced blobs are collected
+    global _sweeper
+    _sweeper = asyncio.create_task(sweep_sessions())
+
 @app.on_event("shutdown")
 async def shutdown_event():
+    if _sweeper is not None:
+        _sweeper.cancel()
     try:
         await asyncio.wait_for(analysis.cleanup_temp_dirs(), timeout=5.0)
     except asyncio.TimeoutError:
         logger.error("Timeout during cleanup")
     except Exception as e:
         logger.error(f"Cleanup error: {e}")
+    shutdown_pylint_pool()
+    shutdown_ast_executor()
+    stop_log_listener()
 
 if __name__ == "__main__":
     import uvicorn
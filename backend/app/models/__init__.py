@@ -9,6 +9,7 @@ from .user_profile import (
     ExperienceLevel
 )
 from .issue import Issue, IssueType
+from .issue_table import IssueIndex, IssueTable
 
 __all__ = [
     'UserProfile',
@@ -19,5 +20,7 @@ __all__ = [
     'UserUpdate',
     'ExperienceLevel',
     'Issue',
-    'IssueType'
+    'IssueType',
+    'IssueTable',
+    'IssueIndex'
 ]
\ No newline at end of file
@@ -8,15 +8,22 @@ class IssueType(str, Enum):
     WARNING = "warning"
     SECURITY = "security"
     COMPLEXITY = "complexity"
+    CONVENTION = "convention"
+    REFACTOR = "refactor"
+    INFO = "info"
 
 class Issue(BaseModel):
-    type: IssueType
+    type: IssueType = IssueType.WARNING
     file: str
     line: int
     message: str
     code: str
+    column: int = 0
     url: Optional[str] = None
+    linter: Optional[str] = None
+    symbol: Optional[str] = None
+    complexity: Optional[int] = None
     flamingo_message: Optional[str] = None
     explanation: Optional[Dict[str, str]] = None
     severity: Optional[Literal["low", "medium", "high"]] = None
-    confidence: Optional[Literal["low", "medium", "high"]] = None
\ No newline at end of file
+    confidence: Optional[Literal["low", "medium", "high"]] = None
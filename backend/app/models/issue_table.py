@@ -0,0 +1,318 @@
+# backend/app/models/issue_table.py
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from heapq import nlargest
+from itertools import count
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+ABSENT = 0  # id 0 in every dictionary column means "field not present"
+
+_generations = count(1)
+
+
+def generate_flamingo_message(issue: dict) -> str:
+    """
+    Generate a user-friendly message for a linter issue.
+    """
+    return f"[{issue.get('type', '').capitalize()}] {issue.get('code', '')}: {issue.get('message', '')}"
+
+
+class DictColumn:
+    """Dictionary-encoded string column: one interned copy per distinct value"""
+    __slots__ = ("ids", "values", "lookup")
+
+    def __init__(self):
+        self.ids = array("I")
+        self.values: List[Optional[str]] = [None]
+        self.lookup: Dict[str, int] = {}
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return ABSENT
+        value = str(value)
+        value_id = self.lookup.get(value)
+        if value_id is None:
+            value_id = len(self.values)
+            self.values.append(value)
+            self.lookup[value] = value_id
+        return value_id
+
+    def append(self, value: Optional[str]) -> None:
+        self.ids.append(self.encode(value))
+
+    def value(self, row: int) -> Optional[str]:
+        return self.values[self.ids[row]]
+
+
+class IssueTable:
+    """Columnar store for linter issues.
+
+    Frequent fields live in parallel arrays (dictionary-encoded where they
+    are strings); rare fields such as ``confidence`` or ``complexity`` live
+    in a sparse per-row dict. Issue dicts are only built by ``row``/
+    ``to_dicts`` at the API boundary.
+    """
+    __slots__ = ("file", "line", "column", "code", "type", "severity",
+                 "message", "url", "linter", "symbol", "fingerprint", "extras", "_index", "generation")
+
+    STRING_FIELDS = ("file", "code", "type", "severity", "message", "url", "linter", "symbol", "fingerprint")
+    INT_FIELDS = ("line", "column")
+    RENDER_ORDER = ("type", "file", "line", "column", "message", "code", "url",
+                    "severity", "linter", "symbol", "fingerprint")
+
+    def __init__(self):
+        for name in self.STRING_FIELDS:
+            setattr(self, name, DictColumn())
+        self.line = array("I")
+        self.column = array("I")
+        self.extras: Dict[int, Dict[str, Any]] = {}
+        self._index: Optional["IssueIndex"] = None
+        # Changes whenever rows do; cursors carry it so they never outlive their table
+        self.generation = next(_generations)
+
+    @classmethod
+    def from_dicts(cls, issues: Iterable[Dict[str, Any]]) -> "IssueTable":
+        table = cls()
+        table.extend(issues)
+        return table
+
+    def __len__(self) -> int:
+        return len(self.line)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(i) for i in range(len(self)))
+
+    @property
+    def index(self) -> "IssueIndex":
+        """Inverted indexes over this table, built on first use and dropped on mutation"""
+        if self._index is None:
+            self._index = IssueIndex(self)
+        return self._index
+
+    def append(self, issue: Dict[str, Any]) -> None:
+        self._index = None
+        self.generation = next(_generations)
+        row = len(self)
+        for name in self.STRING_FIELDS:
+            getattr(self, name).append(issue.get(name))
+        # Lines/columns are stored +1 so that 0 can mean "absent"
+        line = issue.get("line")
+        column = issue.get("column")
+        self.line.append(0 if line is None else int(line) + 1)
+        self.column.append(0 if column is None else int(column) + 1)
+
+        extra = {
+            key: value for key, value in issue.items()
+            if key not in self.RENDER_ORDER and key != "flamingo_message"
+        }
+        if extra:
+            self.extras[row] = extra
+
+    def extend(self, issues: Iterable[Dict[str, Any]]) -> None:
+        if isinstance(issues, IssueTable):
+            issues = [issues._raw(i) for i in range(len(issues))]
+        for issue in issues:
+            self.append(issue)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        issue: Dict[str, Any] = {}
+        for name in self.RENDER_ORDER:
+            if name in self.INT_FIELDS:
+                stored = getattr(self, name)[i]
+                if stored:
+                    issue[name] = stored - 1
+            else:
+                value = getattr(self, name).value(i)
+                if value is not None:
+                    issue[name] = value
+        extra = self.extras.get(i)
+        if extra:
+            issue.update(extra)
+        issue["flamingo_message"] = generate_flamingo_message(issue)
+        return issue
+
+    def to_dicts(self, rows: Optional[Sequence[int]] = None) -> List[Dict[str, Any]]:
+        if rows is None:
+            rows = range(len(self))
+        return [self.row(i) for i in rows]
+
+    def take(self, rows: Sequence[int]) -> "IssueTable":
+        """New table holding only ``rows`` (re-encoded, so dictionaries stay compact)"""
+        table = IssueTable()
+        for i in rows:
+            table.append(self._raw(i))
+        return table
+
+    def _raw(self, i: int) -> Dict[str, Any]:
+        issue = {name: getattr(self, name).value(i) for name in self.STRING_FIELDS}
+        issue["line"] = self.line[i] - 1 if self.line[i] else None
+        issue["column"] = self.column[i] - 1 if self.column[i] else None
+        issue.update(self.extras.get(i, {}))
+        return issue
+
+    def _ids(self, field: str, value: str) -> List[int]:
+        value_id = getattr(self, field).lookup.get(value)
+        return [] if value_id is None else [value_id]
+
+    def filter(
+        self,
+        file: Optional[str] = None,
+        code_prefix: Optional[str] = None,
+        severity: Optional[str] = None,
+        type: Optional[str] = None,
+        exclude_files: Optional[Iterable[str]] = None,
+        exclude_code_prefixes: Optional[Sequence[str]] = None
+    ) -> Sequence[int]:
+        """Row numbers matching every given criterion, in table order"""
+        index = self.index
+        # (posting list, id column, wanted ids) per criterion
+        criteria = []
+        if file is not None:
+            criteria.append((index.rows("file", file), self.file.ids, set(self._ids("file", file))))
+        if code_prefix is not None:
+            ids = index.code_prefix_ids(code_prefix)
+            criteria.append((index.code_prefix_rows(code_prefix), self.code.ids, set(ids)))
+        if severity is not None:
+            criteria.append((index.rows("severity", severity), self.severity.ids, set(self._ids("severity", severity))))
+        if type is not None:
+            criteria.append((index.rows("type", type), self.type.ids, set(self._ids("type", type))))
+
+        rows: Sequence[int]
+        if criteria:
+            # Walk the shortest posting list and probe the other columns' ids
+            criteria.sort(key=lambda criterion: len(criterion[0]))
+            rows = criteria[0][0]
+            for _, ids, wanted in criteria[1:]:
+                rows = [i for i in rows if ids[i] in wanted]
+        else:
+            rows = range(len(self))
+
+        excluded = set()
+        if exclude_files is not None:
+            excluded.update(self.file.lookup[f] for f in exclude_files if f in self.file.lookup)
+            if excluded:
+                ids = self.file.ids
+                rows = [i for i in rows if ids[i] not in excluded]
+        if exclude_code_prefixes:
+            codes = set()
+            for prefix in exclude_code_prefixes:
+                codes.update(index.code_prefix_ids(prefix))
+            if codes:
+                ids = self.code.ids
+                rows = [i for i in rows if ids[i] not in codes]
+        return rows if isinstance(rows, range) else list(rows)
+
+    def group_counts(self, field: str) -> Dict[str, int]:
+        return self.index.counts(field)
+
+    def drop_files(self, files: Iterable[str]) -> "IssueTable":
+        return self.take(self.filter(exclude_files=files))
+
+    def drop_code_prefixes(self, prefixes: Sequence[str]) -> "IssueTable":
+        rows = self.filter(exclude_code_prefixes=prefixes)
+        return self if len(rows) == len(self) else self.take(rows)
+
+
+class IssueIndex:
+    """Inverted indexes for one IssueTable.
+
+    ``postings[field][value_id]`` holds the ascending row numbers carrying that
+    value; ``by_file`` keeps each file's rows sorted by line so line-range
+    lookups are two bisects. Building is a single pass over the id arrays.
+    """
+    FIELDS = ("file", "code", "severity", "type")
+
+    def __init__(self, table: IssueTable):
+        self.table = table
+        self.postings: Dict[str, Dict[int, array]] = {}
+        for field in self.FIELDS:
+            postings: Dict[int, array] = {}
+            for row, value_id in enumerate(getattr(table, field).ids):
+                if value_id != ABSENT:
+                    rows = postings.get(value_id)
+                    if rows is None:
+                        rows = postings[value_id] = array("I")
+                    rows.append(row)
+            self.postings[field] = postings
+
+        # Distinct codes sorted, so a prefix maps to one contiguous slice
+        codes = table.code.values
+        self.sorted_codes = sorted((codes[i], i) for i in self.postings["code"])
+
+        self.by_file: Dict[int, Tuple[array, array]] = {}
+        lines = table.line
+        for file_id, rows in self.postings["file"].items():
+            ordered = sorted(rows, key=lines.__getitem__)
+            self.by_file[file_id] = (array("I", (lines[i] for i in ordered)), array("I", ordered))
+
+    def rows(self, field: str, value: str) -> Sequence[int]:
+        value_id = getattr(self.table, field).lookup.get(value)
+        return self.postings[field].get(value_id, ()) if value_id is not None else ()
+
+    def code_prefix_ids(self, prefix: str) -> List[int]:
+        lo = bisect_left(self.sorted_codes, (prefix,))
+        hi = bisect_left(self.sorted_codes, (prefix + "\U0010ffff",))
+        return [value_id for _, value_id in self.sorted_codes[lo:hi]]
+
+    def code_prefix_rows(self, prefix: str) -> Sequence[int]:
+        ids = self.code_prefix_ids(prefix)
+        if len(ids) == 1:
+            return self.postings["code"][ids[0]]
+        rows: List[int] = []
+        for value_id in ids:
+            rows.extend(self.postings["code"][value_id])
+        rows.sort()
+        return rows
+
+    def counts(self, field: str) -> Dict[str, int]:
+        column: DictColumn = getattr(self.table, field)
+        postings = self.postings.get(field)
+        if postings is None:
+            counts = Counter(column.ids)
+            return {column.values[value_id]: n for value_id, n in counts.items() if value_id != ABSENT}
+        return {column.values[value_id]: len(rows) for value_id, rows in postings.items()}
+
+    def top(self, field: str, n: int) -> List[Tuple[str, int]]:
+        return nlargest(n, self.counts(field).items(), key=lambda item: item[1])
+
+    def lines(self, file: str, start: Optional[int] = None, end: Optional[int] = None) -> List[int]:
+        """Rows in ``file`` whose line lies in [start, end], ordered by line"""
+        file_id = self.table.file.lookup.get(file)
+        if file_id is None:
+            return []
+        lines, rows = self.by_file[file_id]
+        # Lines are stored +1 (0 = absent)
+        lo = 0 if start is None else bisect_left(lines, start + 1)
+        hi = len(lines) if end is None else bisect_right(lines, end + 1)
+        return list(rows[lo:hi])
+
+
+def render_issues(issues: Any) -> List[Dict[str, Any]]:
+    """Materialize issue dicts from an IssueTable (lists pass through untouched)"""
+    if isinstance(issues, IssueTable):
+        return issues.to_dicts()
+    return list(issues or [])
+
+
+def render_analysis(analysis: Dict[str, Any], page_size: Optional[int] = None) -> Dict[str, Any]:
+    """Copy of a stored analysis with every IssueTable rendered to dicts.
+
+    With ``page_size`` each section only carries its first page plus a
+    cursor for ``GET /{session_id}/issues``.
+    """
+    from app.services.issue_query import first_page
+
+    rendered = dict(analysis)
+    result = analysis.get("result")
+    if isinstance(result, dict):
+        sections = {}
+        for key, section in result.items():
+            if not (isinstance(section, dict) and "issues" in section):
+                sections[key] = section
+            elif page_size:
+                sections[key] = first_page(section, key, page_size)
+            else:
+                sections[key] = {**section, "issues": render_issues(section.get("issues"))}
+        rendered["result"] = sections
+    return rendered
@@ -1,22 +1,81 @@
 # backend/app/routers/analysis.py
-from fastapi import APIRouter, HTTPException, UploadFile, File, Body, Depends
-import subprocess
+from fastapi import APIRouter, HTTPException, UploadFile, File, Body, Depends, Query, Request
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional, Set, Tuple
 from pathlib import Path
 import json
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 import logging
-import configparser
-import toml
+import re
 import shutil
 import tempfile
 import zipfile
 from enum import Enum
 import atexit
-from fastapi.responses import FileResponse
+import os
+import time
+import asyncio
+import threading
+from fastapi.responses import FileResponse, StreamingResponse
 from app.models.user_profile import UserInDB
 from app.routers.auth import get_current_user
+from app.services.linter_config import (
+    MaterializedConfig,
+    config_set_hash,
+    configs_for_project,
+    linter_preferences,
+    materialize_config,
+    quick_ruff_config
+)
+from app.services.fix_applier import Hunk, apply_hunks, atomic_write_text
+from app.services.file_serving import contained_path
+from app.models.issue_table import IssueTable, render_analysis
+from app.services.issue_query import (
+    DEFAULT_PAGE_SIZE,
+    FACET_FIELDS,
+    MAX_PAGE_SIZE,
+    SECTIONS,
+    CursorConflict,
+    CursorExpired,
+    facet_counts,
+    issues_in_lines,
+    paginate,
+    top_files
+)
+from app.services.profile_service import ProfileService
+from app.services.linter_runner import LinterRun, run_linter_in_pool, run_linter_process
+from app.services.pylint_pool import PoolUnavailable, get_pylint_pool
+from app.services.ast_checks import AstCheckResult, AstStageUnavailable, python_files, run_ast_checks
+from app.services.result_store import ResultStore, clone_analysis, copy_hashing, tool_versions
+from app.services.project_diff import diff_trees, direct_importers
+from app.services.blob_store import get_blob_store
+from app.services.deadline import Deadline, remaining
+from app.services.issue_dedup import dedupe_sections
+from app.services.baseline import (
+    BaselineStore,
+    SourceLines,
+    add_fingerprints,
+    baseline_entries,
+    classify,
+    split_by_fingerprints
+)
+from app.services.pipeline_log import LazyJoin, log_payload, log_summary, tail
+from app.services.tracing import current_span, span, traced
+from app.services.parse_linter import LinterType
+from app.services.zip_stream import fits_zip32, stream_project_zip
+from app.services.metrics import (
+    ANALYSIS_SECONDS,
+    EXTRACT_SECONDS,
+    LINTER_CPU_SECONDS,
+    LINTER_OUTPUT_BYTES,
+    LINTER_PARSE_SECONDS,
+    LINTER_RUNS,
+    LINTER_SECONDS,
+    LINTERS_IN_FLIGHT,
+    REGISTRY,
+    UPLOAD_SECONDS,
+    record_cache
+)
 
 
 # Configure logging
@@ -27,6 +86,23 @@ logger = logging.getLogger(__name__)
 ACTIVE_SESSIONS: Dict[str, str] = {}  # session_id -> temp_dir
 ACTIVE_ANALYSES: Dict[str, dict] = {}  # session_id -> analysis results
 ANALYSIS_TEMP_DIRS: Dict[str, Path] = {}  # Track analysis directories by session/user
+MODIFIED_FILES: Dict[str, Set[str]] = {}  # session_id -> files changed since upload
+PENDING_EXTRACTS: Dict[str, Tuple[Path, str]] = {}  # temp_dir -> (archive, hash) not yet extracted
+SESSION_STARTED: Dict[str, float] = {}  # session_id -> monotonic upload time
+BASELINE_EXISTING: Dict[str, Dict[str, Dict[str, Any]]] = {}  # session_id -> baseline issues hidden as existing
+FULL_SCANS: Dict[str, asyncio.Task] = {}  # session_id -> background full scan of a quick-tier session
+FULL_SCAN_DONE: Dict[str, asyncio.Event] = {}  # session_id -> set once the full scan finished or failed
+BASELINES = BaselineStore()
+RESULT_STORE = ResultStore()  # finished analyses of previously seen archives
+
+UPLOAD_ARCHIVE_NAME = "upload.zip"
+QUICK_SECURITY_PREFIX = "S"  # ruff's flake8-bandit rules fill security_scan until the full scan
+EVENT_KEEPALIVE = 15.0  # seconds between SSE comments while a full scan runs
+DISCONNECT_POLL = 0.5  # seconds between client-disconnect checks while linting
+LINTER_TIMEOUT = 300  # seconds per linter subprocess
+BUDGET_BATCH_FILES = 50  # files per pylint run when a time budget is set
+SESSION_TTL = float(os.getenv("PINK_CODED_SESSION_TTL", "14400"))  # seconds
+STORAGE_METRICS_TTL = float(os.getenv("PINK_CODED_STORAGE_METRICS_TTL", "30"))  # seconds between disk walks
 
 router = APIRouter(prefix="/api/v1/analysis", tags=["analysis"])
 
@@ -34,11 +110,86 @@ router = APIRouter(prefix="/api/v1/analysis", tags=["analysis"])
 router.ACTIVE_SESSIONS = ACTIVE_SESSIONS
 router.ACTIVE_ANALYSES = ACTIVE_ANALYSES
 router.ANALYSIS_TEMP_DIRS = ANALYSIS_TEMP_DIRS
+router.MODIFIED_FILES = MODIFIED_FILES
+router.PENDING_EXTRACTS = PENDING_EXTRACTS
+router.SESSION_STARTED = SESSION_STARTED
+router.BASELINE_EXISTING = BASELINE_EXISTING
+router.RESULT_STORE = RESULT_STORE
+
+_extract_lock = threading.Lock()
+
+def extract_project(zip_path: Path, root: Path, archive_hash: str, deferred: bool = False) -> None:
+    """Unpack an upload as hardlinks into the shared blob store"""
+    with span("extract") as extract_span, EXTRACT_SECONDS.time():
+        stats = get_blob_store().extract(zip_path, root, archive_hash)
+        extract_span.set(
+            members=stats.files,
+            new_blobs=stats.new_blobs,
+            written_bytes=stats.written_bytes,
+            from_manifest=stats.from_manifest,
+            deferred=deferred
+        )
+
+def materialize(temp_dir: str) -> Path:
+    """Project root for ``temp_dir``, extracting the upload first if that was deferred"""
+    root = Path(temp_dir)
+    if temp_dir in PENDING_EXTRACTS:
+        with _extract_lock:
+            pending = PENDING_EXTRACTS.pop(temp_dir, None)
+            if pending is not None:
+                extract_project(pending[0], root, pending[1], deferred=True)
+    return root
+
+router.materialize = materialize
+
+def _tree_bytes(path: str) -> int:
+    """Bytes of files private to the tree; hardlinked blobs are counted in the store"""
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += _tree_bytes(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_nlink == 1:
+                        total += st.st_size
+    except OSError:
+        pass
+    return total
+
+REGISTRY.gauge("pink_active_sessions", "Sessions holding an extracted project",
+               callback=lambda: len(ACTIVE_SESSIONS))
+# Disk totals walk every tree and blob, so they are measured in a thread and cached
+TEMP_DIR_BYTES = REGISTRY.gauge("pink_temp_dir_bytes", "Bytes of unshared files under session temp dirs")
+BLOB_STORE_BYTES = REGISTRY.gauge("pink_blob_store_bytes", "Bytes of shared content-addressed blobs")
+_storage_measured = float("-inf")
+_storage_lock = threading.Lock()
+
+def measure_storage(temp_dirs: List[str]) -> None:
+    """Walk session trees and the blob store; runs in a worker thread"""
+    global _storage_measured
+    TEMP_DIR_BYTES.set(sum(_tree_bytes(d) for d in temp_dirs))
+    BLOB_STORE_BYTES.set(get_blob_store().usage()[1])
+    _storage_measured = time.monotonic()
+
+async def refresh_storage_gauges(max_age: float = STORAGE_METRICS_TTL) -> None:
+    """Re-measure disk gauges off the loop when older than ``max_age``
+
+    One walk runs at a time; scrapes that arrive meanwhile serve the cached values.
+    """
+    if time.monotonic() - _storage_measured < max_age or not _storage_lock.acquire(blocking=False):
+        return
+    try:
+        await asyncio.to_thread(measure_storage, list(ACTIVE_SESSIONS.values()))
+    finally:
+        _storage_lock.release()
 
 class AnalysisRequest(BaseModel):
     project_path: str
     project_type: Optional[str] = None
     linter: Optional[str] = None
+    time_budget: Optional[float] = None  # seconds; sections cut off by it are marked partial
 
 class ProjectType(str, Enum):
     WEB = "web"
@@ -52,65 +203,7 @@ class Linter(str, Enum):
     BANDIT = "bandit"
     RADON = "radon"
 
-class LinterConfig:
-    @staticmethod
-    def get_ruff_config() -> Dict[str, Any]:
-        return {
-            "lint": {
-                "select": ["E", "F", "W", "B", "I", "UP", "D"],
-                "ignore": ["E501", "D203", "D212"],
-                "per-file-ignores": {
-                    "__init__.py": ["F401"],
-                    "tests/*": ["S101"]
-                }
-            }
-        }
-
-    @staticmethod
-    def get_pylint_config() -> Dict[str, Any]:
-        return {
-            "MASTER": {
-                "load-plugins": "pylint.extensions.mccabe"
-            },
-            "MESSAGES CONTROL": {
-                "disable": "missing-docstring,too-few-public-methods,invalid-name"
-            }
-        }
-
-    @staticmethod
-    def get_bandit_config() -> Dict[str, Any]:
-        return {
-            'target': ['*'],
-            'recursive': True,
-            'confidence': 'low',
-            'severity': 'low',
-            'tests': [],
-            'skips': []
-        }
-
-def setup_linter_config(linter: str) -> Path:
-    """Create temporary linter configuration file"""
-    config_dir = Path("/tmp/pink-coded-config")
-    config_dir.mkdir(exist_ok=True)
-    
-    if linter == Linter.RUFF:
-        config_path = config_dir / "ruff.toml"
-        with open(config_path, "w") as f:
-            toml.dump(LinterConfig.get_ruff_config(), f)
-    elif linter == Linter.PYLINT:
-        config_path = config_dir / ".pylintrc"
-        parser = configparser.ConfigParser()
-        parser.read_dict(LinterConfig.get_pylint_config())
-        parser.write(config_path.open("w"))
-    elif linter == Linter.BANDIT:
-        config_path = config_dir / ".bandit"
-        with open(config_path, "w") as f:
-            json.dump(LinterConfig.get_bandit_config(), f)
-    else:
-        config_path = config_dir / "config.ini"
-    
-    return config_path
-
+@traced("detect_project_type")
 def detect_project_type(project_path: Path) -> str:
     """Detect project type based on file patterns"""
     markers = {
@@ -131,140 +224,31 @@ def detect_project_type(project_path: Path) -> str:
         return ProjectType.UNKNOWN
     return max(scores.items(), key=lambda x: x[1])[0]
 
-def generate_flamingo_message(issue: dict) -> str:
-    """
-    Generate a user-friendly message for a linter issue.
-    """
-    return f"[{issue.get('type', '').capitalize()}] {issue.get('code', '')}: {issue.get('message', '')}"
-
-def parse_linter_output(output: str, linter: str, base_path: Path) -> List[Dict[str, Any]]:
-    """Parse linter output into standardized format"""
-    if not output.strip():
-        return []
-    
-    try:
-        if linter == Linter.RUFF:
-            issues = json.loads(output)
-            parsed = []
-            for issue in issues:
-                file_path = Path(issue["filename"])
-                rel_path = str(file_path.relative_to(base_path)) if file_path.is_absolute() else issue["filename"]
-                issue_type = "warning"  # Default to warning for Ruff
-                
-                # Map specific codes to error level
-                if issue["code"].startswith(("E", "F")):
-                    issue_type = "error"
-                
-                parsed.append({
-                    "type": issue_type,
-                    "file": rel_path,
-                    "line": issue["location"]["row"],
-                    "message": issue["message"],
-                    "code": issue["code"],
-                    "url": issue.get("url", ""),
-                    "flamingo_message": generate_flamingo_message({
-                        "code": issue["code"],
-                        "message": issue["message"],
-                        "type": issue_type
-                    })
-                })
-            return parsed
-
-        elif linter == Linter.PYLINT:
-            issues = json.loads(output)
-            parsed = []
-            for issue in issues:
-                file_path = Path(issue["path"])
-                rel_path = str(file_path.relative_to(base_path)) if file_path.is_absolute() else issue["path"]
-                parsed.append({
-                    "type": issue["type"].lower(),
-                    "file": rel_path,
-                    "line": issue["line"],
-                    "message": issue["message"],
-                    "code": issue["message-id"],
-                    "url": ""
-                })
-            return parsed
-
-        elif linter == Linter.BANDIT:
-            try:
-                data = json.loads(output)
-                if not isinstance(data, dict) or "results" not in data:
-                    logger.error(f"Invalid Bandit output structure: {output[:200]}...")
-                    return []
-                
-                parsed = []
-                for issue in data["results"]:
-                    file_path = Path(issue["filename"])
-                    rel_path = str(file_path.relative_to(base_path)) if file_path.is_absolute() else issue["filename"]
-                    
-                    parsed.append({
-                        "type": "security",
-                        "file": rel_path,
-                        "line": issue["line_number"],
-                        "message": issue["issue_text"],
-                        "code": issue["test_id"],
-                        "url": issue["more_info"],
-                        "severity": issue["issue_severity"].lower(),
-                        "confidence": issue["issue_confidence"].lower()
-                    })
-                return parsed
-            except Exception as e:
-                logger.error(f"Bandit parse error: {str(e)}")
-                return []
-
-    except Exception as e:
-        logger.error(f"Error parsing {linter} output: {e}")
-        return []
+@traced("run_single_linter")
+async def run_single_linter(
+    linter: str,
+    project_path: Path,
+    targets: Optional[List[Path]] = None,
+    config: Optional[MaterializedConfig] = None,
+    timeout: float = LINTER_TIMEOUT
+) -> Dict[str, Any]:
+    """Run an individual linter and return results
 
-def parse_radon_output(output: str, base_path: Path) -> List[Dict[str, Any]]:
-    """Parse Radon complexity analysis output"""
-    try:
-        try:
-            data = json.loads(output)
-            if isinstance(data, str):
-                data = json.loads(data)
-        except json.JSONDecodeError:
-            logger.error(f"Invalid Radon output: {output[:200]}...")
-            return []
-
-        issues = []
-        for file_path, items in data.items():
-            rel_path = str(Path(file_path).relative_to(base_path)) if Path(file_path).is_absolute() else file_path
-            
-            for item in items:
-                if not isinstance(item, dict):
-                    continue
-                    
-                complexity = item.get("complexity", 0)
-                if complexity <= 1:
-                    continue
-                
-                issues.append({
-                    "type": "complexity",
-                    "file": rel_path,
-                    "line": item.get("lineno", 0),
-                    "message": f"{item.get('type', 'item').title()} '{item.get('name', '')}' (complexity: {complexity})",
-                    "code": f"RADON-{item.get('rank', 'U')}",
-                    "complexity": complexity,
-                    "severity": "high" if complexity > 10 else "medium"
-                })
-                
-        return issues
-        
-    except Exception as e:
-        logger.error(f"Radon parse failed: {str(e)}")
-        return []
-
-async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
-    """Run an individual linter and return results"""
+    When ``targets`` is given only those files are linted; paths in the
+    results stay relative to ``project_path``. ``config`` defaults to the
+    shared default config for the linter; nothing is written per run.
+    A run killed after ``timeout`` keeps the issues parsed so far and is
+    marked partial.
+    """
     try:
-        logger.info(f"Running {linter} analysis in: {project_path}")
+        logger.debug("Running %s analysis in: %s", linter.value, project_path)
+        current_span().set(linter=linter.value, targets=len(targets) if targets else None)
+        target_args = [str(t) for t in targets] if targets else [str(project_path)]
         
         # Check for Python files (except for Radon which analyzes complexity)
         if linter != Linter.RADON:
-            py_files = list(project_path.rglob("*.py"))
-            logger.info(f"Python files found: {len(py_files)}")
+            py_files = [t for t in targets if t.suffix == ".py"] if targets else list(project_path.rglob("*.py"))
+            logger.debug("Python files found: %d", len(py_files))
             if not py_files:
                 return {
                     "success": True,
@@ -273,7 +257,9 @@ async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
                     "raw_stderr": ""
                 }
 
-        config_path = setup_linter_config(linter)
+        if config is None and linter != Linter.RADON:
+            config = materialize_config(linter)
+        config_path = config.path if config else None
         
         if linter == Linter.RUFF:
             cmd = [
@@ -282,7 +268,7 @@ async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
                 "--config", str(config_path),
                 "--output-format=json",
                 "--no-cache",
-                str(project_path)
+                *target_args
             ]
         elif linter == Linter.PYLINT:
             cmd = [
@@ -290,7 +276,7 @@ async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
                 f"--rcfile={config_path}",
                 "--output-format=json",
                 "--recursive=y",
-                str(project_path)
+                *target_args
             ]
         elif linter == Linter.BANDIT:
             cmd = [
@@ -298,70 +284,100 @@ async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
                 "-r",
                 "-f", "json",
                 "-c", str(config_path),
-                str(project_path)
+                *target_args
             ]
         elif linter == Linter.RADON:
             cmd = [
                 "radon",
                 "cc",
                 "-j",
-                str(project_path)
+                *target_args
             ]
         else:
             raise ValueError(f"Unsupported linter: {linter}")
 
-        logger.info(f"Executing: {' '.join(cmd)}")
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(project_path),
-            timeout=300
-        )
+        logger.debug("Executing: %s", LazyJoin(cmd))
+        LINTERS_IN_FLIGHT.inc()
+        # Set when this coroutine is cancelled; the worker thread then kills the linter
+        cancel = threading.Event()
+        # Pool wait and any subprocess fallback share one deadline
+        deadline = time.monotonic() + timeout
+        try:
+            run = None
+            pool = get_pylint_pool() if linter == Linter.PYLINT else None
+            if pool is not None:
+                try:
+                    run = await asyncio.to_thread(
+                        run_linter_in_pool, pool, cmd, LinterType.PYLINT, project_path, project_path,
+                        timeout, cancel, deadline
+                    )
+                except PoolUnavailable as e:
+                    logger.warning(f"pylint pool unavailable, using a subprocess: {e}")
+            remaining = deadline - time.monotonic()
+            if run is None and remaining <= 0:
+                run = LinterRun(returncode=None, duration=timeout, timed_out=True)
+            elif run is None:
+                run = await asyncio.to_thread(
+                    run_linter_process,
+                    cmd,
+                    LinterType(linter.value),
+                    project_path,
+                    project_path,
+                    remaining,
+                    cancel
+                )
+        except asyncio.CancelledError:
+            cancel.set()
+            LINTER_RUNS.inc(linter=linter.value, outcome="cancelled")
+            raise
+        finally:
+            LINTERS_IN_FLIGHT.dec()
+        LINTER_SECONDS.observe(run.duration, linter=linter.value)
+        LINTER_PARSE_SECONDS.observe(run.parse_seconds, linter=linter.value)
+        LINTER_OUTPUT_BYTES.inc(run.output_bytes, linter=linter.value)
+        current_span().set(issues=len(run.issues), output_bytes=run.output_bytes, timed_out=run.timed_out)
 
-        # Log output for debugging
-        logger.info(f"{linter} stdout (first 500 chars):\n{result.stdout[:500]}...")
-        if result.stderr:
-            logger.info(f"{linter} stderr:\n{result.stderr}")
+        if run.timed_out:
+            LINTER_RUNS.inc(linter=linter.value, outcome="timeout")
+            logger.error(f"{linter} analysis timed out after {timeout:.0f}s with {len(run.issues)} issues parsed")
+            return {
+                "success": False,
+                "partial": True,
+                "error": f"{linter} analysis timed out after {timeout:.0f}s; results are partial",
+                "issues": run.issues,
+                "raw_stderr": tail(run.stderr)
+            }
+
+        # Only the tail of stderr, and only when debugging
+        if run.stderr and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s stderr:\n%s", linter.value, tail(run.stderr))
 
         # Handle success codes
         success = True
         if linter == Linter.RUFF:
-            success = result.returncode in [0, 4]  # 0=no issues, 4=issues found
+            success = run.returncode in [0, 4]  # 0=no issues, 4=issues found
         elif linter == Linter.BANDIT:
-            success = result.returncode in [0, 1]  # 0=no issues, 1=issues found
+            success = run.returncode in [0, 1]  # 0=no issues, 1=issues found
         else:
-            success = result.returncode == 0
+            success = run.returncode == 0
+        LINTER_RUNS.inc(linter=linter.value, outcome="success" if success else "failure")
 
-        # Parse output
-        issues = []
-        if linter == Linter.RADON:
-            try:
-                radon_data = json.loads(result.stdout)
-                if isinstance(radon_data, str):  # Handle unexpected string output
-                    radon_data = json.loads(radon_data)
-                issues = parse_radon_output(json.dumps(radon_data), project_path)
-            except Exception as e:
-                logger.error(f"Radon parse failed: {e}")
-                issues = []
-        else:
-            issues = parse_linter_output(result.stdout, linter, project_path)
-        
-        logger.info(f"{linter} analysis completed. Found {len(issues)} issues.")
+        log_summary(
+            logger,
+            "linter.completed",
+            linter=linter.value,
+            returncode=run.returncode,
+            issues=len(run.issues),
+            output_bytes=run.output_bytes,
+            duration_ms=round(run.duration * 1000, 1)
+        )
         return {
             "success": success,
-            "output": result.stdout,
-            "issues": issues,
-            "raw_stderr": result.stderr
+            "output_bytes": run.output_bytes,
+            "issues": run.issues,
+            "raw_stderr": run.stderr
         }
 
-    except subprocess.TimeoutExpired:
-        logger.error(f"{linter} analysis timed out")
-        return {
-            "success": False,
-            "error": f"{linter} analysis timed out",
-            "raw_stderr": "Process exceeded 5 minute limit"
-        }
     except Exception as e:
         logger.error(f"{linter} failed: {e}")
         return {
@@ -370,56 +386,404 @@ async def run_single_linter(linter: str, project_path: Path) -> Dict[str, Any]:
             "raw_stderr": str(e)
         }
 
-async def run_linter_analysis(project_path: Path, experience_level: str) -> Dict[str, Any]:
-    """Run all appropriate linters for the project"""
-    # Always run security scanner first
-    bandit_result = await run_single_linter(Linter.BANDIT, project_path)
-    
-    # Determine project type
+def skipped_section(linter: str) -> Dict[str, Any]:
+    """Section for a linter the time budget left no room for"""
+    return {
+        "success": False,
+        "partial": True,
+        "error": f"{linter} analysis skipped; time budget exhausted",
+        "issues": [],
+        "raw_stderr": ""
+    }
+
+async def ast_checks(
+    project_path: Path,
+    targets: Optional[List[Path]] = None,
+    bandit_config: Optional[Path] = None,
+    deadline: Optional[Deadline] = None,
+    with_bandit: bool = True
+) -> AstCheckResult:
+    """``run_ast_checks`` in a worker thread; cancelling the caller stops its chunks"""
+    cancel = threading.Event()
+    try:
+        return await asyncio.to_thread(
+            run_ast_checks, project_path, targets, bandit_config, deadline, with_bandit, cancel
+        )
+    except asyncio.CancelledError:
+        cancel.set()
+        raise
+
+async def run_security_and_complexity(
+    project_path: Path,
+    targets: Optional[List[Path]] = None,
+    config: Optional[MaterializedConfig] = None,
+    deadline: Optional[Deadline] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Bandit and radon results from one shared parse per file
+
+    Falls back to the two CLIs when the in-process stage is unavailable.
+    """
+    if config is None:
+        config = materialize_config(Linter.BANDIT.value)
+    started = time.monotonic()
+    try:
+        checks = await ast_checks(project_path, targets, config.path, deadline)
+    except AstStageUnavailable as e:
+        logger.warning(f"Shared AST stage unavailable, running bandit and radon CLIs: {e}")
+        # Radon is the cheap one; bandit gets what is left
+        radon_result = await run_single_linter(
+            Linter.RADON, project_path, targets, timeout=remaining(deadline, LINTER_TIMEOUT)
+        )
+        if deadline is not None and deadline.expired:
+            return skipped_section(Linter.BANDIT.value), radon_result
+        bandit_result = await run_single_linter(
+            Linter.BANDIT, project_path, targets, config, timeout=remaining(deadline, LINTER_TIMEOUT)
+        )
+        return bandit_result, radon_result
+
+    elapsed = time.monotonic() - started
+    LINTER_SECONDS.observe(elapsed, linter="ast")
+    LINTER_CPU_SECONDS.inc(checks.cpu_seconds, linter="ast")
+    LINTER_RUNS.inc(linter="ast", outcome="success")
+    log_summary(
+        logger,
+        "linter.completed",
+        linter="ast",
+        files=checks.files,
+        skipped=len(checks.skipped),
+        issues=len(checks.security) + len(checks.complexity),
+        cpu_ms=round(checks.cpu_seconds * 1000, 1),
+        duration_ms=round(elapsed * 1000, 1),
+        unchecked=checks.unchecked
+    )
+    if checks.partial:
+        error = f"{checks.unchecked} of {checks.files} files not checked within the time budget; results are partial"
+        return (
+            {"success": False, "partial": True, "error": error, "issues": checks.security, "raw_stderr": ""},
+            {"success": False, "partial": True, "error": error, "issues": checks.complexity, "raw_stderr": ""}
+        )
+    return (
+        {"success": True, "issues": checks.security, "raw_stderr": ""},
+        {"success": True, "issues": checks.complexity, "raw_stderr": ""}
+    )
+
+async def run_linter_batches(
+    linter: Linter,
+    project_path: Path,
+    deadline: Deadline,
+    config: Optional[MaterializedConfig] = None
+) -> Dict[str, Any]:
+    """Run a slow linter over fixed-size file batches until ``deadline``
+
+    Each finished batch is kept, so a budget that runs out costs only the
+    unfinished files. Cross-module checks see one batch at a time.
+    """
+    files = python_files(project_path)
+    issues: List[Dict[str, Any]] = []
+    success = True
+    done = 0
+    for start in range(0, len(files), BUDGET_BATCH_FILES):
+        if deadline.expired:
+            break
+        batch = files[start:start + BUDGET_BATCH_FILES]
+        batch_result = await run_single_linter(linter, project_path, batch, config, timeout=deadline.remaining())
+        issues.extend(batch_result.get("issues", []))
+        if batch_result.get("partial"):
+            break
+        if "issues" not in batch_result:
+            return batch_result
+        success = success and batch_result["success"]
+        done += len(batch)
+    if done < len(files):
+        return {
+            "success": False,
+            "partial": True,
+            "error": f"{linter.value} checked {done} of {len(files)} files within the time budget; results are partial",
+            "issues": issues,
+            "raw_stderr": ""
+        }
+    return {"success": success, "issues": issues, "raw_stderr": ""}
+
+BEGINNER_HIDDEN_CODES = ("E", "F")
+
+def filter_for_experience(issues: IssueTable, experience_level: str) -> IssueTable:
+    if experience_level == "beginner":
+        # Filter out some complex issues for beginners (code-prefix index lookup)
+        return issues.drop_code_prefixes(BEGINNER_HIDDEN_CODES)
+    return issues
+
+@traced("run_linter_analysis")
+async def run_linter_analysis(
+    project_path: Path,
+    experience_level: str,
+    time_budget: Optional[float] = None,
+    preferences: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Run all appropriate linters for the project
+
+    With ``time_budget`` (seconds) cheap stages run first and slower ones
+    get what is left; sections cut short keep what they found and are
+    marked ``partial``. ``preferences`` are a user's stored linter
+    overrides (``{"ruff.ignore": "D100"}``); they select hashed config
+    variants, never per-run writes.
+    """
+    started = time.monotonic()
+    deadline = Deadline(time_budget) if time_budget else None
+    # Determine project type (selects the config variant for every linter)
     project_type = detect_project_type(project_path)
-    
-    # Run main linter based on type
+    preferences = linter_preferences(preferences)
+    configs = configs_for_project(project_type, preferences)
+    current_span().set(project_type=getattr(project_type, "value", project_type), time_budget=time_budget)
+
     if project_type == ProjectType.WEB:
-        main_result = await run_single_linter(Linter.RUFF, project_path)
+        # ruff is cheaper than the AST stage, so it goes first
+        main_result = await run_single_linter(
+            Linter.RUFF, project_path, config=configs[Linter.RUFF.value], timeout=remaining(deadline, LINTER_TIMEOUT)
+        )
+    # Security scan and complexity share one parse of every file
+    if deadline is not None and deadline.expired:
+        bandit_result, radon_result = skipped_section(Linter.BANDIT.value), skipped_section(Linter.RADON.value)
     else:
-        main_result = await run_single_linter(Linter.PYLINT, project_path)
+        bandit_result, radon_result = await run_security_and_complexity(
+            project_path, config=configs[Linter.BANDIT.value], deadline=deadline
+        )
+    if project_type != ProjectType.WEB:
+        if deadline is None:
+            main_result = await run_single_linter(Linter.PYLINT, project_path, config=configs[Linter.PYLINT.value])
+        else:
+            main_result = await run_linter_batches(Linter.PYLINT, project_path, deadline, configs[Linter.PYLINT.value])
     
-    if experience_level == "beginner":
-        # Filter out some complex issues for beginners
-        main_result["issues"] = [issue for issue in main_result.get("issues", []) 
-                               if not issue.get("code", "").startswith(("E", "F"))]
+    # Stable ids for baseline comparison; each file is read once for all sections
+    sources = SourceLines(project_path)
+    for linter_result in (bandit_result, main_result, radon_result):
+        add_fingerprints(linter_result.get("issues", []), sources)
+    # One issue per problem when e.g. pylint and bandit both flag an eval()
+    deduped = dedupe_sections({
+        "security_scan": bandit_result.get("issues", []),
+        "main_analysis": main_result.get("issues", []),
+        "complexity_analysis": radon_result.get("issues", [])
+    })
 
-    # Always run complexity analysis
-    radon_result = await run_single_linter(Linter.RADON, project_path)
+    main_issues = filter_for_experience(IssueTable.from_dicts(deduped["main_analysis"]), experience_level)
     
     result = {
         "project_type": project_type.value if isinstance(project_type, Enum) else project_type,
         "linter": "ruff" if project_type == ProjectType.WEB else "pylint",
         "complexity": "radon",
+        "config_hash": config_set_hash(configs),
         "security_scan": {
             "success": bandit_result["success"],
-            "issues": bandit_result.get("issues", []),
-            "error": bandit_result.get("error")
+            "issues": IssueTable.from_dicts(deduped["security_scan"]),
+            "error": bandit_result.get("error"),
+            "partial": bandit_result.get("partial", False),
+            "tier": "full"
         },
         "main_analysis": {
             "success": main_result["success"],
-            "issues": main_result.get("issues", []),
-            "error": main_result.get("error")
+            "issues": main_issues,
+            "error": main_result.get("error"),
+            "partial": main_result.get("partial", False),
+            "tier": "full"
         },
         "complexity_analysis": {
             "success": radon_result["success"],
-            "issues": radon_result.get("issues", []),
-            "error": radon_result.get("error")
+            "issues": IssueTable.from_dicts(deduped["complexity_analysis"]),
+            "error": radon_result.get("error"),
+            "partial": radon_result.get("partial", False),
+            "tier": "full"
         }
     }
 
-    logger.info(f"Final analysis result structure: {json.dumps(result, indent=2)}")
+    elapsed = time.monotonic() - started
+    ANALYSIS_SECONDS.observe(elapsed)
+    log_summary(
+        logger,
+        "analysis.completed",
+        project_type=result["project_type"],
+        config_hash=result["config_hash"],
+        duration_ms=round(elapsed * 1000, 1),
+        time_budget=time_budget,
+        partial=[name for name in SECTIONS if result[name]["partial"]],
+        **{f"{name}_issues": len(result[name]["issues"]) for name in SECTIONS}
+    )
+    log_payload(logger, "Analysis result sample", lambda: render_analysis({"result": result}, page_size=20))
+    return {
+        "project_type": project_type.value,
+        "experience_level": experience_level,
+        "linter_preferences": preferences,
+        "result": result
+    }
+
+@traced("run_quick_analysis")
+async def run_quick_analysis(
+    project_path: Path,
+    experience_level: str,
+    preferences: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """First-screen tier: one broad ruff run plus in-process complexity
+
+    Same layout as ``run_linter_analysis``. Ruff's flake8-bandit findings
+    stand in for bandit in ``security_scan`` until the full scan replaces
+    the sections; radon's output is already what the full scan reports.
+    """
+    started = time.monotonic()
+    project_type = detect_project_type(project_path)
+    preferences = linter_preferences(preferences)
+    config = quick_ruff_config(project_type, preferences)
+    current_span().set(project_type=getattr(project_type, "value", project_type))
+
+    ruff_result, checks = await asyncio.gather(
+        run_single_linter(Linter.RUFF, project_path, config=config),
+        ast_checks(project_path, with_bandit=False)
+    )
+    ruff_issues = ruff_result.get("issues", [])
+    sources = SourceLines(project_path)
+    sections = {
+        "security_scan": [i for i in ruff_issues if i["code"].startswith(QUICK_SECURITY_PREFIX)],
+        "main_analysis": [i for i in ruff_issues if not i["code"].startswith(QUICK_SECURITY_PREFIX)],
+        "complexity_analysis": checks.complexity
+    }
+    for issues in sections.values():
+        add_fingerprints(issues, sources)
+
+    ruff_section = {
+        "success": ruff_result["success"],
+        "error": ruff_result.get("error"),
+        "partial": ruff_result.get("partial", False),
+        "tier": "quick"
+    }
+    result = {
+        "project_type": project_type.value if isinstance(project_type, Enum) else project_type,
+        "linter": "ruff",
+        "complexity": "radon",
+        "config_hash": config_set_hash({Linter.RUFF.value: config}),
+        "security_scan": {**ruff_section, "issues": IssueTable.from_dicts(sections["security_scan"])},
+        "main_analysis": {
+            **ruff_section,
+            "issues": filter_for_experience(IssueTable.from_dicts(sections["main_analysis"]), experience_level)
+        },
+        "complexity_analysis": {
+            "success": True,
+            "issues": IssueTable.from_dicts(sections["complexity_analysis"]),
+            "error": None,
+            "partial": False,
+            "tier": "full"
+        }
+    }
+    log_summary(
+        logger,
+        "analysis.quick",
+        project_type=result["project_type"],
+        duration_ms=round((time.monotonic() - started) * 1000, 1),
+        **{f"{name}_issues": len(result[name]["issues"]) for name in SECTIONS}
+    )
     return {
         "project_type": project_type.value,
         "experience_level": experience_level,
+        "linter_preferences": preferences,
         "result": result
     }
 
+async def splice_issues(
+    session_id: str,
+    analysis: Dict[str, Any],
+    project_path: Path,
+    lint_paths: List[str],
+    drop_paths: Set[str]
+) -> Dict[str, Any]:
+    """Re-lint ``lint_paths``; their issues replace those of ``drop_paths`` in ``analysis``"""
+    result = analysis["result"]
+    sections: Dict[str, Dict[str, Any]] = {}
+    if lint_paths:
+        configs = configs_for_project(analysis.get("project_type"), analysis.get("linter_preferences"))
+        targets = [project_path / rel for rel in lint_paths]
+        main_linter = Linter(result["linter"])
+        security, complexity = await run_security_and_complexity(project_path, targets, configs.get(Linter.BANDIT.value))
+        sections = {
+            "security_scan": security,
+            "main_analysis": await run_single_linter(main_linter, project_path, targets, configs.get(main_linter.value)),
+            "complexity_analysis": complexity
+        }
+
+    sources = SourceLines(project_path)
+    deduped = dedupe_sections({
+        section: add_fingerprints(linter_result.get("issues", []), sources)
+        for section, linter_result in sections.items()
+    })
+    for section in SECTIONS:
+        linter_result = sections.get(section, {"success": True, "issues": []})
+        if not linter_result["success"] and "issues" not in linter_result:
+            continue
+        issues = IssueTable.from_dicts(deduped.get(section, []))
+        existing = BASELINE_EXISTING.get(session_id)
+        if existing:
+            # Baseline sessions keep hiding issues that predate the baseline
+            issues = issues.take(split_by_fingerprints(issues, set(existing))[0])
+        if section == "main_analysis":
+            issues = filter_for_experience(issues, analysis.get("experience_level"))
+        table = result[section]["issues"].drop_files(drop_paths)
+        table.extend(issues)
+        result[section]["issues"] = table
+
+    return analysis
+
+async def refresh_session_issues(session_id: str, project_path: Path, rel_paths: List[str]) -> Optional[Dict[str, Any]]:
+    """Re-lint only ``rel_paths`` and splice their issues into the stored session result"""
+    analysis = ACTIVE_ANALYSES.get(session_id)
+    if not analysis or not rel_paths:
+        return analysis
+    return await splice_issues(session_id, analysis, project_path, rel_paths, set(rel_paths))
+
+def forget_session(session_id: str) -> Optional[str]:
+    """Session bookkeeping half of ``drop_session``; returns the temp dir to remove
+
+    Touches the session dicts and cancels tasks, so it must run on the
+    event loop, never in a worker thread.
+    """
+    temp_dir = ACTIVE_SESSIONS.pop(session_id, None)
+    ACTIVE_ANALYSES.pop(session_id, None)
+    MODIFIED_FILES.pop(session_id, None)
+    SESSION_STARTED.pop(session_id, None)
+    BASELINE_EXISTING.pop(session_id, None)
+    FULL_SCAN_DONE.pop(session_id, None)
+    task = FULL_SCANS.pop(session_id, None)
+    if task is not None:
+        task.cancel()
+    if temp_dir:
+        PENDING_EXTRACTS.pop(temp_dir, None)
+    return temp_dir
+
+def discard_tree(temp_dir: str) -> None:
+    """Remove a session tree in a worker thread when called on the loop"""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        return
+    loop.run_in_executor(None, shutil.rmtree, temp_dir, True)
+
+def drop_session(session_id: str) -> None:
+    """Forget a session now and remove its tree off the loop; blob links go with it"""
+    temp_dir = forget_session(session_id)
+    if temp_dir:
+        discard_tree(temp_dir)
+
+def reclaim_trees(temp_dirs: List[str], ttl: float) -> Dict[str, int]:
+    """Filesystem half of session expiry; safe to run in a worker thread"""
+    for temp_dir in temp_dirs:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+    return get_blob_store().gc(manifest_ttl=ttl)
+
+async def expire_sessions(ttl: float = SESSION_TTL) -> Dict[str, int]:
+    """Drop sessions older than ``ttl`` and collect blobs no session links to"""
+    cutoff = time.monotonic() - ttl
+    expired = [sid for sid, started in list(SESSION_STARTED.items()) if started < cutoff]
+    temp_dirs = [temp_dir for temp_dir in map(forget_session, expired) if temp_dir]
+    collected = await asyncio.to_thread(reclaim_trees, temp_dirs, ttl)
+    if expired or collected["removed"]:
+        log_summary(logger, "sessions.expired", sessions=len(expired), **collected)
+    return {"sessions": len(expired), **collected}
+
 async def cleanup_temp_dirs():
     for session_id, temp_dir in ACTIVE_SESSIONS.items():
         try:
@@ -429,43 +793,470 @@ async def cleanup_temp_dirs():
     ACTIVE_SESSIONS.clear()
     ACTIVE_ANALYSES.clear()
     ANALYSIS_TEMP_DIRS.clear()
+    MODIFIED_FILES.clear()
+    PENDING_EXTRACTS.clear()
+    SESSION_STARTED.clear()
+    BASELINE_EXISTING.clear()
+    for task in FULL_SCANS.values():
+        task.cancel()
+    FULL_SCANS.clear()
+    FULL_SCAN_DONE.clear()
 
 atexit.register(cleanup_temp_dirs)
 
+def analysis_config_fingerprint(preferences: Optional[Dict[str, str]] = None) -> str:
+    """Hash over the config sets of every project type; the archive decides which one applies"""
+    return "-".join(config_set_hash(configs_for_project(pt.value, preferences)) for pt in ProjectType)
+
+def new_session() -> Tuple[str, str]:
+    session_id = str(uuid.uuid4())
+    temp_dir = tempfile.mkdtemp(prefix=f"pink-coded-{session_id}-")
+    ACTIVE_SESSIONS[session_id] = temp_dir
+    SESSION_STARTED[session_id] = time.monotonic()
+    current_span().set(session_id=session_id)
+    return session_id, temp_dir
+
+def receive_upload(zip_file: UploadFile, temp_dir: str) -> Tuple[Path, str]:
+    """Write the upload into the session dir; returns (archive path, sha256)"""
+    zip_path = Path(temp_dir) / UPLOAD_ARCHIVE_NAME
+    with span("upload") as upload_span, UPLOAD_SECONDS.time(), zip_path.open("wb") as buffer:
+        archive_hash, size = copy_hashing(zip_file.file, buffer)
+        upload_span.set(bytes=size, archive_hash=archive_hash)
+    return zip_path, archive_hash
+
+def apply_baseline(session_id: str, analysis: Dict[str, Any], project: str) -> Dict[str, Any]:
+    """Keep only issues new since ``project``'s baseline; existing ones are held aside"""
+    baseline = BASELINES.load(project)
+    if baseline is None:
+        analysis["baseline"] = {"project": project, "found": False}
+        return analysis
+    result = analysis["result"]
+    new_sections, existing, fixed = classify({name: result[name]["issues"] for name in SECTIONS}, baseline)
+    for name, table in new_sections.items():
+        result[name] = {**result[name], "issues": table}
+    BASELINE_EXISTING[session_id] = existing
+    analysis["baseline"] = {
+        "project": project,
+        "found": True,
+        "new": sum(len(table) for table in new_sections.values()),
+        "existing": len(existing),
+        "fixed": fixed
+    }
+    return analysis
+
+async def upgrade_to_full_scan(
+    session_id: str,
+    project_path: Path,
+    experience_level: str,
+    cache_key: Tuple[str, ...],
+    baseline: Optional[str],
+    time_budget: Optional[float],
+    preferences: Optional[Dict[str, str]] = None
+) -> None:
+    """Background full scan of a quick-tier session; replaces its stored result when done"""
+    done = FULL_SCAN_DONE[session_id]
+    try:
+        result = await run_linter_analysis(project_path, experience_level, time_budget, preferences)
+        if not any(result["result"][name].get("error") for name in SECTIONS):
+            RESULT_STORE.put(cache_key, result)
+        if session_id not in ACTIVE_SESSIONS:
+            return
+        # Fixes applied during the quick tier may have raced the full scan's reads
+        modified = sorted(MODIFIED_FILES.get(session_id, ()))
+        if modified:
+            result = await splice_issues(session_id, result, project_path, modified, set(modified))
+        if baseline:
+            result = apply_baseline(session_id, result, baseline)
+        result["full_scan"] = "done"
+        ACTIVE_ANALYSES[session_id] = result
+        log_summary(logger, "analysis.upgraded", session_id=session_id,
+                    **{f"{name}_issues": len(result["result"][name]["issues"]) for name in SECTIONS})
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.error(f"Full scan for session {session_id} failed: {e}")
+        if session_id in ACTIVE_ANALYSES:
+            ACTIVE_ANALYSES[session_id]["full_scan"] = "failed"
+            ACTIVE_ANALYSES[session_id]["full_scan_error"] = str(e)
+    finally:
+        FULL_SCANS.pop(session_id, None)
+        done.set()
+
+USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9@+_-][A-Za-z0-9@+._-]{0,253}$")  # profile file stems
+
+def user_linter_preferences(user_id: Optional[str]) -> Dict[str, str]:
+    """Linter overrides from a stored profile; 400 on a malformed id, 404 on an unknown user"""
+    if user_id is None:
+        return {}
+    if not USER_ID_PATTERN.match(user_id):
+        raise HTTPException(400, detail="Invalid user id")
+    profile = ProfileService().get_profile(user_id)
+    if profile is None:
+        raise HTTPException(404, detail="User profile not found")
+    return linter_preferences(profile.preferences)
+
+class ClientDisconnected(Exception):
+    """The client went away before its analysis finished"""
+
+async def cancel_on_disconnect(request: Request, awaitable) -> Any:
+    """Await ``awaitable``; cancel it, and the linters under it, if the client disconnects first"""
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.wait({task})
+
+def abandon_session(session_id: str, action: str) -> HTTPException:
+    """Reclaim a session whose client left mid-analysis"""
+    log_summary(logger, "analysis.abandoned", session_id=session_id, action=action)
+    drop_session(session_id)
+    return HTTPException(499, detail="Client closed request")
+
 @router.post("/analyze-zip")
+@traced("analyze_zip")
 async def analyze_zip(
-    zip_file: UploadFile = File(...)
+    request: Request,
+    zip_file: UploadFile = File(...),
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    baseline: Optional[str] = Query(None, description="Report only issues new since this project's baseline"),
+    time_budget: Optional[float] = Query(
+        None, gt=0, le=LINTER_TIMEOUT, description="Seconds to spend linting; sections cut off are marked partial"
+    ),
+    tier: Literal["quick", "full"] = Query("full", description="quick: answer from ruff now, full scan in background"),
+    user_id: Optional[str] = Query(None, description="Lint with this user's stored linter preferences")
     # Removed: current_user: UserInDB = Depends(get_current_user)
 ):
     """Analyze a ZIP file containing a Python project"""
-    session_id = str(uuid.uuid4())
-    temp_dir = tempfile.mkdtemp(prefix=f"pink-coded-{session_id}-")
-    ACTIVE_SESSIONS[session_id] = temp_dir
+    if baseline is not None:
+        try:
+            BASELINES.path(baseline)
+        except ValueError as e:
+            raise HTTPException(400, detail=str(e))
+    preferences = user_linter_preferences(user_id)
+    session_id, temp_dir = new_session()
     
     try:
         # Use a default experience level since we removed user auth
         experience_level = "intermediate"  
         
-        zip_path = Path(temp_dir) / "upload.zip"
-        with zip_path.open("wb") as buffer:
-            shutil.copyfileobj(zip_file.file, buffer)
-        
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(temp_dir)
+        # Hash while receiving; identical archives are answered from RESULT_STORE
+        zip_path, archive_hash = receive_upload(zip_file, temp_dir)
+
+        cache_key = (archive_hash, experience_level, analysis_config_fingerprint(preferences), tool_versions())
+        cached = RESULT_STORE.get(cache_key)
+        record_cache("analysis", cached is not None)
+        current_span().set(cache_hit=cached is not None)
+        if cached is not None:
+            # Same bytes, same configs, same tools: skip extract and lint,
+            # extract only once something needs the files
+            PENDING_EXTRACTS[temp_dir] = (zip_path, archive_hash)
+            if baseline:
+                cached = apply_baseline(session_id, cached, baseline)
+            ACTIVE_ANALYSES[session_id] = cached
+            log_summary(logger, "analysis.cached", session_id=session_id, archive_hash=archive_hash)
+            return {
+                **render_analysis(cached, page_size),
+                "session_id": session_id,
+                "temp_dir": temp_dir,
+                "cached": True
+            }
         
-        result = await run_linter_analysis(Path(temp_dir), experience_level)
+        extract_project(zip_path, Path(temp_dir), archive_hash)
+
+        if tier == "quick":
+            result = await cancel_on_disconnect(
+                request, run_quick_analysis(Path(temp_dir), experience_level, preferences)
+            )
+            if baseline:
+                result = apply_baseline(session_id, result, baseline)
+            result["full_scan"] = "pending"
+            ACTIVE_ANALYSES[session_id] = result
+            FULL_SCAN_DONE[session_id] = asyncio.Event()
+            FULL_SCANS[session_id] = asyncio.create_task(upgrade_to_full_scan(
+                session_id, Path(temp_dir), experience_level, cache_key, baseline, time_budget, preferences
+            ))
+            return {
+                **render_analysis(result, page_size),
+                "session_id": session_id,
+                "temp_dir": temp_dir,
+                "cached": False
+            }
+
+        result = await cancel_on_disconnect(
+            request, run_linter_analysis(Path(temp_dir), experience_level, time_budget, preferences)
+        )
+        # Timeouts, crashes and partial runs carry an error; those runs are not reused
+        if not any(result["result"][name].get("error") for name in SECTIONS):
+            RESULT_STORE.put(cache_key, result)
+        if baseline:
+            result = apply_baseline(session_id, result, baseline)
         ACTIVE_ANALYSES[session_id] = result
         
         return {
-            **result,
+            **render_analysis(result, page_size),
             "session_id": session_id,
-            "temp_dir": temp_dir
+            "temp_dir": temp_dir,
+            "cached": False
         }
-        
+
+    except ClientDisconnected:
+        raise abandon_session(session_id, "analyze_zip")
+    except asyncio.CancelledError:
+        drop_session(session_id)
+        raise
     except Exception as e:
         logger.error(f"ZIP analysis failed: {e}")
         raise HTTPException(500, detail=str(e))
         
+@router.post("/analyze-diff")
+@traced("analyze_diff")
+async def analyze_diff(
+    request: Request,
+    zip_file: UploadFile = File(...),
+    previous_session_id: str = Query(..., description="Session holding the previous upload of this project"),
+    page_size: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Analyze a new upload by re-linting only what changed since a previous session
+
+    Changed files and the files that import them directly are linted; every
+    other file keeps its issues from the previous session. A quick-tier
+    previous session is waited on until its full scan lands; if that scan
+    failed the new upload gets a full analysis instead of a splice.
+    """
+    previous = ACTIVE_ANALYSES.get(previous_session_id)
+    if previous is None or previous_session_id not in ACTIVE_SESSIONS:
+        raise HTTPException(404, detail="Previous analysis not found")
+    scan_done = FULL_SCAN_DONE.get(previous_session_id)
+    if previous.get("full_scan") == "pending" and scan_done is not None:
+        try:
+            await cancel_on_disconnect(request, scan_done.wait())
+        except ClientDisconnected:
+            raise HTTPException(499, detail="Client closed request")
+        previous = ACTIVE_ANALYSES.get(previous_session_id)
+        if previous is None or previous_session_id not in ACTIVE_SESSIONS:
+            raise HTTPException(404, detail="Previous analysis not found")
+    quick_previous = any(previous["result"][name].get("tier") == "quick" for name in SECTIONS)
+    previous_dir = materialize(ACTIVE_SESSIONS[previous_session_id])
+    session_id, temp_dir = new_session()
+    project_path = Path(temp_dir)
+
+    try:
+        zip_path, archive_hash = receive_upload(zip_file, temp_dir)
+        extract_project(zip_path, project_path, archive_hash)
+
+        if quick_previous or detect_project_type(project_path) != previous["project_type"]:
+            # Another project type means other linters and configs, and quick-tier
+            # sections must not be mixed with full ones: nothing to reuse
+            result = await cancel_on_disconnect(request, run_linter_analysis(
+                project_path, previous["experience_level"], preferences=previous.get("linter_preferences")
+            ))
+            diff = diff_trees(previous_dir, project_path, skip=[UPLOAD_ARCHIVE_NAME])
+            changed: List[str] = []
+            importers: List[str] = []
+            full = True
+        else:
+            with span("diff") as diff_span:
+                diff = await asyncio.to_thread(diff_trees, previous_dir, project_path, [UPLOAD_ARCHIVE_NAME])
+                changed = [rel for rel in diff.changed if rel.endswith(".py")]
+                touched = set(diff.changed) | set(diff.removed)
+                candidates = [
+                    rel for rel in (path.relative_to(project_path).as_posix() for path in python_files(project_path))
+                    if rel not in touched
+                ]
+                # pylint's cross-module checks see the changed modules through their importers
+                importers = await asyncio.to_thread(
+                    direct_importers, project_path, [*changed, *diff.removed], candidates
+                )
+                diff_span.set(added=len(diff.added), modified=len(diff.modified), removed=len(diff.removed),
+                              unchanged=diff.unchanged, importers=len(importers))
+            if previous_session_id in BASELINE_EXISTING:
+                BASELINE_EXISTING[session_id] = BASELINE_EXISTING[previous_session_id]
+            result = await cancel_on_disconnect(request, splice_issues(
+                session_id, clone_analysis(previous), project_path, changed + importers, touched | set(importers)
+            ))
+            full = False
+
+        ACTIVE_ANALYSES[session_id] = result
+        before = {name: previous["result"][name]["issues"].index.counts("file") for name in SECTIONS}
+        after = {name: result["result"][name]["issues"].index.counts("file") for name in SECTIONS}
+        statuses = {
+            **{rel: "added" for rel in diff.added},
+            **{rel: "modified" for rel in diff.modified},
+            **{rel: "removed" for rel in diff.removed},
+            **{rel: "importer" for rel in importers}
+        }
+        files = [{
+            "file": rel,
+            "status": status,
+            "issues_before": sum(before[name].get(rel, 0) for name in SECTIONS),
+            "issues_after": sum(after[name].get(rel, 0) for name in SECTIONS)
+        } for rel, status in sorted(statuses.items())]
+        log_summary(logger, "analysis.diff", session_id=session_id, previous_session_id=previous_session_id,
+                    full_analysis=full, relinted=len(changed) + len(importers), unchanged=diff.unchanged)
+
+        return {
+            **render_analysis(result, page_size),
+            "session_id": session_id,
+            "temp_dir": temp_dir,
+            "previous_session_id": previous_session_id,
+            "changes": {
+                "full_analysis": full,
+                "added": len(diff.added),
+                "modified": len(diff.modified),
+                "removed": len(diff.removed),
+                "unchanged": diff.unchanged,
+                "importers": len(importers),
+                "files": files
+            }
+        }
+
+    except ClientDisconnected:
+        raise abandon_session(session_id, "analyze_diff")
+    except asyncio.CancelledError:
+        drop_session(session_id)
+        raise
+    except Exception as e:
+        logger.error(f"Diff analysis failed: {e}")
+        raise HTTPException(500, detail=str(e))
+
+SECTION_PATTERN = "^(security_scan|main_analysis|complexity_analysis)$"
+
+def get_session_result(session_id: str) -> Dict[str, Any]:
+    analysis = ACTIVE_ANALYSES.get(session_id)
+    if analysis is None:
+        raise HTTPException(404, detail="Analysis not found")
+    return analysis["result"]
+
+@router.post("/{session_id}/baseline")
+async def save_baseline(session_id: str, project: str = Query(...)):
+    """Store the session's issues (including ones hidden as existing) as ``project``'s baseline"""
+    result = get_session_result(session_id)
+    entries = dict(BASELINE_EXISTING.get(session_id, {}))
+    entries.update(baseline_entries({name: result[name]["issues"] for name in SECTIONS}))
+    try:
+        await asyncio.to_thread(BASELINES.save, project, entries)
+    except ValueError as e:
+        raise HTTPException(400, detail=str(e))
+    return {"project": project, "issues": len(entries)}
+
+def scan_status(session_id: str, analysis: Dict[str, Any]) -> Dict[str, Any]:
+    result = analysis["result"]
+    return {
+        "session_id": session_id,
+        "full_scan": analysis.get("full_scan", "done"),
+        "tiers": {name: result[name].get("tier", "full") for name in SECTIONS},
+        "issues": {name: len(result[name]["issues"]) for name in SECTIONS}
+    }
+
+def sse_event(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@router.get("/{session_id}/events")
+async def analysis_events(session_id: str):
+    """Server-sent events: the session's current tier, then ``full_scan`` once a background scan lands"""
+    analysis = ACTIVE_ANALYSES.get(session_id)
+    if analysis is None:
+        raise HTTPException(404, detail="Analysis not found")
+
+    async def stream():
+        yield sse_event("status", scan_status(session_id, analysis))
+        done = FULL_SCAN_DONE.get(session_id)
+        if done is None or analysis.get("full_scan") != "pending":
+            return
+        while not done.is_set():
+            try:
+                await asyncio.wait_for(done.wait(), EVENT_KEEPALIVE)
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+        current = ACTIVE_ANALYSES.get(session_id)
+        if current is not None:
+            yield sse_event("full_scan", scan_status(session_id, current))
+
+    return StreamingResponse(stream(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@router.get("/{session_id}/issues")
+async def list_issues(
+    session_id: str,
+    section: Optional[str] = Query(None, pattern=SECTION_PATTERN),
+    file: Optional[str] = None,
+    code_prefix: Optional[str] = None,
+    severity: Optional[str] = None,
+    type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE)
+):
+    """Cursor-paginated, server-side filtered view over a stored analysis"""
+    result = get_session_result(session_id)
+    try:
+        return paginate(
+            result,
+            section=section,
+            cursor=cursor,
+            limit=limit,
+            file=file,
+            code_prefix=code_prefix,
+            severity=severity,
+            type=type
+        )
+    except CursorConflict as e:
+        raise HTTPException(409, detail=str(e))
+    except CursorExpired as e:
+        raise HTTPException(410, detail=str(e))
+    except ValueError:
+        raise HTTPException(400, detail="Invalid cursor")
+
+@router.get("/{session_id}/facets")
+async def issue_facets(
+    session_id: str,
+    section: Optional[str] = Query(None, pattern=SECTION_PATTERN),
+    fields: List[str] = Query(list(FACET_FIELDS)),
+    file: Optional[str] = None,
+    code_prefix: Optional[str] = None,
+    severity: Optional[str] = None,
+    type: Optional[str] = None
+):
+    """Counts by file/code/severity/type, answered from the session's issue index"""
+    unknown = set(fields) - set(FACET_FIELDS)
+    if unknown:
+        raise HTTPException(400, detail=f"Unknown facet fields: {sorted(unknown)}")
+    result = get_session_result(session_id)
+    return facet_counts(
+        result,
+        fields=fields,
+        section=section,
+        file=file,
+        code_prefix=code_prefix,
+        severity=severity,
+        type=type
+    )
+
+@router.get("/{session_id}/top-files")
+async def issue_top_files(
+    session_id: str,
+    section: Optional[str] = Query(None, pattern=SECTION_PATTERN),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE)
+):
+    return {"files": top_files(get_session_result(session_id), limit, section)}
+
+@router.get("/{session_id}/lines")
+async def issues_by_line(
+    session_id: str,
+    file: str,
+    start: Optional[int] = Query(None, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    section: Optional[str] = Query(None, pattern=SECTION_PATTERN)
+):
+    """Issues for one file inside a line range (e.g. the editor's visible window)"""
+    issues = issues_in_lines(get_session_result(session_id), file, start, end, section)
+    return {"file": file, "issues": issues, "count": len(issues)}
+
 @router.post("/generate-fix")
 async def generate_fix(
     code: str = Body(...),
@@ -522,13 +1313,15 @@ async def analyze_code(
 
         # Save to the original location
         if temp_dir:
-            file_location = Path(temp_dir) / file_path
+            file_location = materialize(temp_dir) / file_path
         elif session_id in ACTIVE_SESSIONS:
-            file_location = Path(ACTIVE_SESSIONS[session_id]) / file_path
+            file_location = materialize(ACTIVE_SESSIONS[session_id]) / file_path
         else:
             file_location = Path(tempfile.mkdtemp()) / "temp_analysis.py"
         
-        file_location.write_text(code)
+        # Replace, never write in place: the file may be a blob shared with other sessions
+        atomic_write_text(file_location, code)
+        MODIFIED_FILES.setdefault(session_id, set()).add(Path(file_path).as_posix())
         
         # Get the full analysis results from session
         if session_id in ACTIVE_ANALYSES:
@@ -548,7 +1341,7 @@ async def analyze_code(
                 # Add new issues
                 result["main_analysis"]["issues"].extend(file_issues)
             
-            return result
+            return render_analysis(result)
         
         # If no session, just return current file analysis
         file_result = await run_single_linter(Linter.RUFF, file_location.parent)
@@ -581,9 +1374,9 @@ async def apply_fix(
         # Locate the file
         file_location = None
         if temp_dir:
-            file_location = Path(temp_dir) / file_path
+            file_location = materialize(temp_dir) / file_path
         elif session_id in ACTIVE_SESSIONS:
-            file_location = Path(ACTIVE_SESSIONS[session_id]) / file_path
+            file_location = materialize(ACTIVE_SESSIONS[session_id]) / file_path
         
         if not file_location or not file_location.exists():
             raise HTTPException(404, detail="File not found")
@@ -599,7 +1392,8 @@ async def apply_fix(
                 lines[line_num] = fix
         
         new_content = '\n'.join(lines)
-        file_location.write_text(new_content)
+        atomic_write_text(file_location, new_content)
+        MODIFIED_FILES.setdefault(session_id, set()).add(Path(file_path).as_posix())
         
         return {
             "success": True,
@@ -611,6 +1405,85 @@ async def apply_fix(
         logger.error(f"Fix failed: {e}")
         raise HTTPException(500, detail=str(e))
     
+class FixItem(BaseModel):
+    file_path: str
+    issue: Dict[str, Any]
+    fix: str
+    end_line: Optional[int] = Field(None, ge=1)
+
+class BatchFixRequest(BaseModel):
+    session_id: str
+    temp_dir: Optional[str] = None
+    fixes: List[FixItem]
+    reanalyze: bool = True
+
+@router.post("/apply-fixes")
+async def apply_fixes(request: BatchFixRequest):
+    """Apply many fixes with one read and one atomic write per file"""
+    if request.temp_dir:
+        working_dir = materialize(request.temp_dir)
+    elif request.session_id in ACTIVE_SESSIONS:
+        working_dir = materialize(ACTIVE_SESSIONS[request.session_id])
+    else:
+        raise HTTPException(404, detail="Project not found")
+
+    # Validated up front: bad input is a 400, not a 500 from inside apply_hunks
+    root = working_dir.resolve()
+    hunks_by_file: Dict[str, List[Hunk]] = {}
+    for position, item in enumerate(request.fixes):
+        line = item.issue.get("line")
+        if line is None:
+            continue
+        if not isinstance(line, int) or isinstance(line, bool) or line < 1:
+            raise HTTPException(400, detail=f"fixes[{position}]: issue line must be a positive integer")
+        end_line = item.end_line or line
+        if end_line < line:
+            raise HTTPException(400, detail=f"fixes[{position}]: end_line is before the issue line")
+        file_location = contained_path(root, item.file_path)
+        if file_location is None:
+            raise HTTPException(400, detail=f"fixes[{position}]: file_path is outside the project")
+        hunks_by_file.setdefault(file_location.relative_to(root).as_posix(), []).append(
+            Hunk(start=line, end=end_line, replacement=item.fix, issue=item.issue)
+        )
+
+    def apply_file(rel_path: str, hunks: List[Hunk]) -> Dict[str, Any]:
+        file_location = root / rel_path
+        if not file_location.is_file():
+            return {"file_path": rel_path, "applied": 0, "skipped": len(hunks), "error": "File not found"}
+        content = file_location.read_text()
+        new_content, applied, skipped = apply_hunks(content, hunks)
+        if applied:
+            atomic_write_text(file_location, new_content)
+        return {
+            "file_path": rel_path,
+            "applied": len(applied),
+            "skipped": len(skipped),
+            "skipped_issues": [hunk.issue for hunk in skipped]
+        }
+
+    try:
+        files = await asyncio.gather(*(
+            asyncio.to_thread(apply_file, rel_path, hunks)
+            for rel_path, hunks in hunks_by_file.items()
+        ))
+        touched = [f["file_path"] for f in files if f["applied"]]
+        MODIFIED_FILES.setdefault(request.session_id, set()).update(touched)
+
+        analysis = None
+        if request.reanalyze and touched:
+            analysis = await refresh_session_issues(request.session_id, working_dir, touched)
+
+        return {
+            "success": True,
+            "files": files,
+            "applied": sum(f["applied"] for f in files),
+            "skipped": sum(f["skipped"] for f in files),
+            "analysis": render_analysis(analysis) if analysis else None
+        }
+    except Exception as e:
+        logger.error(f"Batch fix failed: {e}")
+        raise HTTPException(500, detail=str(e))
+
 @router.post("/export-project")
 async def export_project(
     session_id: str = Body(...),
@@ -620,26 +1493,34 @@ async def export_project(
     try:
         working_dir = None
         if temp_dir:
-            working_dir = Path(temp_dir)
+            working_dir = materialize(temp_dir)
         elif session_id in ACTIVE_SESSIONS:
-            working_dir = Path(ACTIVE_SESSIONS[session_id])
+            working_dir = materialize(ACTIVE_SESSIONS[session_id])
         
         if not working_dir or not working_dir.exists():
             raise HTTPException(404, detail="Project not found")
         
-        # Create a new ZIP
         zip_filename = f"pink-coded-export-{session_id[:8]}.zip"
-        zip_path = working_dir.parent / zip_filename
-        
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for file in working_dir.rglob('*'):
-                if file.is_file():
-                    zipf.write(file, file.relative_to(working_dir))
-        
-        return FileResponse(
-            path=zip_path,
-            filename=zip_filename,
-            media_type='application/zip'
+        upload_path = working_dir / UPLOAD_ARCHIVE_NAME
+        modified = MODIFIED_FILES.get(session_id, set())
+
+        if not fits_zip32(working_dir, upload_path):
+            # ZIP64-sized projects fall back to a fully rebuilt archive on disk
+            zip_path = working_dir.parent / zip_filename
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                for file in working_dir.rglob('*'):
+                    if file.is_file() and file != upload_path:
+                        zipf.write(file, file.relative_to(working_dir))
+            return FileResponse(
+                path=zip_path,
+                filename=zip_filename,
+                media_type='application/zip'
+            )
+
+        return StreamingResponse(
+            stream_project_zip(working_dir, upload_path, modified),
+            media_type='application/zip',
+            headers={"Content-Disposition": f'attachment; filename="{zip_filename}"'}
         )
     except Exception as e:
         logger.error(f"Export failed: {e}")
@@ -649,8 +1530,7 @@ async def export_project(
 async def debug_config():
     """Debug endpoint to check active linter configs"""
     configs = {}
-    for linter in [Linter.RUFF, Linter.PYLINT, Linter.BANDIT]:
-        config_path = setup_linter_config(linter)
-        if config_path.exists():
-            configs[linter] = config_path.read_text()
+    for linter, config in configs_for_project().items():
+        if config.path.exists():
+            configs[linter] = config.path.read_text()
     return configs
\ No newline at end of file
@@ -1,15 +1,32 @@
 # filepath: c:\Users\Admin\Pink Coded\Pink-Coded-Code-Review\backend\app\routers\files.py
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from pathlib import Path
 import logging
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
 from app.routers.analysis import router as analysis_router
+from app.services.file_serving import (
+    FileRangeResponse,
+    contained_path,
+    get_line_index,
+    is_not_modified,
+    merge_line_windows,
+    not_modified_response,
+    parse_line_window,
+    parse_range_header,
+    read_line_window,
+    stat_regular_file,
+    validator_headers
+)
 
 
 ACTIVE_SESSIONS = analysis_router.ACTIVE_SESSIONS
-ACTIVE_ANALYSES = analysis_router.ACTIVE_ANALYSES 
+ACTIVE_ANALYSES = analysis_router.ACTIVE_ANALYSES
 ANALYSIS_TEMP_DIRS = analysis_router.ANALYSIS_TEMP_DIRS
+materialize = analysis_router.materialize
 
 router = APIRouter(prefix="/api/v1/files", tags=["files"])
 
@@ -17,33 +34,220 @@ router = APIRouter(prefix="/api/v1/files", tags=["files"])
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+BATCH_READ_CONCURRENCY = 16
+
 class DirectoryResponse(BaseModel):
     status: str
     message: str = "Use browser's file picker instead"
 
+class FileWindow(BaseModel):
+    path: str
+    start_line: Optional[int] = Field(None, ge=1)
+    end_line: Optional[int] = Field(None, ge=1)
+
+    @model_validator(mode="after")
+    def check_order(self) -> "FileWindow":
+        """Same rule as ``parse_line_window``: a window never runs backwards"""
+        if self.start_line is not None and self.end_line is not None and self.end_line < self.start_line:
+            raise ValueError("end_line must not be before start_line")
+        return self
+
+class BatchFileRequest(BaseModel):
+    session_id: Optional[str] = None
+    temp_dir: Optional[str] = None
+    files: List[FileWindow] = []
+    issues: List[Dict[str, Any]] = []
+    context_lines: int = Field(5, ge=0)
+
+def session_bases(session_id: Optional[str], temp_dir: Optional[str]) -> List[Path]:
+    """Candidate project roots: explicit temp_dir first, then the session's"""
+    bases = []
+    if temp_dir:
+        bases.append(materialize(temp_dir))
+    if session_id in ACTIVE_SESSIONS:
+        bases.append(materialize(ACTIVE_SESSIONS[session_id]))
+    return bases
+
+def find_in_bases(bases: List[Path], path: str) -> Optional[Path]:
+    for base in bases:
+        candidate = contained_path(base, path)
+        if candidate is not None and candidate.exists():
+            return candidate
+    return None
+
+def resolve_session_file(path: str, session_id: Optional[str], temp_dir: Optional[str]) -> Path:
+    """Locate a project file by explicit temp_dir first, then by session"""
+    file_path = find_in_bases(session_bases(session_id, temp_dir), path)
+    if file_path is None:
+        raise HTTPException(404, detail=f"File not found at: {path}")
+    return file_path
+
 @router.get("")
 async def get_file_contents(
     path: str,
+    request: Request,
     session_id: Optional[str] = Query(...),
     temp_dir: str = Query(None)
 ):
     try:
-        # Try exact path first
-        if temp_dir:
-            exact_path = Path(temp_dir) / path
-            if exact_path.exists():
-                return {"content": exact_path.read_text()}
-        
-        # Fallback to session-based lookup
-        if session_id in ACTIVE_SESSIONS:
-            session_path = Path(ACTIVE_SESSIONS[session_id]) / path
-            if session_path.exists():
-                return {"content": session_path.read_text()}
-        
-        raise HTTPException(404, detail=f"File not found at: {path}")
-        
+        file_path = resolve_session_file(path, session_id, temp_dir)
+        stat_result = stat_regular_file(file_path)
+        if stat_result is None:
+            raise HTTPException(404, detail=f"File not found at: {path}")
+
+        if is_not_modified(request.headers, stat_result):
+            return not_modified_response(stat_result)
+
+        return JSONResponse(
+            {"content": file_path.read_text()},
+            headers=validator_headers(stat_result)
+        )
+
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to read file {path}: {str(e)}")
         raise HTTPException(500, detail=str(e))
 
+@router.get("/raw")
+async def get_file_raw(
+    path: str,
+    request: Request,
+    session_id: Optional[str] = Query(None),
+    temp_dir: str = Query(None),
+    lines: Optional[str] = Query(None, description="1-based inclusive line window, e.g. 120-180")
+):
+    """Serve raw file bytes with ETag/304, HTTP Range and line-window support"""
+    try:
+        file_path = resolve_session_file(path, session_id, temp_dir)
+        stat_result = stat_regular_file(file_path)
+        if stat_result is None:
+            raise HTTPException(404, detail=f"File not found at: {path}")
+
+        if is_not_modified(request.headers, stat_result):
+            return not_modified_response(stat_result)
+
+        headers = validator_headers(stat_result)
+        media_type = "text/plain"
+
+        if lines:
+            try:
+                first_line, last_line = parse_line_window(lines)
+            except ValueError as e:
+                raise HTTPException(400, detail=str(e))
+
+            # A cold index reads the whole file; keep that off the event loop
+            index = await asyncio.to_thread(get_line_index, file_path, stat_result)
+            headers["x-total-lines"] = str(index.line_count)
+            byte_range = index.byte_range(first_line, last_line)
+            if byte_range is None:
+                return Response(content=b"", media_type=media_type, headers=headers)
+
+            headers["x-line-start"] = str(first_line)
+            headers["x-line-end"] = str(min(last_line, index.line_count))
+            return FileRangeResponse(
+                file_path,
+                *byte_range,
+                stat_result=stat_result,
+                status_code=200,
+                headers=headers,
+                media_type=media_type
+            )
+
+        try:
+            byte_range = parse_range_header(request.headers.get("range"), stat_result.st_size)
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={**headers, "content-range": f"bytes */{stat_result.st_size}"}
+            )
+
+        if_range = request.headers.get("if-range")
+        if byte_range is not None and (not if_range or if_range == headers["etag"]):
+            return FileRangeResponse(
+                file_path,
+                *byte_range,
+                stat_result=stat_result,
+                headers=headers,
+                media_type=media_type
+            )
+
+        return FileResponse(
+            file_path,
+            stat_result=stat_result,
+            headers=headers,
+            media_type=media_type
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to serve file {path}: {str(e)}")
+        raise HTTPException(500, detail=str(e))
+
+def _expand_batch(request: BatchFileRequest) -> List[FileWindow]:
+    """Explicit windows plus one window per cluster of issue lines in a file"""
+    windows = list(request.files)
+    lines_by_file: Dict[str, List[int]] = {}
+    whole_files = set()
+    for issue in request.issues:
+        file = issue.get("file")
+        if not file:
+            continue
+        line = issue.get("line") or 0
+        if not isinstance(line, int) or isinstance(line, bool):
+            continue
+        if line > 0:
+            lines_by_file.setdefault(file, []).append(line)
+        else:
+            whole_files.add(file)
+
+    for file in whole_files:
+        windows.append(FileWindow(path=file))
+    for file, lines in lines_by_file.items():
+        if file in whole_files:
+            continue
+        for first, last in merge_line_windows(lines, request.context_lines):
+            windows.append(FileWindow(path=file, start_line=first, end_line=last))
+    return windows
+
+@router.post("/batch")
+async def get_files_batch(request: BatchFileRequest):
+    """Stream many files or line windows back as NDJSON, one record per line"""
+    bases = session_bases(request.session_id, request.temp_dir)
+    if not bases:
+        raise HTTPException(404, detail="Session not found")
+
+    windows = _expand_batch(request)
+    semaphore = asyncio.Semaphore(BATCH_READ_CONCURRENCY)
+
+    def read_window(window: FileWindow) -> Dict[str, Any]:
+        record = {"path": window.path}
+        file_path = find_in_bases(bases, window.path)
+        if file_path is None:
+            return {**record, "error": "File not found"}
+        try:
+            return {**record, **read_line_window(file_path, window.start_line, window.end_line)}
+        except Exception as e:
+            logger.error(f"Batch read failed for {window.path}: {str(e)}")
+            return {**record, "error": str(e)}
+
+    async def bounded_read(window: FileWindow) -> Dict[str, Any]:
+        async with semaphore:
+            return await asyncio.to_thread(read_window, window)
+
+    async def stream():
+        tasks = [asyncio.create_task(bounded_read(window)) for window in windows]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                record = await completed
+                yield json.dumps(record) + "\n"
+        finally:
+            for task in tasks:
+                task.cancel()
 
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        headers={"x-record-count": str(len(windows))}
+    )
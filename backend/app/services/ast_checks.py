@@ -0,0 +1,295 @@
+# backend/app/services/ast_checks.py
+import ast
+import io
+import logging
+import multiprocessing
+import os
+import resource
+import threading
+import time
+import tokenize
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.deadline import Deadline
+from app.services.linter_runner import CPU_LIMIT_SECONDS, MEMORY_LIMIT_MB
+from app.services.parse_linter import RelativePath, bandit_issue, radon_blocks
+from app.services.tracing import current_span, traced
+
+logger = logging.getLogger(__name__)
+
+# 0 runs the checks in the calling thread instead of worker processes
+AST_WORKERS = int(os.getenv("PINK_CODED_AST_WORKERS", str(min(4, os.cpu_count() or 1))))
+FILES_PER_TASK = 32
+CANCEL_POLL = 0.1  # seconds between cancel/deadline checks while chunks run
+
+# Raised when the private bandit API used below does not match the installed
+# version (it is pinned in requirements.txt); bandit's own test runner
+# catches failures caused by the code under test.
+BANDIT_API_ERRORS = (ImportError, AttributeError, TypeError)
+
+# Directories neither bandit (-r) nor radon descend into
+SKIPPED_DIRS = {"__pycache__", "CVS"}
+
+
+class AstStageUnavailable(Exception):
+    """The shared parse stage could not run; callers fall back to the CLIs"""
+
+
+@dataclass
+class AstCheckResult:
+    security: List[Dict[str, Any]] = field(default_factory=list)
+    complexity: List[Dict[str, Any]] = field(default_factory=list)
+    files: int = 0
+    skipped: List[Tuple[str, str]] = field(default_factory=list)
+    cpu_seconds: float = 0.0
+    unchecked: int = 0  # files left out because the deadline passed
+
+    @property
+    def partial(self) -> bool:
+        return self.unchecked > 0
+
+
+def python_files(project_path: Path, targets: Optional[List[Path]] = None) -> List[Path]:
+    if targets:
+        return [t for t in targets if t.suffix == ".py"]
+    files = []
+    for root, dirs, names in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs
+                         if not d.startswith(".") and d not in SKIPPED_DIRS and not d.endswith(".egg"))
+        files.extend(Path(root, name) for name in sorted(names) if name.endswith(".py"))
+    return files
+
+
+# Per worker process: the bandit test set for each config file, built once
+_bandit_test_sets: Dict[str, Any] = {}
+
+
+def _bandit_test_set(config_path: Optional[str]):
+    test_set = _bandit_test_sets.get(config_path or "")
+    if test_set is None:
+        from bandit.core.config import BanditConfig
+        from bandit.core.test_set import BanditTestSet
+        config = BanditConfig(config_file=config_path)
+        # Same profile the bandit CLI derives from ``tests``/``skips``
+        profile = {
+            "include": set(config.get_option("tests") or []),
+            "exclude": set(config.get_option("skips") or [])
+        }
+        test_set = _bandit_test_sets[config_path or ""] = BanditTestSet(config, profile)
+    return test_set
+
+
+def _bandit_results(name: str, data: bytes, tree: ast.AST, config_path: Optional[str]) -> List[Dict[str, Any]]:
+    """Bandit's manager loop for one file, minus its own read and ``ast.parse``"""
+    from bandit.core import meta_ast, metrics, node_visitor
+    from bandit.core.manager import _parse_nosec_comment
+
+    nosec_lines = {}
+    try:
+        for token in tokenize.tokenize(io.BytesIO(data).readline):
+            if token.type == tokenize.COMMENT:
+                nosec_lines[token.start[0]] = _parse_nosec_comment(token.string)
+    except tokenize.TokenError:
+        pass
+
+    file_metrics = metrics.Metrics()
+    file_metrics.begin(name)
+    visitor = node_visitor.BanditNodeVisitor(
+        name, io.BytesIO(data), meta_ast.BanditMetaAst(), _bandit_test_set(config_path),
+        False, nosec_lines, file_metrics
+    )
+    # BanditNodeVisitor.process() without its ast.parse
+    visitor.generic_visit(tree)
+    visitor.context = {"file_data": visitor.fdata, "filename": name, "lineno": 0, "linerange": [0, 1], "col_offset": 0}
+    visitor.update_scores(visitor.tester.run_tests(visitor.context, "File"))
+    return [issue.as_dict(with_code=False) for issue in visitor.tester.results]
+
+
+# True inside executor workers, which carry the linter resource limits
+_in_worker = False
+
+
+def _init_worker() -> None:
+    """Executor initializer: the linter memory cap for the worker's lifetime"""
+    global _in_worker
+    _in_worker = True
+    if MEMORY_LIMIT_MB > 0:
+        limit = MEMORY_LIMIT_MB * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _arm_cpu_limit() -> None:
+    """Give the coming chunk ``CPU_LIMIT_SECONDS`` of CPU on top of what the worker has used
+
+    Workers are long-lived, so a fixed RLIMIT_CPU would eventually kill a
+    healthy one; only a runaway chunk hits this and gets SIGXCPU.
+    """
+    if not _in_worker or CPU_LIMIT_SECONDS <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + CPU_LIMIT_SECONDS
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _check_files(names: List[str], base: str, config_path: Optional[str], with_bandit: bool = True) -> Dict[str, Any]:
+    """Read and parse each file once, then run every AST consumer on that tree"""
+    from radon.cli.tools import cc_to_dict
+    from radon.complexity import cc_visit_ast
+
+    _arm_cpu_limit()
+    started = time.process_time()
+    rel = RelativePath(Path(base))
+    security: List[Dict[str, Any]] = []
+    complexity: List[Dict[str, Any]] = []
+    skipped: List[Tuple[str, str]] = []
+    for name in names:
+        try:
+            with open(name, "rb") as f:
+                data = f.read()
+            tree = ast.parse(data, filename=name)
+        except (OSError, SyntaxError, ValueError) as e:
+            skipped.append((rel(name), f"{type(e).__name__}: {e}"))
+            continue
+        # Radon first: bandit annotates the nodes it visits
+        complexity.extend(radon_blocks(name, [cc_to_dict(block) for block in cc_visit_ast(tree)], rel))
+        if not with_bandit:
+            continue
+        try:
+            security.extend(bandit_issue(issue, rel) for issue in _bandit_results(name, data, tree, config_path))
+        except BANDIT_API_ERRORS as e:
+            # bandit's internals moved; every file would fail the same way
+            raise AstStageUnavailable(f"bandit internals unusable: {type(e).__name__}: {e}")
+        except Exception as e:
+            skipped.append((rel(name), f"bandit: {type(e).__name__}: {e}"))
+    return {
+        "security": security,
+        "complexity": complexity,
+        "skipped": skipped,
+        "cpu_seconds": time.process_time() - started
+    }
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_ast_executor() -> Optional[ProcessPoolExecutor]:
+    """Process-wide parse pool, or None when PINK_CODED_AST_WORKERS=0"""
+    global _executor
+    if AST_WORKERS <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                AST_WORKERS, mp_context=multiprocessing.get_context("spawn"), initializer=_init_worker
+            )
+        return _executor
+
+
+def retire_ast_executor(executor: ProcessPoolExecutor) -> None:
+    """Replace ``executor`` and kill its workers, so chunks left running stop now
+
+    Analyses with chunks still queued on it see BrokenProcessPool and fall
+    back to the CLIs.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is executor:
+            _executor = None
+    # No public way to reach the workers before Python 3.14's terminate_workers()
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.kill()
+
+
+def shutdown_ast_executor() -> None:
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+@traced("ast_checks")
+def run_ast_checks(
+    project_path: Path,
+    targets: Optional[List[Path]] = None,
+    bandit_config: Optional[Path] = None,
+    deadline: Optional[Deadline] = None,
+    with_bandit: bool = True,
+    cancel: Optional[threading.Event] = None
+) -> AstCheckResult:
+    """Bandit and radon results for a project from a single parse per file
+
+    Output matches what ``parse_linter_output`` produces for the bandit and
+    radon CLIs. Raises AstStageUnavailable when the workers cannot run.
+    Chunks not finished by ``deadline``, or when ``cancel`` is set, are
+    dropped and counted in ``unchecked``; if one was already running the
+    executor is retired so it does not run on. ``with_bandit=False`` runs
+    radon only, in the calling thread, which is cheaper than a round trip
+    to the workers.
+    """
+    names = [str(p) for p in python_files(project_path, targets)]
+    config_path = str(bandit_config) if bandit_config else None
+    result = AstCheckResult(files=len(names))
+    chunks = [names[i:i + FILES_PER_TASK] for i in range(0, len(names), FILES_PER_TASK)]
+    executor = get_ast_executor() if with_bandit and len(chunks) > 1 else None
+    parts: Dict[int, Dict[str, Any]] = {}
+
+    def stopped() -> bool:
+        return (cancel is not None and cancel.is_set()) or (deadline is not None and deadline.expired)
+
+    try:
+        if executor is None:
+            for i, chunk in enumerate(chunks):
+                if stopped():
+                    result.unchecked += len(chunk)
+                    continue
+                parts[i] = _check_files(chunk, str(project_path), config_path, with_bandit)
+        else:
+            waiting = list(enumerate(chunks))
+            running: Dict[Future, Tuple[int, List[str]]] = {}
+            # Submit a bounded window so a cancel or deadline leaves little queued
+            while (waiting or running) and not stopped():
+                while waiting and len(running) < AST_WORKERS * 2:
+                    i, chunk = waiting.pop(0)
+                    running[executor.submit(_check_files, chunk, str(project_path), config_path)] = (i, chunk)
+                poll = CANCEL_POLL if deadline is None else min(CANCEL_POLL, deadline.remaining())
+                done, _ = wait(running, timeout=poll, return_when=FIRST_COMPLETED)
+                for future in done:
+                    i, _ = running.pop(future)
+                    parts[i] = future.result()
+            overran = False
+            for _, chunk in [*waiting, *running.values()]:
+                result.unchecked += len(chunk)
+            for future in running:
+                overran = not future.cancel() or overran
+            if overran:
+                retire_ast_executor(executor)
+    except (BrokenProcessPool, ImportError) as e:
+        if isinstance(e, BrokenProcessPool):
+            retire_ast_executor(executor)
+        raise AstStageUnavailable(str(e))
+
+    for _, part in sorted(parts.items()):
+        result.security.extend(part["security"])
+        result.complexity.extend(part["complexity"])
+        result.skipped.extend(part["skipped"])
+        result.cpu_seconds += part["cpu_seconds"]
+    current_span().set(
+        files=result.files,
+        skipped=len(result.skipped),
+        security_issues=len(result.security),
+        complexity_issues=len(result.complexity),
+        cpu_seconds=round(result.cpu_seconds, 3),
+        unchecked=result.unchecked
+    )
+    return result
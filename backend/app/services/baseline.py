@@ -0,0 +1,145 @@
+# backend/app/services/baseline.py
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.models.issue_table import IssueTable
+
+logger = logging.getLogger(__name__)
+
+BASELINE_ROOT = Path(os.getenv("PINK_CODED_BASELINE_DIR", os.path.join(tempfile.gettempdir(), "pink-coded-baselines")))
+CONTEXT_LINES = 2  # lines on each side that go into the context hash
+PROJECT_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]{0,127}$")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_line(text: str) -> str:
+    """Whitespace-insensitive form of a source line"""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class SourceLines:
+    """Normalized lines per project file, read once per fingerprinting pass"""
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self._files: Dict[str, List[str]] = {}
+
+    def __call__(self, rel_path: str) -> List[str]:
+        lines = self._files.get(rel_path)
+        if lines is None:
+            try:
+                text = (self.project_path / rel_path).read_text(errors="replace")
+                lines = [normalize_line(line) for line in text.splitlines()]
+            except (OSError, ValueError):
+                lines = []
+            self._files[rel_path] = lines
+        return lines
+
+
+def add_fingerprints(issues: List[Dict[str, Any]], sources: SourceLines) -> List[Dict[str, Any]]:
+    """Set ``fingerprint`` on each issue dict; returns ``issues``
+
+    The fingerprint covers code, file, the normalized flagged line and a
+    hash of its neighbours, but not the line number, so it survives code
+    moving up or down. Identical findings in one file are told apart by
+    their order of appearance.
+    """
+    seen: Dict[str, int] = {}
+    for issue in sorted(issues, key=lambda i: (i.get("file") or "", i.get("line") or 0, i.get("column") or 0)):
+        file = issue.get("file") or ""
+        line = issue.get("line") or 0
+        lines = sources(file) if file else []
+        at = line - 1
+        content = lines[at] if 0 <= at < len(lines) else ""
+        # Blank neighbours are dropped so inserting empty lines does not change it
+        context = "\n".join(filter(None, lines[max(0, at - CONTEXT_LINES):at] + lines[at + 1:at + 1 + CONTEXT_LINES]))
+        base = hashlib.sha1(
+            "\0".join((issue.get("code") or "", file, content, hashlib.sha1(context.encode()).hexdigest())).encode()
+        ).hexdigest()[:16]
+        occurrence = seen.get(base, 0)
+        seen[base] = occurrence + 1
+        issue["fingerprint"] = base if occurrence == 0 else f"{base}-{occurrence}"
+    return issues
+
+
+def split_by_fingerprints(table: IssueTable, known: Set[str]) -> Tuple[List[int], List[int]]:
+    """Rows of ``table`` whose fingerprint is not / is in ``known`` (new, existing)"""
+    column = table.fingerprint
+    known_ids = {value_id for value, value_id in column.lookup.items() if value in known}
+    new_rows: List[int] = []
+    existing_rows: List[int] = []
+    for row, value_id in enumerate(column.ids):
+        (existing_rows if value_id in known_ids else new_rows).append(row)
+    return new_rows, existing_rows
+
+
+def baseline_entries(sections: Dict[str, IssueTable]) -> Dict[str, Dict[str, Any]]:
+    """fingerprint -> short issue summary, the on-disk baseline format"""
+    entries: Dict[str, Dict[str, Any]] = {}
+    for section, table in sections.items():
+        for row in range(len(table)):
+            fingerprint = table.fingerprint.value(row)
+            if fingerprint:
+                issue = table.row(row)
+                entries[fingerprint] = {
+                    "section": section,
+                    "code": issue.get("code"),
+                    "file": issue.get("file"),
+                    "line": issue.get("line"),
+                    "message": issue.get("message")
+                }
+    return entries
+
+
+class BaselineStore:
+    """One JSON fingerprint set per project name"""
+
+    def __init__(self, root: Path = BASELINE_ROOT):
+        self.root = root
+
+    def path(self, project: str) -> Path:
+        if not PROJECT_PATTERN.match(project):
+            raise ValueError(f"Invalid baseline project name: {project!r}")
+        return self.root / f"{project}.json"
+
+    def load(self, project: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        path = self.path(project)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text())["issues"]
+
+    def save(self, project: str, entries: Dict[str, Dict[str, Any]]) -> None:
+        path = self.path(project)
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.root, prefix=f".{project}.")
+        with os.fdopen(fd, "w") as f:
+            json.dump({"issues": entries}, f)
+        os.replace(tmp_name, path)
+
+
+def classify(
+    sections: Dict[str, IssueTable],
+    baseline: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, IssueTable], Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Split current issues against a baseline
+
+    Returns the new issues per section, the baseline entries still present
+    (existing) and the baseline entries no longer reported (fixed).
+    """
+    known = set(baseline)
+    new_sections: Dict[str, IssueTable] = {}
+    current: Set[str] = set()
+    for section, table in sections.items():
+        new_rows, _ = split_by_fingerprints(table, known)
+        new_sections[section] = table.take(new_rows)
+        column = table.fingerprint
+        current.update(column.values[value_id] for value_id in set(column.ids) if value_id)
+    existing = {fp: baseline[fp] for fp in known & current}
+    fixed = [{"fingerprint": fp, **baseline[fp]} for fp in sorted(known - current)]
+    return new_sections, existing, fixed
@@ -0,0 +1,219 @@
+# backend/app/services/blob_store.py
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Must share a filesystem with the session temp dirs for hardlinks to work
+BLOB_ROOT = Path(os.getenv("PINK_CODED_BLOB_DIR", os.path.join(tempfile.gettempdir(), "pink-coded-blobs")))
+IN_MEMORY_MEMBER_BYTES = 8 * 1024 * 1024
+READ_SIZE = 1024 * 1024
+INVALID_PATH_PARTS = ("", os.curdir, os.pardir)
+
+
+def member_path(name: str) -> Optional[str]:
+    """Relative path for a zip member, sanitized the way ``ZipFile.extractall`` does"""
+    name = os.path.splitdrive(name.replace("/", os.sep))[1]
+    parts = [part for part in name.split(os.sep) if part not in INVALID_PATH_PARTS]
+    return os.sep.join(parts) or None
+
+
+@dataclass
+class ExtractStats:
+    files: int = 0
+    linked: int = 0       # hardlinked to an existing or new blob
+    copied: int = 0       # private copies (cross-device or link limit)
+    new_blobs: int = 0
+    written_bytes: int = 0
+    from_manifest: bool = False
+
+
+class BlobStore:
+    """Content-addressed, immutable file blobs shared by session working trees.
+
+    Session files are hardlinks to ``blobs/<sha256[:2]>/<sha256>``, so a
+    blob's link count minus one is the number of session files using it;
+    ``gc()`` deletes blobs nobody links to any more. Shared files must
+    only be replaced (``atomic_write_text``), never written in place,
+    which makes every edit a private copy-on-write.
+
+    A manifest per archive hash remembers which blob each member maps to,
+    so re-extracting a known archive is only links, no decompression.
+    """
+
+    def __init__(self, root: Path = BLOB_ROOT):
+        self.root = root
+        self.blobs = root / "blobs"
+        self.manifests = root / "manifests"
+        self.tmp = root / "tmp"
+        for path in (self.blobs, self.manifests, self.tmp):
+            path.mkdir(parents=True, exist_ok=True)
+        # Held around link-or-create and around each GC unlink
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blobs / digest[:2] / digest
+
+    def _store(self, tmp_path: str, digest: str) -> Tuple[Path, bool]:
+        """Move a finished temp file into place unless the blob already exists"""
+        blob = self.blob_path(digest)
+        if blob.exists():
+            os.unlink(tmp_path)
+            return blob, False
+        blob.parent.mkdir(exist_ok=True)
+        os.replace(tmp_path, blob)
+        return blob, True
+
+    def _write_member(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> Tuple[str, str, int]:
+        """Decompress one member into a temp file; returns (temp path, sha256, size)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp)
+        digest = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, "wb") as out, zf.open(info) as source:
+            while True:
+                chunk = source.read(READ_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        return tmp_path, digest.hexdigest(), size
+
+    def _link(self, blob: Path, target: Path, stats: ExtractStats) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(blob, target)
+            stats.linked += 1
+        except OSError as e:
+            if isinstance(e, FileNotFoundError):
+                raise
+            # EXDEV / EMLINK: the session gets its own copy
+            shutil.copyfile(blob, target)
+            stats.copied += 1
+
+    def _link_manifest(self, manifest: Path, dest: Path, stats: ExtractStats) -> bool:
+        try:
+            entries: List[List[str]] = json.loads(manifest.read_text())
+            with self._lock:
+                for rel, digest in entries:
+                    self._link(self.blob_path(digest), dest / rel, stats)
+        except (OSError, ValueError):
+            # A blob was collected since the manifest was written
+            return False
+        os.utime(manifest)
+        stats.files = len(entries)
+        stats.from_manifest = True
+        return True
+
+    def extract(self, zip_path: Path, dest: Path, archive_hash: Optional[str] = None) -> ExtractStats:
+        """``extractall`` equivalent that links members to shared blobs"""
+        stats = ExtractStats()
+        manifest = self.manifests / f"{archive_hash}.json" if archive_hash else None
+        if manifest is not None and manifest.exists() and self._link_manifest(manifest, dest, stats):
+            return stats
+
+        stats = ExtractStats()
+        entries: List[List[str]] = []
+        with zipfile.ZipFile(zip_path) as zf:
+            for info in zf.infolist():
+                rel = member_path(info.filename)
+                if rel is None:
+                    continue
+                if info.is_dir():
+                    (dest / rel).mkdir(parents=True, exist_ok=True)
+                    continue
+                if info.file_size <= IN_MEMORY_MEMBER_BYTES:
+                    data = zf.read(info)
+                    digest = hashlib.sha256(data).hexdigest()
+                    tmp_path = None
+                else:
+                    data = None
+                    tmp_path, digest, _ = self._write_member(zf, info)
+                with self._lock:
+                    blob = self.blob_path(digest)
+                    if not blob.exists():
+                        if tmp_path is None:
+                            fd, tmp_path = tempfile.mkstemp(dir=self.tmp)
+                            with os.fdopen(fd, "wb") as out:
+                                out.write(data)
+                        # Read-only, so an in-place write fails instead of editing every session
+                        os.chmod(tmp_path, 0o444)
+                        self._store(tmp_path, digest)
+                        stats.new_blobs += 1
+                        stats.written_bytes += info.file_size
+                    elif tmp_path is not None:
+                        os.unlink(tmp_path)
+                    self._link(blob, dest / rel, stats)
+                entries.append([rel, digest])
+                stats.files += 1
+
+        if manifest is not None:
+            fd, tmp_path = tempfile.mkstemp(dir=self.tmp)
+            with os.fdopen(fd, "w") as out:
+                json.dump(entries, out)
+            os.replace(tmp_path, manifest)
+        return stats
+
+    def gc(self, manifest_ttl: Optional[float] = None) -> Dict[str, int]:
+        """Delete blobs no session links to; optionally manifests unused for ``manifest_ttl`` s"""
+        removed = freed = kept = 0
+        for shard in list(self.blobs.iterdir()):
+            for blob in list(shard.iterdir()):
+                with self._lock:
+                    try:
+                        st = blob.stat()
+                        if st.st_nlink > 1:
+                            kept += 1
+                            continue
+                        blob.unlink()
+                    except FileNotFoundError:
+                        continue
+                removed += 1
+                freed += st.st_size
+        manifests = 0
+        if manifest_ttl is not None:
+            cutoff = time.time() - manifest_ttl
+            for manifest in list(self.manifests.iterdir()):
+                try:
+                    if manifest.stat().st_mtime < cutoff:
+                        manifest.unlink()
+                        manifests += 1
+                except FileNotFoundError:
+                    pass
+        return {"removed": removed, "freed_bytes": freed, "kept": kept, "manifests_removed": manifests}
+
+    def usage(self) -> Tuple[int, int]:
+        """(blob count, blob bytes)"""
+        count = size = 0
+        for shard in self.blobs.iterdir():
+            for blob in shard.iterdir():
+                try:
+                    size += blob.stat().st_size
+                    count += 1
+                except FileNotFoundError:
+                    pass
+        return count, size
+
+
+_store: Optional[BlobStore] = None
+_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = BlobStore()
+        return _store
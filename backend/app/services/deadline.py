@@ -0,0 +1,23 @@
+# backend/app/services/deadline.py
+import time
+from typing import Optional
+
+
+class Deadline:
+    """Wall-clock budget shared by every stage of one analysis"""
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+
+def remaining(deadline: Optional[Deadline], default: float) -> float:
+    """Time a stage may take: ``default`` capped by what is left of ``deadline``"""
+    return default if deadline is None else min(default, deadline.remaining())
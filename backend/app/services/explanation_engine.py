@@ -11,6 +11,8 @@ import asyncio
 from datetime import datetime
 import time
 import httpx  # For DeepSeek API calls
+from app.services.metrics import EXPLANATION_SECONDS, explanation_source, record_cache
+from app.services.tracing import current_span, traced
 
 load_dotenv()
 
@@ -39,7 +41,8 @@ class ExplanationEngine:
     def __init__(self, profile_service):
         self.profile_service = profile_service
         self.api_key = os.getenv("DEEPSEEK_API_KEY")
-        self.api_url = "https://api.deepseek.ai/v1/chat/completions"  # Example endpoint
+        # Overridable so tests and load runs can point at a local stand-in
+        self.api_url = os.getenv("DEEPSEEK_API_URL", "https://api.deepseek.ai/v1/chat/completions")
         self.templates = self._load_templates()
         self.common_patterns = ['E', 'W', 'F', 'B', 'R']
         self.explanation_cache = {}
@@ -107,6 +110,7 @@ class ExplanationEngine:
     async def _call_deepseek(self, prompt):
         return await self.deepseek.generate(prompt)
 
+    @traced("explanation")
     async def generate_explanation(self, issue: Issue, user_id: str) -> Dict[str, str]:
         """Main entry point with enhanced error handling"""
         cache_key = f"{user_id}-{issue.code}-{issue.message[:50]}"
@@ -115,10 +119,17 @@ class ExplanationEngine:
             # Check cache first
             if cached := self.explanation_cache.get(cache_key):
                 if datetime.now().timestamp() - cached.get("_timestamp", 0) < 3600:  # 1 hour cache
+                    record_cache("explanation", True)
+                    current_span().set(code=issue.code, cache_hit=True, source=cached.get("source"))
                     return cached
+            record_cache("explanation", False)
             
             profile = self.profile_service.get_profile(user_id)
+            started = time.perf_counter()
             explanation = await self._generate_with_timeout(issue, profile)
+            source = explanation_source(explanation.get("source"))
+            EXPLANATION_SECONDS.observe(time.perf_counter() - started, source=source)
+            current_span().set(code=issue.code, cache_hit=False, source=source)
             
             if explanation.get("source") != "error":
                 explanation["_timestamp"] = datetime.now().timestamp()
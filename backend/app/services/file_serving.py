@@ -0,0 +1,269 @@
+# backend/app/services/file_serving.py
+import os
+import stat
+from array import array
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional, Tuple
+
+import anyio
+from fastapi.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+from app.services.metrics import record_cache
+
+INDEX_CHUNK_SIZE = 1024 * 1024
+LINE_INDEX_CACHE_SIZE = 256
+
+
+def contained_path(base: Path, path: str) -> Optional[Path]:
+    """Join path onto base, refusing anything that escapes the project root"""
+    candidate = (base / path).resolve()
+    try:
+        candidate.relative_to(base.resolve())
+    except ValueError:
+        return None
+    return candidate
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    """Strong validator built from file size and mtime"""
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def validator_headers(stat_result: os.stat_result) -> dict:
+    """ETag/Last-Modified headers shared by every file response"""
+    return {
+        "etag": file_etag(stat_result),
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "accept-ranges": "bytes",
+        "cache-control": "no-cache",
+    }
+
+
+def is_not_modified(headers, stat_result: os.stat_result) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the file on disk"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = file_etag(stat_result)
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(stat_result.st_mtime) <= since
+    return False
+
+
+def not_modified_response(stat_result: os.stat_result) -> Response:
+    return Response(status_code=304, headers=validator_headers(stat_result))
+
+
+def parse_range_header(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into an inclusive (start, end) pair.
+
+    Returns None when the header is absent or asks for several ranges (the
+    full body is served instead). Raises ValueError for unsatisfiable ranges.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+    spec = header[len("bytes="):].strip()
+    if "," in spec:
+        return None
+
+    start_text, _, end_text = spec.partition("-")
+    try:
+        if not start_text:
+            # Suffix range: last N bytes
+            length = int(end_text)
+            if length <= 0:
+                raise ValueError("Empty suffix range")
+            return max(size - length, 0), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else size - 1
+    except ValueError:
+        raise ValueError(f"Malformed range: {header}")
+
+    if start >= size or start > end:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, min(end, size - 1)
+
+
+class FileRangeResponse(FileResponse):
+    """FileResponse that streams only the inclusive byte window [start, end]"""
+
+    def __init__(
+        self,
+        path: Path,
+        start: int,
+        end: int,
+        stat_result: os.stat_result,
+        status_code: int = 206,
+        **kwargs
+    ):
+        super().__init__(path, status_code=status_code, stat_result=stat_result, **kwargs)
+        self.start = start
+        self.end = end
+        self.headers["content-length"] = str(end - start + 1)
+        if status_code == 206:
+            self.headers["content-range"] = f"bytes {start}-{end}/{self.stat_result.st_size}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({
+            "type": "http.response.start",
+            "status": self.status_code,
+            "headers": self.raw_headers,
+        })
+        if scope["method"].upper() == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+
+        remaining = self.end - self.start + 1
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await file.seek(self.start)
+            while remaining > 0:
+                chunk = await file.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({
+                    "type": "http.response.body",
+                    "body": chunk,
+                    "more_body": remaining > 0,
+                })
+        if remaining > 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        if self.background is not None:
+            await self.background()
+
+
+class LineIndex:
+    """Byte offsets of every line start in a file"""
+
+    def __init__(self, offsets: array, size: int):
+        self.offsets = offsets
+        self.size = size
+
+    @classmethod
+    def build(cls, path: Path) -> "LineIndex":
+        offsets = array("Q", [0])
+        position = 0
+        with path.open("rb") as f:
+            while chunk := f.read(INDEX_CHUNK_SIZE):
+                newline = chunk.find(b"\n")
+                while newline != -1:
+                    offsets.append(position + newline + 1)
+                    newline = chunk.find(b"\n", newline + 1)
+                position += len(chunk)
+        # A trailing newline does not start another line
+        if len(offsets) > 1 and offsets[-1] == position:
+            offsets.pop()
+        return cls(offsets, position)
+
+    @property
+    def line_count(self) -> int:
+        return 0 if self.size == 0 else len(self.offsets)
+
+    def byte_range(self, first_line: int, last_line: int) -> Optional[Tuple[int, int]]:
+        """Inclusive byte range for 1-based lines, clamped to the file"""
+        if self.size == 0 or first_line > self.line_count:
+            return None
+        first = max(first_line, 1) - 1
+        last = min(last_line, self.line_count)
+        start = self.offsets[first]
+        end = self.offsets[last] - 1 if last < len(self.offsets) else self.size - 1
+        return start, end
+
+
+_line_indexes: "OrderedDict[Tuple[str, int, int], LineIndex]" = OrderedDict()
+_line_index_lock = Lock()
+
+
+def get_line_index(path: Path, stat_result: os.stat_result) -> LineIndex:
+    """Return a cached line index, rebuilt whenever size or mtime change"""
+    key = (str(path), stat_result.st_size, stat_result.st_mtime_ns)
+    with _line_index_lock:
+        index = _line_indexes.get(key)
+        if index is not None:
+            _line_indexes.move_to_end(key)
+    record_cache("line_index", index is not None)
+    if index is not None:
+        return index
+
+    index = LineIndex.build(path)
+    with _line_index_lock:
+        _line_indexes[key] = index
+        while len(_line_indexes) > LINE_INDEX_CACHE_SIZE:
+            _line_indexes.popitem(last=False)
+    return index
+
+
+def parse_line_window(lines: str) -> Tuple[int, int]:
+    """Parse ``a-b`` (or a single ``a``) into a 1-based inclusive line window"""
+    first_text, _, last_text = lines.replace("–", "-").partition("-")
+    try:
+        first = int(first_text)
+        last = int(last_text) if last_text else first
+    except ValueError:
+        raise ValueError(f"Invalid line window: {lines}")
+    if first < 1 or last < first:
+        raise ValueError(f"Invalid line window: {lines}")
+    return first, last
+
+
+def stat_regular_file(path: Path) -> Optional[os.stat_result]:
+    try:
+        stat_result = path.stat()
+    except OSError:
+        return None
+    return stat_result if stat.S_ISREG(stat_result.st_mode) else None
+
+
+def read_line_window(path: Path, first_line: Optional[int] = None, last_line: Optional[int] = None) -> dict:
+    """Read a whole file or a 1-based line window, returning a JSON-ready record"""
+    stat_result = stat_regular_file(path)
+    if stat_result is None:
+        raise FileNotFoundError(str(path))
+
+    record = {"etag": file_etag(stat_result)}
+    if first_line is None and last_line is None:
+        record["content"] = path.read_text()
+        return record
+
+    if (first_line is not None and first_line < 1) or (last_line is not None and last_line < (first_line or 1)):
+        raise ValueError(f"Invalid line window: {first_line}-{last_line}")
+
+    index = get_line_index(path, stat_result)
+    first_line = first_line or 1
+    last_line = last_line or index.line_count
+    byte_range = index.byte_range(first_line, last_line)
+    record.update({
+        "start_line": first_line,
+        "end_line": min(last_line, index.line_count),
+        "total_lines": index.line_count,
+        "content": ""
+    })
+    if byte_range is not None:
+        start, end = byte_range
+        with path.open("rb") as f:
+            f.seek(start)
+            record["content"] = f.read(end - start + 1).decode("utf-8", errors="replace")
+    return record
+
+
+def merge_line_windows(lines: List[int], context: int) -> List[Tuple[int, int]]:
+    """Collapse issue lines into non-overlapping windows padded by context lines"""
+    windows: List[Tuple[int, int]] = []
+    for line in sorted(set(lines)):
+        first, last = max(line - context, 1), line + context
+        if windows and first <= windows[-1][1] + 1:
+            windows[-1] = (windows[-1][0], max(windows[-1][1], last))
+        else:
+            windows.append((first, last))
+    return windows
@@ -0,0 +1,75 @@
+# backend/app/services/fix_applier.py
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+
+
+@dataclass
+class Hunk:
+    """Replace 1-based lines [start, end] with ``replacement``"""
+    start: int
+    end: int
+    replacement: str
+    issue: dict = field(default_factory=dict)
+
+
+def _line_ending(line: str) -> str:
+    if line.endswith("\r\n"):
+        return "\r\n"
+    if line.endswith("\n"):
+        return "\n"
+    return ""
+
+
+def apply_hunks(content: str, hunks: List[Hunk]) -> Tuple[str, List[Hunk], List[Hunk]]:
+    """Apply non-overlapping hunks in one pass over the original line numbers.
+
+    Every hunk addresses the *original* file, so callers never have to adjust
+    line numbers for earlier edits. Overlapping or out-of-range hunks are
+    skipped and returned separately.
+    """
+    lines = content.splitlines(keepends=True)
+    applied: List[Hunk] = []
+    skipped: List[Hunk] = []
+    output: List[str] = []
+    cursor = 0  # index of the first original line not yet copied
+
+    for hunk in sorted(hunks, key=lambda h: (h.start, h.end)):
+        first, last = hunk.start - 1, hunk.end - 1
+        if first < cursor or first < 0 or last < first or last >= len(lines):
+            skipped.append(hunk)
+            continue
+
+        output.extend(lines[cursor:first])
+        ending = _line_ending(lines[last]) or "\n"
+        replacement = hunk.replacement.splitlines()
+        for i, text in enumerate(replacement):
+            is_last = i == len(replacement) - 1
+            output.append(text + (_line_ending(lines[last]) if is_last else ending))
+        cursor = last + 1
+        applied.append(hunk)
+
+    output.extend(lines[cursor:])
+    return "".join(output), applied, skipped
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write through a temp file in the same directory and rename over the target"""
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        try:
+            # Keep the target's mode, but the private copy is writable even if a shared blob was not
+            os.chmod(tmp_name, (path.stat().st_mode & 0o777) | 0o200)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
@@ -0,0 +1,106 @@
+# backend/app/services/issue_dedup.py
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Rule ids that describe the same underlying problem, per linter.
+# Keyed by linter because ruff's bugbear ids (B0xx) and bandit's test ids
+# (B1xx-B7xx) share a prefix.
+EQUIVALENCE_CLASSES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "unused-import": {"ruff": ("F401",), "pylint": ("W0611",)},
+    "unused-variable": {"ruff": ("F841",), "pylint": ("W0612",)},
+    "unused-argument": {"ruff": ("ARG001", "ARG002"), "pylint": ("W0613",)},
+    "undefined-name": {"ruff": ("F821",), "pylint": ("E0602",)},
+    "wildcard-import": {"ruff": ("F403",), "pylint": ("W0401",)},
+    "reimported": {"ruff": ("F811",), "pylint": ("W0404",)},
+    "bare-except": {"ruff": ("E722",), "pylint": ("W0702",)},
+    "singleton-comparison": {"ruff": ("E711", "E712"), "pylint": ("C0121",)},
+    "line-too-long": {"ruff": ("E501",), "pylint": ("C0301",)},
+    "trailing-whitespace": {"ruff": ("W291", "W293"), "pylint": ("C0303",)},
+    "missing-final-newline": {"ruff": ("W292",), "pylint": ("C0304",)},
+    "multiple-statements": {"ruff": ("E701", "E702", "E703"), "pylint": ("C0321",)},
+    "mutable-default": {"ruff": ("B006",), "pylint": ("W0102",)},
+    "f-string-without-placeholders": {"ruff": ("F541",), "pylint": ("W1309",)},
+    "eval": {"ruff": ("S307",), "pylint": ("W0123",), "bandit": ("B307",)},
+    "exec": {"ruff": ("S102",), "pylint": ("W0122",), "bandit": ("B102",)},
+    "assert": {"ruff": ("S101",), "bandit": ("B101",)},
+    "hardcoded-password": {"ruff": ("S105", "S106"), "bandit": ("B105", "B106")},
+    "subprocess-shell": {"ruff": ("S602",), "bandit": ("B602",)},
+    "pickle": {"ruff": ("S301",), "bandit": ("B301",)},
+    "yaml-load": {"ruff": ("S506",), "bandit": ("B506",)},
+    "too-complex": {"ruff": ("C901",), "pylint": ("R1260",)},
+}
+
+# Radon reports one RADON-<rank> per block; any rank is a complexity finding
+COMPLEXITY_PREFIX = "RADON-"
+
+# On a duplicate the specialised linter's issue is kept (it carries
+# severity/confidence or the complexity score) and the others become sources
+LINTER_PRIORITY = {"bandit": 0, "radon": 1, "ruff": 2, "pylint": 2}
+
+_CLASS_OF: Dict[Tuple[str, str], str] = {
+    (linter, code): name
+    for name, by_linter in EQUIVALENCE_CLASSES.items()
+    for linter, codes in by_linter.items()
+    for code in codes
+}
+
+
+def equivalence_class(issue: Dict[str, Any]) -> Optional[str]:
+    linter = issue.get("linter") or ""
+    code = issue.get("code") or ""
+    if linter == "radon" and code.startswith(COMPLEXITY_PREFIX):
+        return "too-complex"
+    return _CLASS_OF.get((linter, code))
+
+
+def _source(issue: Dict[str, Any]) -> Dict[str, Any]:
+    return {"linter": issue.get("linter"), "code": issue.get("code"), "message": issue.get("message")}
+
+
+def _merge(group: List[Dict[str, Any]]) -> List[int]:
+    """Fold a duplicate group into its highest-priority issue; returns the indices to drop"""
+    ranked = sorted(range(len(group)), key=lambda i: LINTER_PRIORITY.get(group[i].get("linter"), 3))
+    group[ranked[0]]["sources"] = [_source(group[i]) for i in ranked]
+    return ranked[1:]
+
+
+def dedupe_sections(sections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Merge issues that different linters report for the same problem on the same line
+
+    Issues are hash-joined on (file, line, equivalence class). Within a
+    join key each linter's findings are paired up in column order, so two
+    unused imports on one line stay two issues. A merged issue keeps the
+    section of its highest-priority linter and lists every report in
+    ``sources``; the duplicates are dropped from their sections.
+    """
+    buckets: Dict[Tuple[str, int, str], Dict[str, List[Tuple[str, int]]]] = defaultdict(lambda: defaultdict(list))
+    for section, issues in sections.items():
+        for position, issue in enumerate(issues):
+            name = equivalence_class(issue)
+            if name is not None:
+                key = (issue.get("file") or "", issue.get("line") or 0, name)
+                buckets[key][issue.get("linter") or ""].append((section, position))
+
+    dropped: Dict[str, set] = defaultdict(set)
+    for by_linter in buckets.values():
+        if len(by_linter) < 2:
+            continue
+        for entries in by_linter.values():
+            entries.sort(key=lambda entry: sections[entry[0]][entry[1]].get("column") or 0)
+        for rank in range(max(len(entries) for entries in by_linter.values())):
+            members = [entries[rank] for entries in by_linter.values() if rank < len(entries)]
+            if len(members) < 2:
+                continue
+            for i in _merge([sections[section][position] for section, position in members]):
+                section, position = members[i]
+                dropped[section].add(position)
+
+    return {
+        section: [issue for position, issue in enumerate(issues) if position not in dropped[section]]
+        for section, issues in sections.items()
+    }
+
+
+def dedupe_issues(issues: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """``dedupe_sections`` for a single flat list"""
+    return dedupe_sections({"issues": list(issues)})["issues"]
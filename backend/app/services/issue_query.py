@@ -0,0 +1,193 @@
+# backend/app/services/issue_query.py
+import base64
+from collections import Counter
+from bisect import bisect_right
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.models.issue_table import IssueTable
+
+SECTIONS = ("security_scan", "main_analysis", "complexity_analysis")
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+ALL_SECTIONS = "*"  # cursor scope of a walk across every section
+
+
+class CursorConflict(ValueError):
+    """The cursor was issued for a different section than the one requested"""
+
+
+class CursorExpired(ValueError):
+    """The table the cursor points into has been replaced since it was issued"""
+
+
+class Cursor(NamedTuple):
+    scope: str  # section the walk is confined to, or ALL_SECTIONS
+    section: str
+    generation: int
+    row: int
+
+
+def encode_cursor(scope: str, section: str, generation: int, row: int) -> str:
+    text = f"{scope}:{section}:{generation}:{row}"
+    return base64.urlsafe_b64encode(text.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Cursor]:
+    """Inverse of encode_cursor; raises ValueError for anything malformed"""
+    if not cursor:
+        return None
+    padded = cursor + "=" * (-len(cursor) % 4)
+    parts = base64.urlsafe_b64decode(padded.encode()).decode().split(":")
+    if len(parts) != 4:
+        raise ValueError("Invalid cursor")
+    scope, section, generation, row = parts
+    if section not in SECTIONS or scope not in (ALL_SECTIONS, section):
+        raise ValueError("Invalid cursor")
+    return Cursor(scope, section, int(generation), int(row))
+
+
+def section_tables(result: Dict[str, Any], section: Optional[str] = None) -> List[Tuple[str, IssueTable]]:
+    names = [section] if section else SECTIONS
+    tables = []
+    for name in names:
+        issues = (result.get(name) or {}).get("issues")
+        if isinstance(issues, IssueTable):
+            tables.append((name, issues))
+    return tables
+
+
+def paginate(
+    result: Dict[str, Any],
+    section: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    **filters: Optional[str]
+) -> Dict[str, Any]:
+    """One page of issues across sections, rendering display strings for that page only.
+
+    The cursor records the walk's scope, the last row returned and the
+    generation of its table. A cursor confined to one section stays there
+    when followed without ``section``; following it under another section
+    raises CursorConflict, and following it after its table was replaced
+    raises CursorExpired.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    position = decode_cursor(cursor)
+    if position is not None and position.scope != ALL_SECTIONS:
+        if section not in (None, position.scope):
+            raise CursorConflict("Cursor belongs to another section")
+        section = position.scope
+    elif position is not None and section is not None:
+        raise CursorConflict("Cursor belongs to an all-section walk")
+    scope = section or ALL_SECTIONS
+    filters = {key: value for key, value in filters.items() if value is not None}
+
+    page: List[Dict[str, Any]] = []
+    totals: Dict[str, int] = {}
+    started = position is None
+    last: Optional[Tuple[str, int, int]] = None
+    has_more = False
+
+    for name, table in section_tables(result, section):
+        rows: Sequence[int] = table.filter(**filters)
+        totals[name] = len(rows)
+        if last is not None:
+            has_more = has_more or len(rows) > 0
+            continue
+
+        start = 0
+        if not started:
+            if name != position.section:
+                continue
+            if table.generation != position.generation:
+                raise CursorExpired("Issues changed since this cursor was issued")
+            started = True
+            start = bisect_right(rows, position.row)
+
+        for row in rows[start:start + limit - len(page)]:
+            issue = table.row(row)
+            issue["section"] = name
+            page.append(issue)
+            if len(page) == limit:
+                last = (name, table.generation, row)
+                has_more = row != rows[-1]
+
+    if not started:
+        raise CursorExpired("Issues changed since this cursor was issued")
+
+    return {
+        "issues": page,
+        "next_cursor": encode_cursor(scope, *last) if last and has_more else None,
+        "total": sum(totals.values()),
+        "sections": totals
+    }
+
+
+def first_page(section: Dict[str, Any], name: str, page_size: int) -> Dict[str, Any]:
+    """Section payload holding only its first page plus the cursor for the rest"""
+    table = section.get("issues")
+    if not isinstance(table, IssueTable):
+        return section
+    rows = range(min(page_size, len(table)))
+    return {
+        **section,
+        "issues": table.to_dicts(rows),
+        "total": len(table),
+        "next_cursor": encode_cursor(name, name, table.generation, rows[-1]) if len(table) > page_size else None
+    }
+
+
+FACET_FIELDS = ("file", "code", "severity", "type")
+
+
+def facet_counts(
+    result: Dict[str, Any],
+    fields: Sequence[str] = FACET_FIELDS,
+    section: Optional[str] = None,
+    **filters: Optional[str]
+) -> Dict[str, Dict[str, int]]:
+    """Issue counts per value of each facet field, summed over sections.
+
+    Unfiltered counts come straight from posting-list lengths; with filters
+    only the matching rows are counted.
+    """
+    filters = {key: value for key, value in filters.items() if value is not None}
+    facets: Dict[str, Counter] = {field: Counter() for field in fields}
+    for _, table in section_tables(result, section):
+        if not filters:
+            for field in fields:
+                facets[field].update(table.index.counts(field))
+            continue
+        rows = table.filter(**filters)
+        for field in fields:
+            column = getattr(table, field)
+            counts = Counter(column.ids[i] for i in rows)
+            facets[field].update({column.values[k]: n for k, n in counts.items() if k})
+    return {field: dict(counts.most_common()) for field, counts in facets.items()}
+
+
+def top_files(result: Dict[str, Any], limit: int = 10, section: Optional[str] = None) -> List[Dict[str, Any]]:
+    counts: Counter = Counter()
+    for _, table in section_tables(result, section):
+        counts.update(table.index.counts("file"))
+    return [{"file": file, "count": count} for file, count in counts.most_common(limit)]
+
+
+def issues_in_lines(
+    result: Dict[str, Any],
+    file: str,
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+    section: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Issues in ``file`` between ``start`` and ``end`` (inclusive), ordered by line"""
+    issues = []
+    for name, table in section_tables(result, section):
+        for row in table.index.lines(file, start, end):
+            issue = table.row(row)
+            issue["section"] = name
+            issues.append(issue)
+    issues.sort(key=lambda issue: issue.get("line", 0))
+    return issues
@@ -0,0 +1,234 @@
+# backend/app/services/linter_config.py
+import configparser
+import copy
+import hashlib
+import io
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import toml
+
+logger = logging.getLogger(__name__)
+
+CONFIG_ROOT = Path(os.getenv("PINK_CODED_CONFIG_DIR", "/tmp/pink-coded-config"))
+CONFIGURABLE_LINTERS = ("ruff", "pylint", "bandit")
+
+
+class LinterConfig:
+    @staticmethod
+    def get_ruff_config() -> Dict[str, Any]:
+        return {
+            "lint": {
+                "select": ["E", "F", "W", "B", "I", "UP", "D"],
+                "ignore": ["E501", "D203", "D212"],
+                "per-file-ignores": {
+                    "__init__.py": ["F401"],
+                    "tests/*": ["S101"]
+                }
+            }
+        }
+
+    @staticmethod
+    def get_pylint_config() -> Dict[str, Any]:
+        return {
+            "MASTER": {
+                "load-plugins": "pylint.extensions.mccabe"
+            },
+            "MESSAGES CONTROL": {
+                "disable": "missing-docstring,too-few-public-methods,invalid-name"
+            }
+        }
+
+    @staticmethod
+    def get_bandit_config() -> Dict[str, Any]:
+        return {
+            'target': ['*'],
+            'recursive': True,
+            'confidence': 'low',
+            'severity': 'low',
+            'tests': [],
+            'skips': []
+        }
+
+
+DEFAULT_CONFIGS = {
+    "ruff": LinterConfig.get_ruff_config,
+    "pylint": LinterConfig.get_pylint_config,
+    "bandit": LinterConfig.get_bandit_config,
+}
+
+# Per project type adjustments layered over the defaults
+PROJECT_OVERRIDES: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "embedded": {
+        # Board modules (machine, utime, ...) are never importable on the server
+        "pylint": {"MESSAGES CONTROL": {"disable": "import-error"}}
+    },
+}
+
+# Rule lists that layers add to rather than replace, so an override never
+# turns a default exclusion back on. Pylint keeps its lists comma-joined.
+ADDITIVE_KEYS = ("extend-select", "extend-ignore", "disable", "skips")
+
+
+@dataclass(frozen=True)
+class MaterializedConfig:
+    linter: str
+    path: Path
+    digest: str
+
+
+def _union(base: Any, extra: Any) -> Any:
+    """Ordered union of two rule lists, both Python lists or both comma-joined strings"""
+    if isinstance(base, str):
+        return ",".join(_union(base.split(","), extra.split(",")))
+    return list(base) + [item for item in extra if item not in base]
+
+
+def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    merged = copy.deepcopy(base)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        elif key in ADDITIVE_KEYS and key in merged:
+            merged[key] = _union(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _render(linter: str, config: Dict[str, Any]) -> Tuple[str, str]:
+    """Serialize a config deterministically; returns (text, file suffix)"""
+    if linter == "ruff":
+        return toml.dumps(config), ".toml"
+    if linter == "pylint":
+        parser = configparser.ConfigParser()
+        parser.read_dict(config)
+        buffer = io.StringIO()
+        parser.write(buffer)
+        return buffer.getvalue(), ".pylintrc"
+    if linter == "bandit":
+        return json.dumps(config, sort_keys=True), ".bandit"
+    raise ValueError(f"Unsupported linter: {linter}")
+
+
+_materialized: Dict[str, MaterializedConfig] = {}
+_by_request: Dict[Tuple[str, str], MaterializedConfig] = {}
+_lock = Lock()
+
+
+def _write_immutable(path: Path, text: str) -> None:
+    if path.exists():
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+    os.chmod(tmp_name, 0o444)
+    # Concurrent writers produce identical bytes, so whichever rename lands last is fine
+    os.replace(tmp_name, path)
+
+
+def materialize_config(linter: str, overrides: Optional[Dict[str, Any]] = None) -> MaterializedConfig:
+    """Return the content-hashed config file for linter + overrides, writing it at most once"""
+    linter = getattr(linter, "value", linter)
+    request_key = (linter, json.dumps(overrides or {}, sort_keys=True))
+    cached = _by_request.get(request_key)
+    if cached is not None:
+        return cached
+
+    config = DEFAULT_CONFIGS[linter]()
+    if overrides:
+        config = _deep_merge(config, overrides)
+    text, suffix = _render(linter, config)
+    digest = hashlib.sha256(f"{linter}\0{text}".encode()).hexdigest()
+
+    with _lock:
+        materialized = _materialized.get(digest)
+        if materialized is None:
+            path = CONFIG_ROOT / f"{linter}-{digest[:16]}{suffix}"
+            _write_immutable(path, text)
+            materialized = MaterializedConfig(linter=linter, path=path, digest=digest)
+            _materialized[digest] = materialized
+        _by_request[request_key] = materialized
+        return materialized
+
+
+def preference_overrides(preferences: Optional[Dict[str, str]]) -> Dict[str, Dict[str, Any]]:
+    """Map user preferences such as ``{"ruff.ignore": "D100,E741"}`` onto config overrides
+
+    Ruff preferences extend the default rule lists and pylint's ``disable``
+    is merged with the default one, so a preference never drops a default.
+    """
+    overrides: Dict[str, Dict[str, Any]] = {}
+    for key, value in (preferences or {}).items():
+        linter, _, option = key.partition(".")
+        values = [v.strip() for v in value.split(",") if v.strip()]
+        if linter == "ruff" and option in ("select", "ignore"):
+            overrides.setdefault("ruff", {}).setdefault("lint", {})[f"extend-{option}"] = values
+        elif linter == "pylint" and option in ("disable", "enable"):
+            overrides.setdefault("pylint", {}).setdefault("MESSAGES CONTROL", {})[option] = ",".join(values)
+        elif linter == "bandit" and option in ("skips", "tests"):
+            overrides.setdefault("bandit", {})[option] = values
+    return overrides
+
+
+def linter_preferences(preferences: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """The ``<linter>.<option>`` entries of a user's preferences, the only ones that shape configs"""
+    return {
+        key: value for key, value in (preferences or {}).items()
+        if key.partition(".")[0] in CONFIGURABLE_LINTERS
+    }
+
+
+def configs_for_project(
+    project_type: Optional[str] = None,
+    preferences: Optional[Dict[str, str]] = None
+) -> Dict[str, MaterializedConfig]:
+    """Materialized configs for every configurable linter given project type and preferences"""
+    project_type = getattr(project_type, "value", project_type)
+    layers = [PROJECT_OVERRIDES.get(project_type or "", {}), preference_overrides(preferences)]
+    configs = {}
+    for linter in CONFIGURABLE_LINTERS:
+        overrides: Dict[str, Any] = {}
+        for layer in layers:
+            overrides = _deep_merge(overrides, layer.get(linter, {}))
+        configs[linter] = materialize_config(linter, overrides or None)
+    return configs
+
+
+# Quick tier: one ruff run stands in for pylint and bandit, so it gets their rule families
+QUICK_RUFF_OVERRIDES: Dict[str, Any] = {"lint": {"extend-select": ["S", "PL", "ARG"]}}
+
+
+def quick_ruff_config(
+    project_type: Optional[str] = None,
+    preferences: Optional[Dict[str, str]] = None
+) -> MaterializedConfig:
+    """Ruff config for the quick tier: the project's ruff config with the broad rule set on top"""
+    project_type = getattr(project_type, "value", project_type)
+    overrides = _deep_merge(
+        PROJECT_OVERRIDES.get(project_type or "", {}).get("ruff", {}),
+        preference_overrides(preferences).get("ruff", {})
+    )
+    return materialize_config("ruff", _deep_merge(overrides, QUICK_RUFF_OVERRIDES))
+
+
+def config_set_hash(configs: Dict[str, MaterializedConfig]) -> str:
+    """Stable hash over a set of configs, usable as a cache-key component"""
+    joined = "\0".join(f"{name}={configs[name].digest}" for name in sorted(configs))
+    return hashlib.sha256(joined.encode()).hexdigest()[:16]
+
+
+def materialize_default_configs(project_types: Iterable[str] = ()) -> Dict[str, MaterializedConfig]:
+    """Write the default and per-project-type configs once, at startup"""
+    defaults = configs_for_project()
+    for project_type in project_types:
+        configs_for_project(project_type)
+    logger.info(f"Linter configs ready in {CONFIG_ROOT} (hash {config_set_hash(defaults)})")
+    return defaults
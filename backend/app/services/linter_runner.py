@@ -0,0 +1,253 @@
+# backend/app/services/linter_runner.py
+import logging
+import os
+import resource
+import signal
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.services.metrics import LINTER_CPU_SECONDS
+from app.services.parse_linter import LinterType, parse_linter_output, parse_linter_stream
+from app.services.pylint_pool import PylintWorkerPool
+from app.services.tracing import current_span, span, traced
+
+logger = logging.getLogger(__name__)
+
+STDERR_LIMIT = 64 * 1024
+# Per linter process (and inherited by its children); 0 leaves the limit unset
+CPU_LIMIT_SECONDS = int(os.getenv("PINK_CODED_LINTER_CPU_SECONDS", "300"))
+MEMORY_LIMIT_MB = int(os.getenv("PINK_CODED_LINTER_MEMORY_MB", "2048"))
+CPU_LIMIT_GRACE = 5  # seconds between SIGXCPU and the hard-limit SIGKILL
+
+
+@dataclass
+class LinterRun:
+    """Outcome of one linter subprocess whose stdout was parsed as it streamed"""
+    returncode: Optional[int]
+    issues: List[Dict[str, Any]] = field(default_factory=list)
+    stderr: str = ""
+    output_bytes: int = 0
+    duration: float = 0.0
+    timed_out: bool = False
+    cancelled: bool = False
+    parse_error: Optional[str] = None
+    parse_seconds: float = 0.0
+    cpu_user: float = 0.0
+    cpu_system: float = 0.0
+    max_rss_kb: int = 0
+
+
+class _CountingReader:
+    """Counts bytes and time spent blocked on the pipe (the rest is parsing)"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+        self.wait_seconds = 0.0
+
+    def read(self, size: int) -> str:
+        started = time.perf_counter()
+        chunk = self.stream.read(size)
+        self.wait_seconds += time.perf_counter() - started
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def _drain(stream, sink: List[str]) -> None:
+    """Keep only the tail of stderr so chatty tools cannot grow memory"""
+    kept = 0
+    for line in stream:
+        sink.append(line)
+        kept += len(line)
+        while kept > STDERR_LIMIT and len(sink) > 1:
+            kept -= len(sink.pop(0))
+
+
+def apply_limits(pid: int) -> None:
+    """Cap a child's CPU time and address space
+
+    Set with prlimit right after the spawn rather than in a preexec_fn,
+    which is unsafe in a threaded server; the few milliseconds before it
+    lands are not worth protecting.
+    """
+    try:
+        if CPU_LIMIT_SECONDS > 0:
+            resource.prlimit(pid, resource.RLIMIT_CPU, (CPU_LIMIT_SECONDS, CPU_LIMIT_SECONDS + CPU_LIMIT_GRACE))
+        if MEMORY_LIMIT_MB > 0:
+            limit = MEMORY_LIMIT_MB * 1024 * 1024
+            resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+    except (OSError, ValueError) as e:
+        # Already exited, or limits above the server's own hard limit
+        logger.debug("Could not limit pid %s: %s", pid, e)
+
+
+def kill_group(pgid: int) -> None:
+    """SIGKILL a linter and every process it started"""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _wait_exited(pid: int) -> None:
+    """Block until the child exits but leave it unreaped
+
+    While the zombie exists its pid, and so its process group id, cannot
+    be reused, which keeps a concurrent ``kill_group`` safe.
+    """
+    try:
+        os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+    except ChildProcessError:
+        pass
+
+
+def _reap(proc: subprocess.Popen, run: "LinterRun") -> None:
+    """Wait for the child with wait4 so its own CPU time and peak RSS are known"""
+    try:
+        _, status, usage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        proc.wait()
+        return
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    run.cpu_user = usage.ru_utime
+    run.cpu_system = usage.ru_stime
+    run.max_rss_kb = usage.ru_maxrss
+
+
+@traced("linter.subprocess")
+def run_linter_process(
+    cmd: List[str],
+    linter: LinterType,
+    cwd: Path,
+    base_path: Path,
+    timeout: float,
+    cancel: Optional[threading.Event] = None
+) -> LinterRun:
+    """Run ``cmd`` and parse its JSON stdout incrementally straight from the pipe.
+
+    Blocking; call it from a worker thread. The child runs in its own
+    process group under ``apply_limits``; on timeout or when ``cancel`` is
+    set the whole group is killed. Issues parsed before that, or before a
+    malformed tail, are kept.
+    """
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+        process_group=0
+    )
+    apply_limits(proc.pid)
+    stderr_lines: List[str] = []
+    stderr_thread = threading.Thread(target=_drain, args=(proc.stderr, stderr_lines), daemon=True)
+    stderr_thread.start()
+
+    # Set by the caller to cancel, or by us once the child is reaped
+    stop = cancel if cancel is not None else threading.Event()
+    finished = threading.Event()
+    timed_out = threading.Event()
+    cancelled = threading.Event()
+    # Orders the kill against reaping: the group is only signalled while its leader is unreaped
+    reap_lock = threading.Lock()
+
+    def watch():
+        expired = not stop.wait(timeout)
+        with reap_lock:
+            if finished.is_set():
+                return
+            (timed_out if expired else cancelled).set()
+            kill_group(proc.pid)
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+
+    run = LinterRun(returncode=None)
+    reader = _CountingReader(proc.stdout)
+    parse_started = time.perf_counter()
+    try:
+        with span("parse", linter=getattr(linter, "value", linter)) as parse_span:
+            for issue in parse_linter_stream(reader.read, linter, base_path):
+                run.issues.append(issue)
+            parse_span.set(issues=len(run.issues))
+    except Exception as e:
+        run.parse_error = str(e)
+    finally:
+        run.parse_seconds = max(0.0, time.perf_counter() - parse_started - reader.wait_seconds)
+        # Drain whatever is left so the child never blocks on a full pipe
+        while reader.read(64 * 1024):
+            pass
+        _wait_exited(proc.pid)
+        with reap_lock:
+            finished.set()
+        stop.set()
+        watcher.join()
+        _reap(proc, run)
+        stderr_thread.join(timeout=5)
+
+    run.returncode = proc.returncode
+    run.stderr = "".join(stderr_lines)
+    run.output_bytes = reader.bytes_read
+    run.duration = time.monotonic() - started
+    run.timed_out = timed_out.is_set()
+    run.cancelled = cancelled.is_set()
+    LINTER_CPU_SECONDS.inc(run.cpu_user + run.cpu_system, linter=getattr(linter, "value", linter))
+    if run.parse_error and not (run.timed_out or run.cancelled):
+        logger.error(f"Error parsing {linter} output: {run.parse_error}")
+    current_span().set(
+        returncode=run.returncode,
+        output_bytes=run.output_bytes,
+        wall_seconds=run.duration,
+        cpu_user_seconds=run.cpu_user,
+        cpu_system_seconds=run.cpu_system,
+        max_rss_kb=run.max_rss_kb,
+        parse_seconds=run.parse_seconds,
+        timed_out=run.timed_out,
+        cancelled=run.cancelled
+    )
+    return run
+
+
+@traced("linter.pool")
+def run_linter_in_pool(
+    pool: PylintWorkerPool,
+    cmd: List[str],
+    linter: LinterType,
+    cwd: Path,
+    base_path: Path,
+    timeout: float,
+    cancel: Optional[threading.Event] = None,
+    deadline: Optional[float] = None
+) -> LinterRun:
+    """Run a pylint ``cmd`` on a warm pool worker; raises PoolUnavailable on pool failure"""
+    result = pool.run(cmd[1:], cwd, timeout, cancel, deadline)
+    run = LinterRun(
+        returncode=result.returncode,
+        output_bytes=len(result.output),
+        duration=result.duration,
+        timed_out=result.timed_out,
+        cancelled=result.cancelled,
+        cpu_user=result.cpu_seconds,
+        max_rss_kb=result.rss_kb
+    )
+    LINTER_CPU_SECONDS.inc(result.cpu_seconds, linter=getattr(linter, "value", linter))
+    if not (result.timed_out or result.cancelled):
+        parse_started = time.perf_counter()
+        run.issues = parse_linter_output(result.output, linter, base_path)
+        run.parse_seconds = time.perf_counter() - parse_started
+    current_span().set(
+        returncode=run.returncode,
+        output_bytes=run.output_bytes,
+        wall_seconds=run.duration,
+        cpu_user_seconds=run.cpu_user,
+        max_rss_kb=run.max_rss_kb,
+        timed_out=run.timed_out
+    )
+    return run
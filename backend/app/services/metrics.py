@@ -0,0 +1,248 @@
+# backend/app/services/metrics.py
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+# Seconds; spans a cached template lookup up to a slow full-project lint
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name}{labels} {_number(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self):
+        for key, value in sorted(self._values.items()):
+            yield self.name, _label_text(self.label_names, key), value
+
+
+class Gauge(Metric):
+    """Set directly, or computed at scrape time by ``callback``.
+
+    A callback returns a single value, or ``{label values: value}`` for a
+    labelled gauge.
+    """
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        callback: Optional[Callable[[], Union[float, Dict[LabelValues, float]]]] = None
+    ):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def _current(self) -> Dict[LabelValues, float]:
+        if self.callback is None:
+            return self._values
+        value = self.callback()
+        return value if isinstance(value, dict) else {(): value}
+
+    def value(self, **labels: str) -> float:
+        return self._current().get(self._key(labels), 0)
+
+    def samples(self):
+        for key, value in sorted(self._current().items()):
+            yield self.name, _label_text(self.label_names, key), value
+
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram; ``observe`` is a bisect and three adds"""
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # label values -> [per-bucket counts, sum, count]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self):
+        for key, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _label_text(self.label_names, key, f'le="{_number(bound)}"')
+                yield f"{self.name}_bucket", labels, cumulative
+            labels = _label_text(self.label_names, key)
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        existing = self._metrics.get(metric.name)
+        if existing is not None:
+            return existing
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, help, labels, callback))
+
+    def histogram(self, name: str, help: str, labels: Sequence[str] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labels, buckets))
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            try:
+                lines.extend(metric.render())
+            except Exception:
+                # A failing scrape-time callback must not break the endpoint
+                continue
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+CONTENT_TYPE = "text/plain; version=0.0.4"  # Starlette appends the charset
+
+LINTER_SECONDS = REGISTRY.histogram(
+    "pink_linter_duration_seconds", "Wall time of one linter subprocess", ["linter"])
+LINTER_PARSE_SECONDS = REGISTRY.histogram(
+    "pink_linter_parse_seconds", "CPU time spent parsing linter output", ["linter"])
+LINTER_OUTPUT_BYTES = REGISTRY.counter(
+    "pink_linter_output_bytes_total", "Bytes of linter JSON output parsed", ["linter"])
+LINTER_RUNS = REGISTRY.counter(
+    "pink_linter_runs_total", "Linter runs by outcome", ["linter", "outcome"])
+LINTER_CPU_SECONDS = REGISTRY.counter(
+    "pink_linter_cpu_seconds_total", "CPU seconds (user + system) used by linters on this node", ["linter"])
+LINTERS_IN_FLIGHT = REGISTRY.gauge(
+    "pink_linters_in_flight", "Linter subprocesses currently running")
+UPLOAD_SECONDS = REGISTRY.histogram(
+    "pink_upload_seconds", "Time to receive an uploaded archive")
+EXTRACT_SECONDS = REGISTRY.histogram(
+    "pink_extract_seconds", "Time to extract an uploaded archive")
+ANALYSIS_SECONDS = REGISTRY.histogram(
+    "pink_analysis_seconds", "End-to-end run_linter_analysis time")
+EXPLANATION_SECONDS = REGISTRY.histogram(
+    "pink_explanation_seconds", "Explanation latency by source", ["source"])
+CACHE_REQUESTS = REGISTRY.counter(
+    "pink_cache_requests_total", "Cache lookups by cache and result (hit/miss)", ["cache", "result"])
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def _cache_hit_ratios() -> Dict[LabelValues, float]:
+    totals: Dict[str, List[float]] = {}
+    for (cache, result), count in list(CACHE_REQUESTS._values.items()):
+        hits_total = totals.setdefault(cache, [0, 0])
+        hits_total[1] += count
+        if result == "hit":
+            hits_total[0] += count
+    return {(cache,): hits / total for cache, (hits, total) in totals.items() if total}
+
+
+CACHE_HIT_RATIO = REGISTRY.gauge(
+    "pink_cache_hit_ratio", "Hits / lookups since start, per cache", ["cache"], callback=_cache_hit_ratios)
+
+
+def explanation_source(source: Optional[str]) -> str:
+    """Collapse model names (e.g. ``deepseek-chat``) into one label value"""
+    source = source or "unknown"
+    return "deepseek" if source.startswith("deepseek") else source
@@ -1,17 +1,20 @@
-from typing import List, Dict, Any, Optional
+import io
 import json
-from pathlib import Path
+import logging
+import os
 from enum import Enum
-from pydantic import BaseModel
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.models.issue import IssueType
+from app.services.issue_dedup import dedupe_issues
+from app.services.tracing import traced
+
+logger = logging.getLogger(__name__)
+
+READ_SIZE = 64 * 1024
+_WHITESPACE = " \t\r\n"
 
-class Issue(BaseModel):
-    """Standardized issue representation"""
-    code: str
-    message: str
-    file: str
-    line: int
-    severity: str = "warning"
-    linter: str = "unknown"
 
 class LinterType(str, Enum):
     RUFF = "ruff"
@@ -19,187 +22,313 @@ class LinterType(str, Enum):
     BANDIT = "bandit"
     RADON = "radon"
 
-class IssueSeverity(str, Enum):
-    ERROR = "error"
-    WARNING = "warning"
-    INFO = "info"
-    SECURITY = "security"
-    COMPLEXITY = "complexity"
-    CONVENTION = "convention"
-    REFACTOR = "refactor"
 
+# Kept for callers that imported the severity names from here
+IssueSeverity = IssueType
+
+
+class JsonStream:
+    """Pull parser that decodes a JSON document one element at a time.
+
+    Only the structure being walked (the top-level array or object and
+    whatever containers the caller descends into) is tracked; each element
+    is decoded with ``json.JSONDecoder.raw_decode`` as soon as its bytes
+    have arrived, so memory stays bounded by the largest single element.
+    """
+
+    def __init__(self, read: Callable[[int], str], read_size: int = READ_SIZE):
+        self._read = read
+        self._read_size = read_size
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, at_least: int = 0) -> bool:
+        if self.eof:
+            return False
+        chunk = self._read(max(self._read_size, at_least))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            buf, pos = self.buf, self.pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} but found {found!r}")
+        self.pos += 1
+
+    def seek_document(self) -> str:
+        """Skip any non-JSON preamble up to the first '[' or '{'"""
+        while True:
+            for i in range(self.pos, len(self.buf)):
+                if self.buf[i] in "[{":
+                    self.pos = i
+                    return self.buf[i]
+            self.pos = len(self.buf)
+            if not self._fill():
+                return ""
+
+    def value(self) -> Any:
+        self.peek()
+        pending = 0
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                # A number ending exactly at the buffer edge may continue in the next chunk
+                if end < len(self.buf) or self.eof or self.buf[end - 1] in '"]}el':
+                    self.pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            # Grow reads geometrically so huge values stay linear overall
+            pending = len(self.buf) - self.pos
+            if not self._fill(pending):
+                obj, end = self._decoder.raw_decode(self.buf, self.pos)
+                self.pos = end
+                return obj
+
+    def iter_array(self) -> Iterator[Any]:
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' but found {separator!r}")
+
+    def iter_object(self) -> Iterator[str]:
+        """Yield keys; the caller must consume exactly one value per key"""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' but found {separator!r}")
+
+
+class RelativePath:
+    """Strip a precomputed base prefix instead of calling Path.relative_to per issue"""
+
+    def __init__(self, base_path: Optional[Path]):
+        self.prefix = str(base_path).rstrip(os.sep) + os.sep if base_path else None
+        self._cache: Dict[str, str] = {}
+
+    def __call__(self, path: str) -> str:
+        rel = self._cache.get(path)
+        if rel is None:
+            rel = path[len(self.prefix):] if self.prefix and path.startswith(self.prefix) else path
+            self._cache[path] = rel
+        return rel
+
+
+PYLINT_TYPES = {
+    "error": IssueType.ERROR.value,
+    "fatal": IssueType.ERROR.value,
+    "warning": IssueType.WARNING.value,
+    "convention": IssueType.CONVENTION.value,
+    "refactor": IssueType.REFACTOR.value,
+    "info": IssueType.INFO.value,
+    "information": IssueType.INFO.value,
+}
+
+
+def iter_ruff_issues(stream: JsonStream, rel: RelativePath) -> Iterator[Dict[str, Any]]:
+    """Parse Ruff JSON output into standardized format"""
+    for issue in stream.iter_array():
+        code = issue.get("code") or ""
+        location = issue.get("location") or {}
+        yield {
+            "type": IssueType.ERROR.value if code.startswith(("E", "F")) else IssueType.WARNING.value,
+            "file": rel(issue["filename"]),
+            "line": location.get("row", 0),
+            "column": location.get("column", 0),
+            "message": issue["message"],
+            "code": code,
+            "url": issue.get("url") or "",
+            "linter": LinterType.RUFF.value
+        }
+
+
+def iter_pylint_issues(stream: JsonStream, rel: RelativePath) -> Iterator[Dict[str, Any]]:
+    """Parse Pylint JSON output into standardized format"""
+    for issue in stream.iter_array():
+        yield {
+            "type": PYLINT_TYPES.get(issue["type"].lower(), IssueType.INFO.value),
+            "file": rel(issue["path"]),
+            "line": issue["line"],
+            "column": issue.get("column", 0),
+            "message": issue["message"],
+            "code": issue["message-id"],
+            "url": "",
+            "symbol": issue.get("symbol"),
+            "linter": LinterType.PYLINT.value
+        }
+
+
+def bandit_issue(issue: Dict[str, Any], rel: RelativePath) -> Dict[str, Any]:
+    """One Bandit result (``Issue.as_dict()`` layout) in standardized format"""
+    return {
+        "type": IssueType.SECURITY.value,
+        "file": rel(issue["filename"]),
+        "line": issue["line_number"],
+        "column": issue.get("col_offset", 0),
+        "message": issue["issue_text"],
+        "code": issue["test_id"],
+        "url": issue.get("more_info", ""),
+        "severity": issue["issue_severity"].lower(),
+        "confidence": issue["issue_confidence"].lower(),
+        "linter": LinterType.BANDIT.value
+    }
+
+
+def iter_bandit_issues(stream: JsonStream, rel: RelativePath) -> Iterator[Dict[str, Any]]:
+    """Parse Bandit JSON output, streaming only the ``results`` array"""
+    for key in stream.iter_object():
+        if key != "results":
+            stream.value()
+            continue
+        for issue in stream.iter_array():
+            yield bandit_issue(issue, rel)
+
+
+def radon_blocks(file_name: str, items: Any, rel: RelativePath) -> Iterator[Dict[str, Any]]:
+    if not isinstance(items, list):
+        # Radon reports unparsable files as {"error": "..."}
+        return
+    rel_path = rel(file_name)
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        complexity = item.get("complexity", 0)
+        if complexity <= 1:
+            continue
+        yield {
+            "type": IssueType.COMPLEXITY.value,
+            "file": rel_path,
+            "line": item.get("lineno", 0),
+            "column": item.get("col_offset", 0),
+            "message": f"{item.get('type', 'item').title()} '{item.get('name', '')}' (complexity: {complexity})",
+            "code": f"RADON-{item.get('rank', 'U')}",
+            "complexity": complexity,
+            "severity": "high" if complexity > 10 else "medium",
+            "linter": LinterType.RADON.value
+        }
+
+
+def iter_radon_issues(stream: JsonStream, rel: RelativePath) -> Iterator[Dict[str, Any]]:
+    """Parse ``radon cc -j`` output ({file: [blocks]}); a legacy list layout is also accepted"""
+    if stream.peek() == "[":
+        for file_data in stream.iter_array():
+            blocks = file_data.get("methods", []) + file_data.get("classes", [])
+            yield from radon_blocks(file_data.get("filename", ""), blocks, rel)
+        return
+    for file_name in stream.iter_object():
+        yield from radon_blocks(file_name, stream.value(), rel)
+
+
+PARSERS = {
+    LinterType.RUFF: iter_ruff_issues,
+    LinterType.PYLINT: iter_pylint_issues,
+    LinterType.BANDIT: iter_bandit_issues,
+    LinterType.RADON: iter_radon_issues,
+}
+
+
+def parse_linter_stream(
+    read: Callable[[int], str],
+    linter: LinterType,
+    base_path: Optional[Path] = None
+) -> Iterator[Dict[str, Any]]:
+    """Incrementally parse linter JSON from a ``read(n)`` callable (e.g. a pipe)"""
+    parser = PARSERS.get(LinterType(getattr(linter, "value", linter)))
+    if parser is None:
+        raise ValueError(f"Unsupported linter: {linter}")
+    stream = JsonStream(read)
+    if not stream.seek_document():
+        return
+    yield from parser(stream, RelativePath(base_path))
+
+
+@traced("parse_linter_output")
 def parse_linter_output(
-    output: str, 
+    output: str,
     linter: LinterType,
     base_path: Optional[Path] = None
 ) -> List[Dict[str, Any]]:
     """
-    Parse linter output into standardized format with explanations support
-    
+    Parse linter output into standardized format
+
     Args:
         output: Raw linter output string
         linter: Type of linter (ruff/pylint/bandit/radon)
         base_path: Optional base path for relative file paths
-        
+
     Returns:
-        List of parsed issues with consistent structure
+        List of parsed issues following the ``Issue`` schema
     """
     if not output.strip():
         return []
 
+    issues: List[Dict[str, Any]] = []
     try:
-        if linter == LinterType.RUFF:
-            return parse_ruff_output(output, base_path)
-        elif linter == LinterType.PYLINT:
-            return parse_pylint_output(output, base_path)
-        elif linter == LinterType.BANDIT:
-            return parse_bandit_output(output, base_path)
-        elif linter == LinterType.RADON:
-            return parse_radon_output(output, base_path)
-        else:
-            raise ValueError(f"Unsupported linter: {linter}")
+        issues.extend(parse_linter_stream(io.StringIO(output).read, linter, base_path))
     except Exception as e:
-        print(f"Error parsing {linter} output: {str(e)}")
+        logger.error(f"Error parsing {linter} output: {e}")
         return []
+    return issues
 
-def parse_ruff_output(
-    output: str, 
-    base_path: Optional[Path] = None
-) -> List[Dict[str, Any]]:
-    """Parse Ruff JSON output into standardized format"""
-    try:
-        issues = json.loads(output)
-        parsed = []
-        
-        for issue in issues:
-            file_path = Path(issue["filename"])
-            rel_path = str(file_path.relative_to(base_path)) if base_path else issue["filename"]
-            
-            parsed.append({
-                "type": IssueSeverity.ERROR if issue["code"].startswith("E") 
-                       else IssueSeverity.WARNING,
-                "file": rel_path,
-                "line": issue["location"]["row"],
-                "column": issue["location"]["column"],
-                "message": issue["message"],
-                "code": issue["code"],
-                "url": f"https://beta.ruff.rs/docs/rules/{issue['code'].lower()}/",
-                "linter": LinterType.RUFF
-            })
-        return parsed
-    except Exception as e:
-        print(f"Ruff parse error: {str(e)}")
-        return []
 
-def parse_pylint_output(
-    output: str, 
-    base_path: Optional[Path] = None
-) -> List[Dict[str, Any]]:
-    """Parse Pylint JSON output into standardized format"""
-    try:
-        issues = json.loads(output)
-        parsed = []
-        
-        for issue in issues:
-            file_path = Path(issue["path"])
-            rel_path = str(file_path.relative_to(base_path)) if base_path else issue["path"]
-            
-            # Map Pylint types to our severity levels
-            severity = {
-                "error": IssueSeverity.ERROR,
-                "warning": IssueSeverity.WARNING,
-                "convention": IssueSeverity.CONVENTION,
-                "refactor": IssueSeverity.REFACTOR,
-                "information": IssueSeverity.INFO
-            }.get(issue["type"].lower(), IssueSeverity.INFO)
-            
-            parsed.append({
-                "type": severity,
-                "file": rel_path,
-                "line": issue["line"],
-                "column": issue.get("column", 0),
-                "message": issue["message"],
-                "code": issue["message-id"],
-                "symbol": issue["symbol"],
-                "linter": LinterType.PYLINT
-            })
-        return parsed
-    except Exception as e:
-        print(f"Pylint parse error: {str(e)}")
-        return []
+def parse_ruff_output(output: str, base_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    return parse_linter_output(output, LinterType.RUFF, base_path)
+
+
+def parse_pylint_output(output: str, base_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    return parse_linter_output(output, LinterType.PYLINT, base_path)
+
+
+def parse_bandit_output(output: str, base_path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    return parse_linter_output(output, LinterType.BANDIT, base_path)
 
-def parse_bandit_output(
-    output: str,
-    base_path: Optional[Path] = None
-) -> List[Dict[str, Any]]:
-    """Parse Bandit JSON output into standardized format"""
-    try:
-        data = json.loads(output)
-        parsed = []
-        
-        for issue in data.get("results", []):
-            file_path = Path(issue["filename"])
-            rel_path = str(file_path.relative_to(base_path)) if base_path else issue["filename"]
-            
-            parsed.append({
-                "type": IssueSeverity.SECURITY,
-                "file": rel_path,
-                "line": issue["line_number"],
-                "column": 0,
-                "message": issue["issue_text"],
-                "code": issue["test_id"],
-                "severity": issue["issue_severity"],
-                "confidence": issue["issue_confidence"],
-                "url": issue["more_info"],
-                "linter": LinterType.BANDIT
-            })
-        return parsed
-    except Exception as e:
-        print(f"Bandit parse error: {str(e)}")
-        return []
 
 def parse_radon_output(output: str, base_path: Optional[Path] = None) -> List[Dict[str, Any]]:
-    try:
-        if not output.strip():
-            return []
-
-        data = json.loads(output)  # Parse JSON
-        issues = []
-
-        for file_data in data:
-            file_path = Path(file_data["filename"])
-            rel_path = str(file_path.relative_to(base_path)) if base_path else file_data["filename"]
-
-            for method in file_data.get("methods", []):
-                issues.append({
-                    "type": "complexity",
-                    "file": rel_path,
-                    "line": method["lineno"],
-                    "message": f"Method '{method['name']}' has high complexity ({method['complexity']})",
-                    "code": f"RADON-M{method['complexity']}",
-                    "linter": "radon"
-                })
-
-            for cls in file_data.get("classes", []):
-                issues.append({
-                    "type": "complexity",
-                    "file": rel_path,
-                    "line": cls["lineno"],
-                    "message": f"Class '{cls['name']}' has high complexity ({cls['complexity']})",
-                    "code": f"RADON-C{cls['complexity']}",
-                    "linter": "radon"
-                })
-
-        return issues
-    except Exception as e:
-        print(f"Radon parse error: {e}")
-        return []
+    """Parse Radon complexity analysis output"""
+    return parse_linter_output(output, LinterType.RADON, base_path)
+
 
 def combine_issues(
     *issue_lists: List[List[Dict[str, Any]]]
 ) -> List[Dict[str, Any]]:
-    """Combine multiple issue lists into one with consistent structure"""
+    """Combine multiple issue lists into one, merging cross-linter duplicates"""
     combined = []
     for issues in issue_lists:
         combined.extend(issues)
-    return combined
\ No newline at end of file
+    return dedupe_issues(combined)
@@ -0,0 +1,131 @@
+# backend/app/services/pipeline_log.py
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fraction of analyses whose (truncated) payload is logged at DEBUG
+PAYLOAD_SAMPLE_RATE = float(os.getenv("PINK_CODED_LOG_SAMPLE_RATE", "0.01"))
+PAYLOAD_MAX_CHARS = int(os.getenv("PINK_CODED_LOG_PAYLOAD_CHARS", "4096"))
+LOG_QUEUE_SIZE = 10000
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_log_queue: Optional[queue.Queue] = None
+
+
+def log_queue_depth() -> int:
+    return _log_queue.qsize() if _log_queue is not None else 0
+
+
+def truncated_json(value: Any, limit: int = PAYLOAD_MAX_CHARS) -> str:
+    text = json.dumps(value, default=str)
+    if len(text) > limit:
+        return f"{text[:limit]}... ({len(text)} chars)"
+    return text
+
+
+class LazyJoin:
+    """Command lines are joined only when the record is emitted"""
+    __slots__ = ("parts",)
+
+    def __init__(self, parts):
+        self.parts = parts
+
+    def __str__(self) -> str:
+        return " ".join(str(part) for part in self.parts)
+
+
+class Fields:
+    """``key=value`` rendering of a summary record, formatted lazily"""
+    __slots__ = ("fields",)
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return " ".join(f"{key}={value}" for key, value in self.fields.items())
+
+
+def log_summary(log: logging.Logger, event: str, level: int = logging.INFO, **fields: Any) -> None:
+    """One structured summary line (counts, durations, sizes); fields also go on the record"""
+    if log.isEnabledFor(level):
+        log.log(level, "%s %s", event, Fields(fields), extra={"event": event, "fields": fields})
+
+
+def log_payload(
+    log: logging.Logger,
+    label: str,
+    build: Callable[[], Any],
+    rate: Optional[float] = None
+) -> None:
+    """Log a truncated payload at DEBUG for a random sample of calls only.
+
+    ``build`` runs only for sampled calls, and on the caller's thread so the
+    payload cannot change underneath the log listener.
+    """
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    if random.random() >= (PAYLOAD_SAMPLE_RATE if rate is None else rate):
+        return
+    log.debug("%s: %s", label, truncated_json(build()))
+
+
+def tail(text: str, limit: int = 2000) -> str:
+    return text if len(text) <= limit else f"...{text[-limit:]}"
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """Drops records instead of blocking the event loop when the queue is full"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The stock handler formats here, on the caller's thread; leave the
+        # message and its (lazy) args for the listener thread instead
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def start_log_listener(name: str = "app") -> None:
+    """Move formatting and I/O for ``name`` loggers onto a background thread.
+
+    Handlers already attached to the root logger are served from the queue;
+    the ``name`` logger then only enqueues records.
+    """
+    global _listener, _log_queue
+    if _listener is not None:
+        return
+    root = logging.getLogger()
+    handlers = [h for h in root.handlers if not isinstance(h, logging.handlers.QueueHandler)]
+    if not handlers:
+        handlers = [logging.StreamHandler()]
+
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_SIZE)
+    _log_queue = log_queue
+    target = logging.getLogger(name)
+    target.addHandler(_NonBlockingQueueHandler(log_queue))
+    target.propagate = False
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_log_listener(name: str = "app") -> None:
+    global _listener, _log_queue
+    if _listener is None:
+        return
+    _listener.stop()
+    _listener = None
+    _log_queue = None
+    target = logging.getLogger(name)
+    for handler in list(target.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler):
+            target.removeHandler(handler)
+    target.propagate = True
@@ -0,0 +1,124 @@
+# backend/app/services/project_diff.py
+import ast
+import hashlib
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+READ_SIZE = 1024 * 1024
+
+
+def _tree_files(root: Path, skip: Iterable[str] = ()) -> Dict[str, os.stat_result]:
+    skipped = set(skip)
+    files = {}
+    for dirpath, _, names in os.walk(root):
+        for name in names:
+            path = Path(dirpath, name)
+            rel = path.relative_to(root).as_posix()
+            if rel not in skipped:
+                files[rel] = path.stat()
+    return files
+
+
+def _digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(READ_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class TreeDiff:
+    added: List[str] = field(default_factory=list)
+    modified: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> List[str]:
+        """Files present in the new tree whose content is new"""
+        return self.added + self.modified
+
+
+def diff_trees(old_root: Path, new_root: Path, skip: Iterable[str] = ()) -> TreeDiff:
+    """Compare two project trees by content hash
+
+    Files hardlinked to the same blob are equal without being read, and
+    files of different size are different without being read.
+    """
+    old_files = _tree_files(old_root, skip)
+    new_files = _tree_files(new_root, skip)
+    diff = TreeDiff()
+    for rel, new_stat in sorted(new_files.items()):
+        old_stat = old_files.get(rel)
+        if old_stat is None:
+            diff.added.append(rel)
+        elif (old_stat.st_dev, old_stat.st_ino) == (new_stat.st_dev, new_stat.st_ino):
+            diff.unchanged += 1
+        elif old_stat.st_size != new_stat.st_size or _digest(old_root / rel) != _digest(new_root / rel):
+            diff.modified.append(rel)
+        else:
+            diff.unchanged += 1
+    diff.removed = sorted(set(old_files) - set(new_files))
+    return diff
+
+
+def module_name(rel_path: str) -> Optional[str]:
+    """Dotted module name for a project-relative ``.py`` path"""
+    if not rel_path.endswith(".py"):
+        return None
+    parts = rel_path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts) or None
+
+
+def _imported_modules(tree: ast.AST, package: str) -> Set[str]:
+    """Every module an import statement could refer to (``from a import b`` gives a and a.b)"""
+    modules: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".") if package else []
+                anchor = anchor[:len(anchor) - (node.level - 1)] if node.level > 1 else anchor
+                base = ".".join(part for part in (*anchor, base) if part)
+            if base:
+                modules.add(base)
+            modules.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names)
+    return modules
+
+
+def _matches(imported: str, module: str) -> bool:
+    # Projects are often rooted above their import root (src/pkg/...), so match on a dotted suffix
+    return module == imported or module.endswith("." + imported)
+
+
+def direct_importers(root: Path, targets: Iterable[str], candidates: Iterable[str]) -> List[str]:
+    """Files among ``candidates`` that import any of ``targets`` directly"""
+    modules = [m for m in (module_name(t) for t in targets) if m]
+    if not modules:
+        return []
+    # Cheap text filter before parsing: the importer must mention the module's last component
+    needles = {m.rsplit(".", 1)[-1].encode() for m in modules}
+    importers = []
+    for rel in candidates:
+        own = module_name(rel)
+        if own is None:
+            continue
+        try:
+            data = (root / rel).read_bytes()
+            if not any(needle in data for needle in needles):
+                continue
+            tree = ast.parse(data)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        package = own if rel.endswith("__init__.py") else own.rpartition(".")[0]
+        imported = _imported_modules(tree, package)
+        if any(_matches(name, module) for name in imported for module in modules):
+            importers.append(rel)
+    return importers
@@ -0,0 +1,245 @@
+# backend/app/services/pylint_pool.py
+import io
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 0 disables the pool and every pylint run is a fresh subprocess again
+POOL_SIZE = int(os.getenv("PINK_CODED_PYLINT_WORKERS", "2"))
+MAX_JOBS_PER_WORKER = int(os.getenv("PINK_CODED_PYLINT_MAX_JOBS", "50"))
+MAX_WORKER_RSS_MB = int(os.getenv("PINK_CODED_PYLINT_MAX_RSS_MB", "1024"))
+CANCEL_POLL = 0.25  # seconds between cancellation checks while a job runs
+
+
+def apply_memory_limit(pid: int) -> None:
+    """Address-space cap for a worker; no CPU cap since workers live across many jobs"""
+    from app.services.linter_runner import MEMORY_LIMIT_MB
+    if MEMORY_LIMIT_MB <= 0:
+        return
+    import resource
+    limit = MEMORY_LIMIT_MB * 1024 * 1024
+    try:
+        resource.prlimit(pid, resource.RLIMIT_AS, (limit, limit))
+    except (OSError, ValueError) as e:
+        logger.debug("Could not limit pylint worker %s: %s", pid, e)
+
+
+def _peak_rss_kb() -> int:
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _worker_main(conn) -> None:
+    """Worker loop: import pylint once, then lint whatever arrives on ``conn``"""
+    from pylint.lint import Run
+    from pylint.reporters import JSONReporter
+    import astroid
+
+    conn.send({"ready": True, "rss_kb": _peak_rss_kb()})
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        started = time.process_time()
+        try:
+            os.chdir(job["cwd"])
+            # Files may have changed since the last job; never reuse stale module ASTs
+            astroid.MANAGER.clear_cache()
+            output = io.StringIO()
+            # --output-format would replace our reporter with one writing to stdout
+            args = [arg for arg in job["args"] if not arg.startswith("--output-format")]
+            run = Run(args, reporter=JSONReporter(output), exit=False)
+            conn.send({
+                "output": output.getvalue(),
+                "returncode": run.linter.msg_status,
+                "cpu_seconds": time.process_time() - started,
+                "rss_kb": _peak_rss_kb()
+            })
+        except BaseException as e:
+            conn.send({"error": f"{type(e).__name__}: {e}", "rss_kb": _peak_rss_kb()})
+
+
+@dataclass
+class PoolResult:
+    output: str
+    returncode: Optional[int]
+    duration: float
+    cpu_seconds: float = 0.0
+    rss_kb: int = 0
+    timed_out: bool = False
+    cancelled: bool = False
+
+
+class PoolUnavailable(Exception):
+    """The pool could not run the job; callers fall back to a subprocess"""
+
+
+class _Worker:
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        apply_memory_limit(self.process.pid)
+        self.jobs = 0
+        self.ready = False
+        self.rss_kb = 0
+
+    def wait_ready(self, timeout: float) -> bool:
+        if not self.ready and self.conn.poll(timeout):
+            message = self.conn.recv()
+            self.ready = bool(message.get("ready"))
+            self.rss_kb = message.get("rss_kb", 0)
+        return self.ready
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+class PylintWorkerPool:
+    """Long-lived pylint processes that keep astroid and the checkers imported.
+
+    Jobs are the same argv the pylint CLI would get (the rcfile path is
+    content-hashed, so it doubles as the config hash). A worker is replaced
+    after ``max_jobs`` jobs, when its peak RSS passes ``max_rss_mb``, or
+    when a job times out.
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_jobs: int = MAX_JOBS_PER_WORKER,
+                 max_rss_mb: int = MAX_WORKER_RSS_MB, startup_timeout: float = 60.0):
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss_kb = max_rss_mb * 1024
+        self.startup_timeout = startup_timeout
+        # spawn: workers must not inherit the server's threads or event loop
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._started = 0
+        self._closed = False
+        self.recycled = 0
+
+    def start(self) -> None:
+        """Spawn workers up front so the first analysis finds them warm"""
+        with self._lock:
+            while self._started < self.size:
+                self._idle.put(_Worker(self._context))
+                self._started += 1
+
+    def _acquire(self, timeout: float) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise PoolUnavailable("Pool is closed")
+            if self._idle.empty() and self._started < self.size:
+                self._started += 1
+                return _Worker(self._context)
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise PoolUnavailable("No pylint worker became free")
+
+    def _release(self, worker: _Worker, retire: bool) -> None:
+        if retire or self._closed:
+            worker.stop()
+            with self._lock:
+                self._started -= 1
+                self.recycled += 1
+            if not self._closed:
+                # Replace right away so the next job does not pay the startup
+                self.start()
+            return
+        self._idle.put(worker)
+
+    def run(self, args: List[str], cwd: Path, timeout: float,
+            cancel: Optional[threading.Event] = None, deadline: Optional[float] = None) -> PoolResult:
+        """Run one job; waiting for a worker, its startup and the job all count against ``deadline``
+
+        ``deadline`` is a ``time.monotonic()`` value and defaults to ``timeout`` from now.
+        """
+        started = time.monotonic()
+        deadline = started + timeout if deadline is None else min(deadline, started + timeout)
+        worker = self._acquire(max(0.0, deadline - started))
+        retire = True
+        try:
+            if not worker.wait_ready(min(self.startup_timeout, max(0.0, deadline - time.monotonic()))):
+                # Out of time rather than broken: keep the worker starting for the next job
+                retire = time.monotonic() < deadline
+                raise PoolUnavailable("pylint worker did not start")
+            worker.conn.send({"args": args, "cwd": str(cwd)})
+            # Poll in slices so a cancelled job frees its worker promptly
+            while not worker.conn.poll(max(0.0, min(CANCEL_POLL, deadline - time.monotonic()))):
+                if cancel is not None and cancel.is_set():
+                    worker.process.kill()
+                    return PoolResult("", None, time.monotonic() - started, cancelled=True)
+                if time.monotonic() >= deadline:
+                    worker.process.kill()
+                    return PoolResult("", None, time.monotonic() - started, timed_out=True)
+            reply: Dict[str, Any] = worker.conn.recv()
+            if "error" in reply:
+                raise PoolUnavailable(reply["error"])
+
+            worker.jobs += 1
+            worker.rss_kb = reply.get("rss_kb", 0)
+            retire = worker.jobs >= self.max_jobs or worker.rss_kb > self.max_rss_kb
+            return PoolResult(
+                output=reply["output"],
+                returncode=reply["returncode"],
+                duration=time.monotonic() - started,
+                cpu_seconds=reply.get("cpu_seconds", 0.0),
+                rss_kb=worker.rss_kb
+            )
+        except (EOFError, OSError) as e:
+            raise PoolUnavailable(f"pylint worker died: {e}")
+        finally:
+            self._release(worker, retire)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().stop()
+            except queue.Empty:
+                break
+
+
+_pool: Optional[PylintWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pylint_pool() -> Optional[PylintWorkerPool]:
+    """Process-wide pool, or None when disabled with PINK_CODED_PYLINT_WORKERS=0"""
+    global _pool
+    if POOL_SIZE <= 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = PylintWorkerPool()
+        return _pool
+
+
+def shutdown_pylint_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
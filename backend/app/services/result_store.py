@@ -0,0 +1,87 @@
+# backend/app/services/result_store.py
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from importlib import metadata
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+RESULT_CACHE_SIZE = int(os.getenv("PINK_CODED_RESULT_CACHE_SIZE", "64"))
+HASH_CHUNK_SIZE = 1024 * 1024
+TOOLS = ("ruff", "pylint", "bandit", "radon")
+
+
+@lru_cache(maxsize=1)
+def tool_versions() -> str:
+    """Installed linter versions; a tool upgrade must never serve stale results"""
+    versions = []
+    for tool in TOOLS:
+        try:
+            versions.append(f"{tool}={metadata.version(tool)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{tool}=missing")
+    return ",".join(versions)
+
+
+def copy_hashing(source: BinaryIO, target: BinaryIO) -> Tuple[str, int]:
+    """``shutil.copyfileobj`` that also returns the sha256 and size of what it copied"""
+    digest = hashlib.sha256()
+    size = 0
+    while True:
+        chunk = source.read(HASH_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        target.write(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def clone_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy the dict layers of an analysis; IssueTables are shared
+
+    Sessions never mutate a stored table in place (re-lints build a new
+    table and assign it), so sharing them keeps a cache hit O(sections).
+    """
+    result = {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in analysis["result"].items()
+    }
+    return {**analysis, "result": result}
+
+
+class ResultStore:
+    """Bounded LRU of finished analyses keyed by (archive hash, config hash, tool versions)"""
+
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, ...], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            analysis = self._entries.get(key)
+            if analysis is None:
+                return None
+            self._entries.move_to_end(key)
+        return clone_analysis(analysis)
+
+    def put(self, key: Tuple[str, ...], analysis: Dict[str, Any]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = clone_analysis(analysis)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
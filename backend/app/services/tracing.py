@@ -0,0 +1,199 @@
+# backend/app/services/tracing.py
+import asyncio
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Fraction of root spans (requests) that are recorded; children follow their root
+TRACE_SAMPLE_RATE = float(os.getenv("PINK_CODED_TRACE_SAMPLE_RATE", "0"))
+# "file", "stdout" or "none"
+TRACE_EXPORTER = os.getenv("PINK_CODED_TRACE_EXPORTER", "file")
+TRACE_FILE = os.getenv("PINK_CODED_TRACE_FILE", "/tmp/pink-coded-traces.jsonl")
+SERVICE_NAME = "pink-coded-backend"
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    """OTLP/JSON attribute encoding"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+class Span:
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+                 "attributes", "status", "children")
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.status = "OK"
+        # Finished descendants, exported together when the root ends
+        self.children: List["Span"] = []
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_otlp(self) -> Dict[str, Any]:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_attribute(k, v) for k, v in self.attributes.items() if v is not None],
+            "status": {"code": 1 if self.status == "OK" else 2}
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class _NoopSpan:
+    """Handed out when the trace is not sampled; every call is a no-op"""
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+# Current span; NOOP_SPAN marks an unsampled trace so children skip sampling
+_current: ContextVar[Any] = ContextVar("pink_coded_span", default=None)
+
+
+class _Exporter:
+    """Writes finished traces as OTLP/JSON lines from a background thread"""
+
+    def __init__(self):
+        self.queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(1000)
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        if TRACE_EXPORTER == "none":
+            return
+        payload = {
+            "resourceSpans": [{
+                "resource": {"attributes": [_attribute("service.name", SERVICE_NAME)]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.services.tracing"},
+                    "spans": [span.to_otlp() for span in spans]
+                }]
+            }]
+        }
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self.thread.start()
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            payload = self.queue.get()
+            line = json.dumps(payload, separators=(",", ":")) + "\n"
+            try:
+                if TRACE_EXPORTER == "stdout":
+                    sys.stdout.write(line)
+                    sys.stdout.flush()
+                else:
+                    with open(TRACE_FILE, "a", encoding="utf-8") as f:
+                        f.write(line)
+            except Exception as e:
+                logger.error(f"Trace export failed: {e}")
+
+
+exporter = _Exporter()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Any]:
+    """Open a span under the current one (a new sampled-or-not trace at the root).
+
+    Works in sync and async code; ``asyncio.to_thread`` copies the context, so
+    spans opened in worker threads nest under the caller's span.
+    """
+    parent = _current.get()
+    if parent is NOOP_SPAN or (parent is None and random.random() >= TRACE_SAMPLE_RATE):
+        token = _current.set(NOOP_SPAN)
+        try:
+            yield NOOP_SPAN
+        finally:
+            _current.reset(token)
+        return
+
+    if parent is None:
+        current = Span(name, f"{random.getrandbits(128):032x}")
+        root = current
+    else:
+        current = Span(name, parent.trace_id, parent.span_id)
+        root = None
+    current.attributes.update(attributes)
+    token = _current.set(current)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "ERROR"
+        current.set(**{"exception.type": type(e).__name__, "exception.message": str(e)})
+        raise
+    finally:
+        current.end_ns = time.time_ns()
+        _current.reset(token)
+        _finish(current, parent, root)
+
+
+def _finish(current: Span, parent: Optional[Span], root: Optional[Span]) -> None:
+    if root is not None:
+        exporter.export([root, *root.children])
+        return
+    # Flatten into the parent; the parent hands everything to its own parent on exit
+    parent.children.append(current)
+    parent.children.extend(current.children)
+    current.children = []
+
+
+def current_span() -> Any:
+    """The active span, or the no-op span outside a sampled trace"""
+    active = _current.get()
+    return active if active is not None else NOOP_SPAN
+
+
+def traced(name: str):
+    """Decorator form of ``span`` for sync and async functions"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,228 @@
+# backend/app/services/zip_stream.py
+import os
+import stat
+import struct
+import time
+import zipfile
+import zlib
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+CHUNK_SIZE = 64 * 1024
+ZIP32_LIMIT = 0xFFFFFFFF
+MAX_ENTRIES = 0xFFFF
+
+# Header layouts as defined by APPNOTE.TXT (same layouts zipfile uses)
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+CENTRAL_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+END_OF_CENTRAL_DIR = struct.Struct("<4s4H2LH")
+DATA_DESCRIPTOR = struct.Struct("<4sL2L")
+
+FLAG_DATA_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+VERSION = 20
+UNIX = 3
+
+
+class ZipLimitExceeded(Exception):
+    """The archive would need ZIP64 records, which the streamer does not write"""
+
+
+def _dos_datetime(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time[:6]
+    year = max(year, 1980)
+    dosdate = (year - 1980) << 9 | month << 5 | day
+    dostime = hour << 11 | minute << 5 | (second // 2)
+    return dostime, dosdate
+
+
+def _encode_name(name: str) -> Tuple[bytes, int]:
+    try:
+        return name.encode("ascii"), 0
+    except UnicodeEncodeError:
+        return name.encode("utf-8"), FLAG_UTF8
+
+
+class _Entry:
+    __slots__ = ("name", "flags", "method", "dostime", "dosdate", "crc",
+                 "compress_size", "file_size", "external_attr", "offset")
+
+
+class ZipStreamWriter:
+    """Write a ZIP archive front to back without seeking.
+
+    Members can either be copied as already-compressed bytes from another
+    archive or deflated on the fly from disk (sizes then trail the data in a
+    data descriptor). The central directory is emitted by ``finish``.
+    """
+
+    def __init__(self):
+        self.offset = 0
+        self.entries: List[_Entry] = []
+
+    def _check_limits(self):
+        if self.offset > ZIP32_LIMIT or len(self.entries) >= MAX_ENTRIES:
+            raise ZipLimitExceeded("Archive too large for a ZIP32 stream")
+
+    def _local_header(self, entry: _Entry, name: bytes) -> bytes:
+        return LOCAL_HEADER.pack(
+            b"PK\003\004", VERSION, 0, entry.flags, entry.method,
+            entry.dostime, entry.dosdate, entry.crc,
+            entry.compress_size, entry.file_size, len(name), 0
+        ) + name
+
+    def copy_member(self, source, info: zipfile.ZipInfo, arcname: str) -> Iterator[bytes]:
+        """Copy a member's compressed bytes verbatim from an open source archive file"""
+        self._check_limits()
+        name, utf8_flag = _encode_name(arcname)
+        entry = _Entry()
+        entry.name = name
+        entry.flags = (info.flag_bits & ~FLAG_DATA_DESCRIPTOR) | utf8_flag
+        entry.method = info.compress_type
+        entry.dostime, entry.dosdate = _dos_datetime(info.date_time)
+        entry.crc = info.CRC
+        entry.compress_size = info.compress_size
+        entry.file_size = info.file_size
+        entry.external_attr = info.external_attr
+        entry.offset = self.offset
+
+        header = self._local_header(entry, name)
+        self.offset += len(header)
+        yield header
+
+        source.seek(info.header_offset)
+        local = source.read(LOCAL_HEADER.size)
+        name_length, extra_length = struct.unpack("<2H", local[26:30])
+        source.seek(info.header_offset + LOCAL_HEADER.size + name_length + extra_length)
+
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = source.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated member {info.filename}")
+            remaining -= len(chunk)
+            self.offset += len(chunk)
+            yield chunk
+
+        self.entries.append(entry)
+
+    def deflate_file(self, path: Path, arcname: str) -> Iterator[bytes]:
+        """Stream-compress a file from disk"""
+        self._check_limits()
+        name, utf8_flag = _encode_name(arcname)
+        stat_result = path.stat()
+        entry = _Entry()
+        entry.name = name
+        entry.flags = FLAG_DATA_DESCRIPTOR | utf8_flag
+        entry.method = zipfile.ZIP_DEFLATED
+        entry.dostime, entry.dosdate = _dos_datetime(time.localtime(stat_result.st_mtime))
+        entry.crc = entry.compress_size = entry.file_size = 0
+        entry.external_attr = (stat.S_IFREG | (stat_result.st_mode & 0o777)) << 16
+        entry.offset = self.offset
+
+        header = self._local_header(entry, name)
+        self.offset += len(header)
+        yield header
+
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        crc = file_size = compress_size = 0
+        with path.open("rb") as f:
+            while chunk := f.read(CHUNK_SIZE):
+                crc = zlib.crc32(chunk, crc)
+                file_size += len(chunk)
+                compressed = compressor.compress(chunk)
+                if compressed:
+                    compress_size += len(compressed)
+                    yield compressed
+        compressed = compressor.flush()
+        compress_size += len(compressed)
+        if compressed:
+            yield compressed
+
+        if file_size > ZIP32_LIMIT or compress_size > ZIP32_LIMIT:
+            raise ZipLimitExceeded(f"{arcname} too large for a ZIP32 stream")
+
+        entry.crc, entry.compress_size, entry.file_size = crc, compress_size, file_size
+        descriptor = DATA_DESCRIPTOR.pack(b"PK\007\010", crc, compress_size, file_size)
+        self.offset += compress_size + len(descriptor)
+        yield descriptor
+        self.entries.append(entry)
+
+    def finish(self) -> bytes:
+        directory = []
+        for entry in self.entries:
+            directory.append(CENTRAL_HEADER.pack(
+                b"PK\001\002", VERSION, UNIX, VERSION, 0, entry.flags, entry.method,
+                entry.dostime, entry.dosdate, entry.crc, entry.compress_size,
+                entry.file_size, len(entry.name), 0, 0, 0, 0,
+                entry.external_attr, entry.offset
+            ))
+            directory.append(entry.name)
+        central = b"".join(directory)
+        if self.offset + len(central) > ZIP32_LIMIT:
+            raise ZipLimitExceeded("Central directory beyond ZIP32 offsets")
+        end = END_OF_CENTRAL_DIR.pack(
+            b"PK\005\006", 0, 0, len(self.entries), len(self.entries),
+            len(central), self.offset, 0
+        )
+        return central + end
+
+
+def _upload_members(upload_path: Optional[Path]) -> Dict[str, zipfile.ZipInfo]:
+    if upload_path is None or not upload_path.exists():
+        return {}
+    try:
+        with zipfile.ZipFile(upload_path) as archive:
+            return {
+                info.filename.replace("\\", "/").lstrip("/"): info
+                for info in archive.infolist()
+                if not info.is_dir()
+            }
+    except zipfile.BadZipFile:
+        return {}
+
+
+def fits_zip32(working_dir: Path, upload_path: Optional[Path]) -> bool:
+    """Cheap upper-bound check so we never start a stream we cannot finish"""
+    total = 0
+    count = 0
+    for root, _, files in os.walk(working_dir):
+        for name in files:
+            path = os.path.join(root, name)
+            if upload_path is not None and path == str(upload_path):
+                continue
+            count += 1
+            total += os.path.getsize(path) + 1024
+    return count < MAX_ENTRIES and total < ZIP32_LIMIT
+
+
+def stream_project_zip(
+    working_dir: Path,
+    upload_path: Optional[Path],
+    modified: Set[str]
+) -> Iterator[bytes]:
+    """Yield a ZIP of working_dir, reusing compressed upload bytes for untouched files"""
+    members = _upload_members(upload_path)
+    writer = ZipStreamWriter()
+    source = upload_path.open("rb") if members else None
+    try:
+        for root, dirs, files in os.walk(working_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = Path(root) / name
+                if upload_path is not None and path == upload_path:
+                    continue
+                arcname = path.relative_to(working_dir).as_posix()
+                info = members.get(arcname)
+                if (
+                    info is not None
+                    and arcname not in modified
+                    and info.file_size == path.stat().st_size
+                ):
+                    yield from writer.copy_member(source, info, arcname)
+                else:
+                    yield from writer.deflate_file(path, arcname)
+        yield writer.finish()
+    finally:
+        if source is not None:
+            source.close()
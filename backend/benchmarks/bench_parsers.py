@@ -0,0 +1,144 @@
+# backend/benchmarks/bench_parsers.py
+"""Parser benchmark on large synthetic pylint JSON output.
+
+Compares the legacy approach (read all of stdout, ``json.loads`` it, then
+``Path.relative_to`` per issue) with the streaming parser in
+``app.services.parse_linter``. Each measurement runs in a fresh child
+process so peak RSS is attributable to that parser alone.
+
+    python -m benchmarks.bench_parsers --size-mb 300
+"""
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BASE = Path("/srv/pink-coded/project")
+SYMBOLS = [
+    ("C0114", "missing-module-docstring", "convention", "Missing module docstring"),
+    ("W0611", "unused-import", "warning", "Unused import os"),
+    ("E0602", "undefined-variable", "error", "Undefined variable 'foo'"),
+    ("R1705", "no-else-return", "refactor", "Unnecessary \"else\" after \"return\""),
+]
+
+
+def generate_pylint_json(path: Path, size_mb: int, seed: int = 0) -> int:
+    """Write pylint-style JSON of roughly size_mb megabytes; returns issue count"""
+    rng = random.Random(seed)
+    target = size_mb * 1024 * 1024
+    written = 0
+    count = 0
+    with path.open("w") as f:
+        f.write("[\n")
+        while written < target:
+            code, symbol, kind, message = rng.choice(SYMBOLS)
+            module = f"pkg{rng.randrange(200)}.mod{rng.randrange(50)}"
+            record = json.dumps({
+                "type": kind,
+                "module": module,
+                "obj": f"func_{rng.randrange(1000)}",
+                "line": rng.randrange(1, 2000),
+                "column": rng.randrange(0, 80),
+                "endLine": None,
+                "endColumn": None,
+                "path": str(BASE / (module.replace(".", "/") + ".py")),
+                "symbol": symbol,
+                "message": message,
+                "message-id": code,
+            }, indent=4)
+            if count:
+                f.write(",\n")
+            f.write(record)
+            written += len(record) + 2
+            count += 1
+        f.write("\n]\n")
+    return count
+
+
+def _legacy(path: Path) -> int:
+    output = path.read_text()
+    issues = json.loads(output)
+    parsed = []
+    for issue in issues:
+        file_path = Path(issue["path"])
+        rel_path = str(file_path.relative_to(BASE)) if file_path.is_absolute() else issue["path"]
+        parsed.append({
+            "type": issue["type"].lower(),
+            "file": rel_path,
+            "line": issue["line"],
+            "message": issue["message"],
+            "code": issue["message-id"],
+            "url": ""
+        })
+    return len(parsed)
+
+
+def _streaming(path: Path) -> int:
+    from app.services.parse_linter import LinterType, parse_linter_stream
+    count = 0
+    with path.open() as f:
+        for _ in parse_linter_stream(f.read, LinterType.PYLINT, BASE):
+            count += 1
+    return count
+
+
+def _streaming_table(path: Path) -> int:
+    from app.models.issue_table import IssueTable
+    from app.services.parse_linter import LinterType, parse_linter_stream
+    with path.open() as f:
+        table = IssueTable.from_dicts(parse_linter_stream(f.read, LinterType.PYLINT, BASE))
+    return len(table)
+
+
+MODES = {"legacy": _legacy, "streaming": _streaming, "streaming+table": _streaming_table}
+
+
+def _measure(mode: str, path: Path) -> None:
+    started = time.perf_counter()
+    count = MODES[mode](path)
+    elapsed = time.perf_counter() - started
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"mode": mode, "issues": count, "seconds": elapsed, "peak_rss_mb": peak_kb / 1024}))
+
+
+def run(size_mb: int, modes) -> list:
+    backend_dir = Path(__file__).resolve().parent.parent
+    with tempfile.TemporaryDirectory(prefix="pink-coded-bench-") as tmp:
+        path = Path(tmp) / "pylint.json"
+        count = generate_pylint_json(path, size_mb)
+        size = path.stat().st_size / (1024 * 1024)
+        print(f"Generated {count} issues, {size:.1f} MB of pylint JSON")
+        results = []
+        for mode in modes:
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_parsers", "--measure", mode, str(path)],
+                cwd=backend_dir, capture_output=True, text=True, check=True
+            )
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            result["mb_per_s"] = size / result["seconds"]
+            results.append(result)
+            print(f"{mode:>16}: {result['seconds']:7.2f}s  {result['mb_per_s']:7.1f} MB/s  "
+                  f"peak RSS {result['peak_rss_mb']:8.1f} MB")
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=300)
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        _measure(args.measure[0], Path(args.measure[1]))
+        return
+    run(args.size_mb, args.modes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+# backend/benchmarks/bench_pipeline.py
+"""End-to-end benchmarks for the analysis pipeline on synthetic projects.
+
+Cases: ``detect_project_type``, each parser on synthetic linter JSON,
+``run_linter_analysis`` and ``POST /analyze-zip``. Each case runs in a
+fresh child process so its peak RSS is its own.
+
+    python -m benchmarks.bench_pipeline --preset medium
+    python -m benchmarks.bench_pipeline --preset medium --save-baseline
+    python -m benchmarks.bench_pipeline --files 500 --loc 300 --issue-density 0.1 --web-ratio 0.5
+    python -m benchmarks.bench_pipeline --cases analyze_zip --warm-cache
+
+Every timed ``analyze_zip`` upload carries a unique nonce member, so it
+runs the linters instead of hitting the result store. ``--warm-cache``
+uploads identical bytes instead and records the cache-hit latency as the
+separate case ``analyze_zip:warm``.
+
+Results are compared with ``benchmarks/baseline.json`` (same project
+shape only); a case slower or bigger than baseline by more than
+``--threshold`` is reported as a regression and the exit status is 1.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.synthetic import (
+    PRESETS,
+    ProjectSpec,
+    generate_project,
+    linter_output,
+    spec_dict,
+    with_nonce,
+    zip_project
+)
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+PARSERS = ("ruff", "pylint", "bandit", "radon")
+CASES = ("detect_project_type", *(f"parse:{name}" for name in PARSERS), "run_linter_analysis", "analyze_zip")
+DEFAULT_THRESHOLD = 0.2
+
+
+def _timed(func: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    return {"seconds": statistics.median(times), "min_seconds": min(times)}
+
+
+def _measure(case: str, project: Path, zip_path: Path, issues: int, repeat: int) -> Dict[str, Any]:
+    """Runs inside the child process"""
+    from app.routers import analysis
+
+    result: Dict[str, Any] = {"case": case}
+    if case == "detect_project_type":
+        files = sum(1 for p in project.rglob("*") if p.is_file())
+        result.update(_timed(lambda: analysis.detect_project_type(project), repeat))
+        result.update(throughput=files / result["seconds"], unit="files/s")
+    elif case.startswith("parse:"):
+        from app.services.parse_linter import LinterType, parse_linter_output
+        linter = case.split(":", 1)[1]
+        base = Path("/srv/bench")
+        output = linter_output(linter, issues, base)
+        result.update(_timed(lambda: parse_linter_output(output, LinterType(linter), base), repeat))
+        result.update(throughput=len(output) / 1024 / 1024 / result["seconds"], unit="MB/s",
+                      input_mb=len(output) / 1024 / 1024)
+    elif case == "run_linter_analysis":
+        outcome: Dict[str, Any] = {}
+
+        def run():
+            outcome["analysis"] = asyncio.run(analysis.run_linter_analysis(project, "intermediate"))
+
+        result.update(_timed(run, repeat))
+        sections = outcome["analysis"]["result"]
+        result["issues"] = sum(len(sections[name]["issues"]) for name in analysis.SECTIONS)
+        result.update(throughput=result["issues"] / result["seconds"], unit="issues/s")
+    elif case in ("analyze_zip", "analyze_zip:warm"):
+        from fastapi.testclient import TestClient
+        from app.main import app
+        payload = zip_path.read_bytes()
+        warm = case == "analyze_zip:warm"
+        uploads = 0
+        with TestClient(app) as client:
+            def upload():
+                nonlocal uploads
+                uploads += 1
+                body = payload if warm else with_nonce(payload, f"upload-{uploads}")
+                response = client.post(
+                    "/api/v1/analysis/analyze-zip",
+                    files={"zip_file": ("project.zip", body, "application/zip")}
+                )
+                response.raise_for_status()
+                expected = warm and uploads > 1
+                if response.json()["cached"] != expected:
+                    raise RuntimeError(f"Expected cached={expected} for upload {uploads}")
+            if warm:
+                upload()  # fills the result store; not timed
+            result.update(_timed(upload, repeat))
+        result.update(throughput=len(payload) / 1024 / 1024 / result["seconds"], unit="zip MB/s")
+    else:
+        raise ValueError(f"Unknown case: {case}")
+
+    result["peak_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    # Linter subprocesses: largest single child
+    result["children_peak_rss_mb"] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return result
+
+
+def run_cases(spec: ProjectSpec, cases: List[str], issues: int, repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="pink-coded-bench-") as tmp:
+        project = Path(tmp) / "project"
+        shape = generate_project(project, spec)
+        zip_path = Path(tmp) / "project.zip"
+        zip_size = zip_project(project, zip_path)
+        print(f"Project {spec.key()}: {shape['files']} files, {shape['lines']} lines, "
+              f"{zip_size / 1024:.0f} KB zipped")
+
+        results = {}
+        for case in cases:
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_pipeline", "--measure", case,
+                 str(project), str(zip_path), str(issues), str(repeat)],
+                cwd=BACKEND_DIR, capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                print(f"{case:>22}: FAILED\n{proc.stderr[-2000:]}")
+                continue
+            result = json.loads(proc.stdout.strip().splitlines()[-1])
+            results[case] = result
+            print(f"{case:>22}: {result['seconds'] * 1000:9.1f} ms  "
+                  f"{result['throughput']:10.1f} {result['unit']:<9}  peak RSS {result['peak_rss_mb']:7.1f} MB")
+    return {"spec": spec_dict(spec), "issues": issues, "python": platform.python_version(), "cases": results}
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def compare(current: Dict[str, Any], baseline: Optional[Dict[str, Any]], threshold: float) -> List[str]:
+    """Human-readable regressions of ``current`` against a same-shape baseline"""
+    if not baseline:
+        return []
+    regressions = []
+    for case, result in current["cases"].items():
+        before = baseline["cases"].get(case)
+        if not before:
+            continue
+        for metric in ("seconds", "peak_rss_mb"):
+            old, new = before.get(metric), result.get(metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append(f"{case} {metric}: {old:.4g} -> {new:.4g} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=list(PRESETS), default="small")
+    parser.add_argument("--files", type=int)
+    parser.add_argument("--loc", type=int)
+    parser.add_argument("--issue-density", type=float)
+    parser.add_argument("--web-ratio", type=float)
+    parser.add_argument("--issues", type=int, default=50000, help="issues per synthetic parser input")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cases", nargs="+", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--warm-cache", action="store_true",
+                        help="time analyze_zip on identical uploads (result-store hits) as analyze_zip:warm")
+    parser.add_argument("--measure", nargs=5, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        case, project, zip_path, issues, repeat = args.measure
+        print(json.dumps(_measure(case, Path(project), Path(zip_path), int(issues), int(repeat))))
+        return
+
+    preset = PRESETS[args.preset]
+    spec = ProjectSpec(
+        files=args.files or preset.files,
+        loc=args.loc or preset.loc,
+        issue_density=preset.issue_density if args.issue_density is None else args.issue_density,
+        web_ratio=preset.web_ratio if args.web_ratio is None else args.web_ratio,
+        seed=preset.seed
+    )
+    cases = ["analyze_zip:warm" if args.warm_cache and case == "analyze_zip" else case for case in args.cases]
+    current = run_cases(spec, cases, args.issues, args.repeat)
+
+    baselines = load_baseline(args.baseline)
+    key = f"{spec.key()}-i{args.issues}"
+    if args.save_baseline:
+        baselines[key] = current
+        args.baseline.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline saved to {args.baseline} ({key})")
+        return
+
+    regressions = compare(current, baselines.get(key), args.threshold)
+    if key not in baselines:
+        print(f"No baseline for {key}; run with --save-baseline to record one")
+    elif regressions:
+        print(f"Regressions beyond {args.threshold:.0%}:")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    else:
+        print(f"No regressions beyond {args.threshold:.0%} against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+# backend/benchmarks/deepseek_mock.py
+"""Local stand-in for the DeepSeek (OpenAI-compatible) chat completions API.
+
+Standard library only, so it runs anywhere the benchmarks do.
+
+    # canned answers with latency and failure injection
+    python -m benchmarks.deepseek_mock --latency-ms 400 --error-rate 0.05 --timeout-rate 0.01
+
+    # capture real completions once (needs network and a key) ...
+    python -m benchmarks.deepseek_mock --record cassette.jsonl --upstream https://api.deepseek.com/v1
+    # ... then serve them offline, deterministically
+    python -m benchmarks.deepseek_mock --replay cassette.jsonl --latency-ms 250
+
+Point the backend at it with
+``DEEPSEEK_API_URL=http://127.0.0.1:8765/v1/chat/completions`` (ExplanationEngine)
+or ``DEEPSEEK_BASE_URL=http://127.0.0.1:8765/v1`` (DeepSeekClient).
+
+Requests with ``"stream": true`` get server-sent ``chat.completion.chunk``
+events. ``GET /_mock/stats`` returns counters; ``POST /_mock/config``
+changes latency/failure settings on a running server.
+"""
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field, fields
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+COMPLETION_PATHS = ("/v1/chat/completions", "/chat/completions")
+
+CANNED_CONTENT = """### Why
+This pattern hides bugs and makes the code harder to maintain.
+
+### Fix
+Replace it with the explicit, idiomatic form.
+
+### Example
+```python
+value = int(raw_value)
+```
+
+### Best Practices
+Prefer explicit conversions and keep functions small."""
+
+_CODE_BLOCK = re.compile(r"```python\s*\n(.*?)```", re.S)
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 300.0
+    jitter_ms: float = 100.0
+    error_rate: float = 0.0
+    seed: Optional[int] = None
+    # Status codes drawn for injected errors (429 exercises rate-limit handling)
+    error_statuses: List[int] = field(default_factory=lambda: [500])
+    # Requests that hang for hang_seconds (past the client's timeout) before answering
+    timeout_rate: float = 0.0
+    hang_seconds: float = 30.0
+    # 200 responses whose content lacks the expected sections
+    malformed_rate: float = 0.0
+    # Delay between streamed chunks
+    chunk_delay_ms: float = 20.0
+
+
+def request_key(request: Dict[str, Any]) -> str:
+    """Stable cassette key: only the fields that determine the completion"""
+    relevant = {name: request.get(name) for name in ("model", "messages", "temperature", "max_tokens")}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True).encode()).hexdigest()
+
+
+def canned_content(request: Dict[str, Any]) -> str:
+    """Explanation sections, or for fix prompts the prompt's code echoed back as the 'fix'"""
+    prompt = "\n".join(str(m.get("content", "")) for m in request.get("messages", []))
+    if "Provide ONLY the corrected code" in prompt:
+        match = _CODE_BLOCK.search(prompt)
+        code = match.group(1).strip() if match else "pass"
+        return f"```python\n{code}\n```\nNo functional change required."
+    return CANNED_CONTENT
+
+
+def completion(content: str, model: str) -> Dict[str, Any]:
+    return {
+        "id": f"chatcmpl-mock-{random.getrandbits(32):08x}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {"prompt_tokens": 0, "completion_tokens": len(content.split()), "total_tokens": 0}
+    }
+
+
+def stream_chunks(content: str, model: str, words_per_chunk: int = 8) -> List[Dict[str, Any]]:
+    chunk_id = f"chatcmpl-mock-{random.getrandbits(32):08x}"
+    words = re.split(r"(\s+)", content)
+    pieces = ["".join(words[i:i + words_per_chunk * 2]) for i in range(0, len(words), words_per_chunk * 2)]
+    chunks = [{"role": "assistant", "content": ""}] + [{"content": piece} for piece in pieces]
+    events = [{
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": None}]
+    } for delta in chunks]
+    events[-1]["choices"][0]["finish_reason"] = "stop"
+    return events
+
+
+class Cassette:
+    """JSONL file of {key, request, response} records"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.records: Dict[str, Dict[str, Any]] = {}
+        if path.exists():
+            for line in path.read_text().splitlines():
+                if line.strip():
+                    record = json.loads(line)
+                    self.records[record["key"]] = record["response"]
+
+    def get(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        return self.records.get(request_key(request))
+
+    def add(self, request: Dict[str, Any], response: Dict[str, Any]) -> None:
+        key = request_key(request)
+        with self.lock:
+            self.records[key] = response
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "request": request, "response": response}) + "\n")
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    server: "MockServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send_json(self, status: int, body: Any) -> None:
+        data = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self) -> None:
+        if self.path == "/_mock/stats":
+            self._send_json(200, self.server.stats())
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self) -> None:
+        if self.path == "/_mock/config":
+            self.server.update_config(self._read_json())
+            self._send_json(200, asdict(self.server.config))
+            return
+        if self.path.rstrip("/") not in COMPLETION_PATHS:
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+
+        request = self._read_json()
+        server = self.server
+        server.count("requests")
+        outcome = server.draw()
+        time.sleep(outcome["delay"])
+        if outcome["hang"]:
+            server.count("timeouts")
+            time.sleep(server.config.hang_seconds)
+        if outcome["status"]:
+            server.count("errors")
+            self._send_json(outcome["status"], {"error": {"message": "Injected failure", "type": "server_error"}})
+            return
+
+        try:
+            response = server.respond(request, self.headers.get("Authorization"))
+        except urllib.error.HTTPError as e:
+            self._send_json(e.code, e.read())
+            return
+        except urllib.error.URLError as e:
+            self._send_json(502, {"error": {"message": f"Upstream unreachable: {e.reason}"}})
+            return
+        if response is None:
+            server.count("replay_misses")
+            self._send_json(404, {"error": {"message": "No recorded completion for this request"}})
+            return
+        if outcome["malformed"]:
+            server.count("malformed")
+            response = completion("I am not sure.", request.get("model", "deepseek-chat"))
+
+        if request.get("stream"):
+            self._stream(response)
+        else:
+            self._send_json(200, response)
+
+    def _stream(self, response: Dict[str, Any]) -> None:
+        content = response["choices"][0]["message"]["content"]
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        delay = self.server.config.chunk_delay_ms / 1000
+        for event in stream_chunks(content, response.get("model", "deepseek-chat")):
+            self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+            self.wfile.flush()
+            time.sleep(delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class MockServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        config: MockConfig,
+        replay: Optional[Path] = None,
+        record: Optional[Path] = None,
+        upstream: Optional[str] = None,
+        strict: bool = False
+    ):
+        super().__init__(address, MockHandler)
+        self.config = config
+        self.replay = Cassette(replay) if replay else None
+        self.recorder = Cassette(record) if record else None
+        self.upstream = upstream.rstrip("/") if upstream else None
+        # Replay misses are 404s when strict, canned answers otherwise
+        self.strict = strict
+        self.counters: Dict[str, int] = {}
+        self._rng = random.Random(config.seed)
+        self._lock = threading.Lock()
+
+    @property
+    def requests(self) -> int:
+        return self.counters.get("requests", 0)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "config": asdict(self.config)}
+
+    def update_config(self, changes: Dict[str, Any]) -> None:
+        known = {f.name for f in fields(MockConfig)}
+        with self._lock:
+            for name, value in changes.items():
+                if name in known:
+                    setattr(self.config, name, value)
+            if "seed" in changes:
+                self._rng = random.Random(self.config.seed)
+
+    def draw(self) -> Dict[str, Any]:
+        """Delay and injected failures for one request, from the seeded generator"""
+        config = self.config
+        with self._lock:
+            jitter = self._rng.uniform(-config.jitter_ms, config.jitter_ms)
+            hang = self._rng.random() < config.timeout_rate
+            failed = self._rng.random() < config.error_rate
+            status = self._rng.choice(config.error_statuses) if failed else 0
+            malformed = self._rng.random() < config.malformed_rate
+        return {"delay": max(0.0, config.latency_ms + jitter) / 1000, "hang": hang,
+                "status": status, "malformed": malformed}
+
+    def respond(self, request: Dict[str, Any], authorization: Optional[str]) -> Optional[Dict[str, Any]]:
+        model = request.get("model", "deepseek-chat")
+        if self.replay is not None:
+            recorded = self.replay.get(request)
+            if recorded is not None:
+                self.count("replay_hits")
+                return recorded
+            if self.strict:
+                return None
+        if self.upstream is not None:
+            response = self._forward(request, authorization)
+            if self.recorder is not None:
+                self.recorder.add(request, response)
+            self.count("recorded")
+            return response
+        return completion(canned_content(request), model)
+
+    def _forward(self, request: Dict[str, Any], authorization: Optional[str]) -> Dict[str, Any]:
+        # Record non-streaming completions; streaming is re-synthesized on replay
+        body = json.dumps({**request, "stream": False}).encode()
+        upstream = urllib.request.Request(
+            f"{self.upstream}/chat/completions",
+            data=body,
+            headers={"Content-Type": "application/json", "Authorization": authorization or ""},
+            method="POST"
+        )
+        with urllib.request.urlopen(upstream, timeout=120) as response:
+            return json.loads(response.read())
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+def start_mock(config: MockConfig, host: str = "127.0.0.1", port: int = 0, **options: Any) -> MockServer:
+    """Serve in a daemon thread; ``port=0`` picks a free port (see ``server.url``)"""
+    server = MockServer((host, port), config, **options)
+    threading.Thread(target=server.serve_forever, name="deepseek-mock", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, nargs="+", default=[500])
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-delay-ms", type=float, default=20.0)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--replay", type=Path, help="serve completions recorded in this cassette")
+    parser.add_argument("--strict", action="store_true", help="404 on replay misses instead of canned answers")
+    parser.add_argument("--record", type=Path, help="append upstream completions to this cassette")
+    parser.add_argument("--upstream", help="real API base URL to record from, e.g. https://api.deepseek.com/v1")
+    args = parser.parse_args()
+    if args.record and not args.upstream:
+        parser.error("--record needs --upstream")
+
+    config = MockConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        seed=args.seed,
+        error_statuses=args.error_status,
+        timeout_rate=args.timeout_rate,
+        hang_seconds=args.hang_seconds,
+        malformed_rate=args.malformed_rate,
+        chunk_delay_ms=args.chunk_delay_ms
+    )
+    server = MockServer((args.host, args.port), config, replay=args.replay, record=args.record,
+                        upstream=args.upstream, strict=args.strict)
+    print(f"DeepSeek mock listening on {server.url}/chat/completions")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,264 @@
+# backend/benchmarks/load_test.py
+"""Concurrent-user load test against the real FastAPI app.
+
+Each virtual user loops over the full editor workflow: upload a project,
+browse files, request explanations (template and DeepSeek-backed codes),
+apply a fix and export. DeepSeek is replaced by the local mock in
+``benchmarks.deepseek_mock`` with configurable latency and error rate.
+
+    python -m benchmarks.load_test --levels 1 4 16 --iterations 3
+    python -m benchmarks.load_test --in-process --levels 1 2 4
+
+By default the app runs under uvicorn in a child process (closest to
+production). ``--in-process`` drives ``app.main:app`` through httpx's ASGI
+transport instead, which needs no server but shares one event loop with
+the load generator.
+
+Each upload carries a unique nonce member so it runs the full pipeline;
+identical bytes would be answered from the result store after the first
+one. ``--warm-cache`` sends identical bytes to measure that path instead.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+from benchmarks.deepseek_mock import MockConfig, start_mock
+from benchmarks.synthetic import ProjectSpec, generate_project, with_nonce, zip_project
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+ANALYSIS = "/api/v1/analysis"
+FILES = "/api/v1/api/v1/files"  # files router carries its own prefix and is mounted under /api/v1 too
+EXPLANATIONS = "/api/v1/explanations"
+# Template-backed codes answer locally; the others reach DeepSeek
+TEMPLATE_CODES = ["E501", "F401", "W0611"]
+DEEPSEEK_CODES = ["S101", "PLR0913", "ASYNC100"]
+USERS = 64
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            self.latencies[name].append(time.perf_counter() - started)
+            return None
+        self.latencies[name].append(time.perf_counter() - started)
+        if response.status_code >= 400:
+            self.errors[name] += 1
+            return None
+        return response
+
+    def report(self, elapsed: float) -> Dict[str, Dict[str, float]]:
+        rows = {}
+        for name, values in sorted(self.latencies.items()):
+            rows[name] = {
+                "requests": len(values),
+                "errors": self.errors[name],
+                "error_rate": self.errors[name] / len(values),
+                "rps": len(values) / elapsed,
+                "p50_ms": percentile(values, 50) * 1000,
+                "p95_ms": percentile(values, 95) * 1000,
+                "p99_ms": percentile(values, 99) * 1000,
+            }
+        return rows
+
+
+async def user_session(client: httpx.AsyncClient, recorder: Recorder, user: int, payload: bytes) -> None:
+    user_id = f"load-user-{user % USERS}"
+    response = await recorder.call(
+        client, "analyze-zip", "POST", f"{ANALYSIS}/analyze-zip",
+        files={"zip_file": ("project.zip", payload, "application/zip")}
+    )
+    if response is None:
+        return
+    analysis = response.json()
+    session_id = analysis["session_id"]
+    issues = [issue for section in analysis["result"].values() if isinstance(section, dict)
+              for issue in section.get("issues", [])]
+
+    for file in sorted({issue["file"] for issue in issues})[:3]:
+        await recorder.call(client, "files", "GET", FILES, params={"path": file, "session_id": session_id})
+
+    for i, code in enumerate(TEMPLATE_CODES[:2] + DEEPSEEK_CODES[:2]):
+        await recorder.call(client, "explanations", "GET", EXPLANATIONS, params={
+            "issue_code": code,
+            # Vary the message so the per-user cache does not absorb every DeepSeek call
+            "message": f"Synthetic issue {user}-{i}",
+            "file": "mod.py",
+            "line": 1,
+            "user_id": user_id
+        })
+
+    fixable = next((issue for issue in issues if issue.get("line")), None)
+    if fixable:
+        await recorder.call(client, "apply-fix", "POST", f"{ANALYSIS}/apply-fix", json={
+            "file_path": fixable["file"],
+            "issue": fixable,
+            "fix": "    pass  # load-test fix",
+            "session_id": session_id
+        })
+
+    await recorder.call(client, "export-project", "POST", f"{ANALYSIS}/export-project",
+                        json={"session_id": session_id})
+
+
+async def run_level(
+    client: httpx.AsyncClient,
+    concurrency: int,
+    iterations: int,
+    payload: bytes,
+    warm_cache: bool = False
+) -> Dict[str, Any]:
+    recorder = Recorder()
+
+    async def worker(user: int):
+        for iteration in range(iterations):
+            body = payload if warm_cache else with_nonce(payload, f"c{concurrency}-u{user}-i{iteration}")
+            await user_session(client, recorder, user, body)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(user) for user in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "concurrency": concurrency,
+        "seconds": elapsed,
+        "sessions_per_s": concurrency * iterations / elapsed,
+        "endpoints": recorder.report(elapsed)
+    }
+
+
+def seed_profiles(workdir: Path) -> None:
+    """ExplanationEngine needs a stored profile per user; ProfileService reads ./user_profiles"""
+    profiles = workdir / "user_profiles"
+    profiles.mkdir(exist_ok=True)
+    for user in range(USERS):
+        (profiles / f"load-user-{user}.json").write_text(json.dumps({
+            "id": f"load-user-{user}",
+            "email": f"load-user-{user}@example.com",
+            "hashed_password": "x",
+            "experience_level": ["beginner", "intermediate", "advanced"][user % 3]
+        }))
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def app_client(in_process: bool, workdir: Path, env: Dict[str, str]) -> AsyncIterator[httpx.AsyncClient]:
+    timeout = httpx.Timeout(600.0)
+    if in_process:
+        os.environ.update(env)
+        os.chdir(workdir)
+        sys.path.insert(0, str(BACKEND_DIR))
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://app", timeout=timeout) as client:
+            yield client
+        return
+
+    port = _free_port()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=workdir,
+        env={**os.environ, **env, "PYTHONPATH": str(BACKEND_DIR)}
+    )
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            for _ in range(100):
+                try:
+                    await client.get("/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.1)
+            else:
+                raise RuntimeError("App did not start")
+            yield client
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def print_level(result: Dict[str, Any]) -> None:
+    print(f"\nconcurrency {result['concurrency']}: {result['seconds']:.1f}s, "
+          f"{result['sessions_per_s']:.2f} sessions/s")
+    print(f"  {'endpoint':<16}{'reqs':>6}{'err%':>7}{'rps':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for name, row in result["endpoints"].items():
+        print(f"  {name:<16}{row['requests']:>6}{row['error_rate'] * 100:>6.1f}%{row['rps']:>8.2f}"
+              f"{row['p50_ms']:>9.0f}{row['p95_ms']:>9.0f}{row['p99_ms']:>9.0f}")
+
+
+async def main_async(args) -> List[Dict[str, Any]]:
+    mock = start_mock(MockConfig(args.deepseek_latency_ms, args.deepseek_jitter_ms, args.deepseek_error_rate, seed=0))
+    env = {"DEEPSEEK_API_URL": f"{mock.url}/chat/completions", "DEEPSEEK_BASE_URL": mock.url,
+           "DEEPSEEK_API_KEY": "load-test"}
+    with tempfile.TemporaryDirectory(prefix="pink-coded-load-") as tmp:
+        workdir = Path(tmp)
+        seed_profiles(workdir)
+        project = workdir / "project"
+        generate_project(project, ProjectSpec(files=args.files, loc=args.loc))
+        payload_path = workdir / "project.zip"
+        zip_project(project, payload_path)
+        payload = payload_path.read_bytes()
+
+        results = []
+        async with app_client(args.in_process, workdir, env) as client:
+            for level in args.levels:
+                result = await run_level(client, level, args.iterations, payload, args.warm_cache)
+                print_level(result)
+                results.append(result)
+        print(f"\nDeepSeek mock served {mock.requests} completions")
+        mock.shutdown()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--iterations", type=int, default=2, help="workflow loops per user per level")
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--loc", type=int, default=100)
+    parser.add_argument("--deepseek-latency-ms", type=float, default=400.0)
+    parser.add_argument("--deepseek-jitter-ms", type=float, default=150.0)
+    parser.add_argument("--deepseek-error-rate", type=float, default=0.02)
+    parser.add_argument("--in-process", action="store_true")
+    parser.add_argument("--warm-cache", action="store_true",
+                        help="upload identical bytes, so every analysis after the first is a result-store hit")
+    parser.add_argument("--json", type=Path, help="also write results here")
+    args = parser.parse_args()
+
+    results = asyncio.run(main_async(args))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
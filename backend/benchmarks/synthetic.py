@@ -0,0 +1,195 @@
+# backend/benchmarks/synthetic.py
+"""Synthetic projects and linter outputs for the benchmarks.
+
+Everything is derived from a seed, so two runs with the same arguments
+produce byte-identical trees and baselines stay comparable.
+"""
+import io
+import json
+import random
+import zipfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List
+
+# Lines that reliably trigger at least one ruff/pylint/bandit finding each
+ISSUE_LINES = [
+    "import os  # unused",
+    "value = eval(user_input)",
+    "subprocess.call(command, shell=True)",
+    "password = 'hunter2'",
+    "data = pickle.loads(blob)",
+    "x=1;y=2",
+    "assert isinstance(value, int)",
+    "l = [i for i in range(10) if i == None]",
+]
+
+CLEAN_LINES = [
+    "total = sum(values)",
+    "result.append(item * 2)",
+    "name = name.strip().lower()",
+    "count += 1",
+]
+
+BRANCHY_FUNCTION = '''
+def decide_{n}(a, b, c):
+    if a > b:
+        if b > c:
+            return 1
+        elif a > c:
+            return 2
+        else:
+            return 3
+    elif a == b:
+        for i in range(c):
+            if i % 2:
+                continue
+        return 4
+    return 5
+'''
+
+
+@dataclass
+class ProjectSpec:
+    files: int = 50
+    loc: int = 200               # lines per file
+    issue_density: float = 0.05  # fraction of lines that trigger a finding
+    web_ratio: float = 1.0       # 1.0 = all web markers, 0.0 = all embedded markers
+    seed: int = 0
+
+    def key(self) -> str:
+        return f"f{self.files}-l{self.loc}-d{self.issue_density}-w{self.web_ratio}"
+
+
+PRESETS: Dict[str, ProjectSpec] = {
+    "small": ProjectSpec(files=20, loc=100),
+    "medium": ProjectSpec(files=200, loc=200),
+    "large": ProjectSpec(files=1000, loc=300),
+}
+
+
+def _module(rng: random.Random, spec: ProjectSpec, index: int) -> str:
+    lines: List[str] = ['"""Generated module"""', "import pickle", "import subprocess", "", ""]
+    lines.append(f"def handler_{index}(user_input, command, blob, values, item, result, name, count):")
+    body = 0
+    while body < spec.loc:
+        if rng.random() < spec.issue_density:
+            lines.append("    " + rng.choice(ISSUE_LINES))
+        else:
+            lines.append("    " + rng.choice(CLEAN_LINES))
+        body += 1
+    lines.append("    return result")
+    # Roughly one complex function per 100 lines keeps radon busy
+    for n in range(max(1, spec.loc // 100)):
+        lines.append(BRANCHY_FUNCTION.format(n=n))
+    return "\n".join(lines) + "\n"
+
+
+def generate_project(root: Path, spec: ProjectSpec) -> Dict[str, int]:
+    """Write a project under ``root``; returns file and line counts"""
+    rng = random.Random(spec.seed)
+    root.mkdir(parents=True, exist_ok=True)
+    web_files = round(spec.files * spec.web_ratio)
+    lines = 0
+    for i in range(spec.files):
+        # detect_project_type scores path names, so markers go into the paths
+        package = "flask_app" if i < web_files else "firmware"
+        path = root / package / f"mod_{i}.py"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        text = _module(rng, spec, i)
+        path.write_text(text)
+        lines += text.count("\n")
+    if web_files:
+        (root / "requirements.txt").write_text("flask\n")
+    if web_files < spec.files:
+        (root / "Makefile").write_text("all:\n\tgcc main.c\n")
+        (root / "main.c").write_text("int main(void) { return 0; }\n")
+    return {"files": spec.files, "lines": lines}
+
+
+def zip_project(root: Path, zip_path: Path) -> int:
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(root.rglob("*")):
+            if path.is_file():
+                zf.write(path, path.relative_to(root))
+    return zip_path.stat().st_size
+
+
+NONCE_MEMBER = "BENCH_NONCE"
+
+
+def with_nonce(payload: bytes, nonce: str) -> bytes:
+    """``payload`` plus a tiny member holding ``nonce``, so the archive hash is new
+
+    Uploads of identical bytes are answered from the result store; timed
+    uploads must be unique to measure the pipeline rather than that lookup.
+    """
+    buffer = io.BytesIO(payload)
+    with zipfile.ZipFile(buffer, "a") as zf:
+        zf.writestr(NONCE_MEMBER, nonce)
+    return buffer.getvalue()
+
+
+def linter_output(linter: str, issues: int, base: Path, seed: int = 0) -> str:
+    """Synthetic JSON in the exact layout each linter emits"""
+    rng = random.Random(seed)
+
+    def path() -> str:
+        return str(base / f"pkg{rng.randrange(100)}" / f"mod{rng.randrange(50)}.py")
+
+    if linter == "ruff":
+        return json.dumps([{
+            "code": rng.choice(["F401", "E501", "E711", "W291"]),
+            "filename": path(),
+            "location": {"row": rng.randrange(1, 2000), "column": rng.randrange(80)},
+            "end_location": {"row": 1, "column": 1},
+            "message": "`os` imported but unused",
+            "url": "https://docs.astral.sh/ruff/rules/unused-import",
+            "fix": None,
+            "noqa_row": 1,
+        } for _ in range(issues)], indent=2)
+    if linter == "pylint":
+        return json.dumps([{
+            "type": rng.choice(["convention", "warning", "error", "refactor"]),
+            "module": "pkg.mod",
+            "obj": "handler",
+            "line": rng.randrange(1, 2000),
+            "column": rng.randrange(80),
+            "path": path(),
+            "symbol": "unused-import",
+            "message": "Unused import os",
+            "message-id": rng.choice(["W0611", "C0114", "E0602", "R1705"]),
+        } for _ in range(issues)], indent=4)
+    if linter == "bandit":
+        return json.dumps({
+            "errors": [],
+            "generated_at": "2024-01-01T00:00:00Z",
+            "metrics": {"_totals": {"loc": issues * 10}},
+            "results": [{
+                "filename": path(),
+                "line_number": rng.randrange(1, 2000),
+                "col_offset": 4,
+                "issue_text": "Use of possibly insecure function - consider using safer ast.literal_eval.",
+                "test_id": rng.choice(["B307", "B602", "B105", "B301"]),
+                "more_info": "https://bandit.readthedocs.io/",
+                "issue_severity": rng.choice(["LOW", "MEDIUM", "HIGH"]),
+                "issue_confidence": "HIGH",
+            } for _ in range(issues)],
+        }, indent=2)
+    if linter == "radon":
+        files: Dict[str, list] = {}
+        for _ in range(issues):
+            files.setdefault(path(), []).append({
+                "type": "function",
+                "name": f"decide_{rng.randrange(100)}",
+                "lineno": rng.randrange(1, 2000),
+                "col_offset": 0,
+                "complexity": rng.randrange(2, 20),
+                "rank": rng.choice("ABCD"),
+            })
+        return json.dumps(files)
+    raise ValueError(f"Unsupported linter: {linter}")
+
+
+def spec_dict(spec: ProjectSpec) -> Dict[str, object]:
+    return asdict(spec)
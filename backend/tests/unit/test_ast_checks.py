@@ -0,0 +1,70 @@
+import pytest
+
+from app.services.ast_checks import run_ast_checks
+
+BRANCHY = """
+def decide(a, b):
+    if a > b:
+        return 1
+    elif a == b:
+        return 2
+    return 3
+"""
+
+def test_one_parse_feeds_bandit_and_radon(tmp_path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "mod.py").write_text("import pickle\npickle.loads(b'')\neval('1')  # nosec\n" + BRANCHY)
+    (tmp_path / "broken.py").write_text("def f(:\n")
+    (tmp_path / "__pycache__").mkdir()
+    (tmp_path / "__pycache__" / "skipped.py").write_text("eval('1')\n")
+
+    result = run_ast_checks(tmp_path)
+
+    assert result.files == 2
+    assert [name for name, _ in result.skipped] == ["broken.py"]
+    assert sorted((i["code"], i["line"]) for i in result.security) == [("B301", 2), ("B403", 1)]
+    assert result.security[0]["file"] == "pkg/mod.py" and result.security[0]["linter"] == "bandit"
+    [block] = result.complexity
+    assert block["code"] == "RADON-A" and block["complexity"] == 3 and block["line"] == 5
+
+def test_bandit_api_drift_makes_the_stage_unavailable(tmp_path, monkeypatch):
+    from app.services import ast_checks
+
+    def moved(*args):
+        raise AttributeError("'BanditNodeVisitor' object has no attribute 'tester'")
+
+    monkeypatch.setattr(ast_checks, "_bandit_results", moved)
+    (tmp_path / "mod.py").write_text("eval('1')\n")
+    with pytest.raises(ast_checks.AstStageUnavailable):
+        run_ast_checks(tmp_path)
+
+def test_workers_are_limited_and_retired_when_a_chunk_runs_on(tmp_path, monkeypatch):
+    import resource
+    import threading
+    import time
+    from concurrent.futures.process import BrokenProcessPool
+    from app.services import ast_checks
+    from app.services.linter_runner import MEMORY_LIMIT_MB
+
+    monkeypatch.setattr(ast_checks, "AST_WORKERS", 1)
+    executor = ast_checks.get_ast_executor()
+    try:
+        assert executor.submit(resource.getrlimit, resource.RLIMIT_AS).result()[0] == MEMORY_LIMIT_MB * 1024 * 1024
+
+        for i in range(2 * ast_checks.FILES_PER_TASK + 1):
+            (tmp_path / f"m{i}.py").write_text("x = 1\n")
+        cancel = threading.Event()
+        cancel.set()
+        result = ast_checks.run_ast_checks(tmp_path, cancel=cancel)
+        assert result.unchecked == result.files and not result.security
+
+        started = tmp_path / "started"
+        stuck = executor.submit(exec, f"import pathlib, time; pathlib.Path({str(started)!r}).touch(); time.sleep(30)")
+        while not started.exists():
+            time.sleep(0.05)
+        ast_checks.retire_ast_executor(executor)
+        with pytest.raises(BrokenProcessPool):
+            stuck.result(timeout=10)
+        assert ast_checks.get_ast_executor() is not executor
+    finally:
+        ast_checks.shutdown_ast_executor()
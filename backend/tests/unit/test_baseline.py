@@ -0,0 +1,47 @@
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.issue_table import IssueTable
+from app.routers import analysis
+from app.services.baseline import BaselineStore, SourceLines, add_fingerprints, classify
+
+def _issues(tmp_path, source):
+    (tmp_path / "mod.py").write_text(source)
+    lines = source.splitlines()
+    issues = [{"code": "W0611", "file": "mod.py", "line": i + 1} for i, line in enumerate(lines) if line.startswith("import")]
+    return IssueTable.from_dicts(add_fingerprints(issues, SourceLines(tmp_path)))
+
+def test_fingerprints_survive_line_shifts_and_classify(tmp_path):
+    before = _issues(tmp_path, "import os\nx = 1\ny = 2\nimport sys\n")
+    after = _issues(tmp_path, "\n\nimport   os\nx = 1\ny = 2\nz = 3\nimport re\n")
+    assert before.row(0)["fingerprint"] == after.row(0)["fingerprint"]
+
+    baseline = {issue["fingerprint"]: {"code": issue["code"], "line": issue["line"]} for issue in before}
+    new, existing, fixed = classify({"main_analysis": after}, baseline)
+    assert [issue["line"] for issue in new["main_analysis"]] == [7]
+    assert [entry["line"] for entry in existing.values()] == [1]
+    assert [entry["line"] for entry in fixed] == [4]
+
+def _zip(source):
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as zf:
+        zf.writestr("mod.py", source)
+    return {"zip_file": ("project.zip", payload.getvalue(), "application/zip")}
+
+def test_baseline_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(analysis, "BASELINES", BaselineStore(tmp_path))
+    url = "/api/v1/analysis/analyze-zip"
+    with TestClient(app) as client:
+        first = client.post(url, files=_zip("import os\nx = 1\n")).json()
+        saved = client.post(f"/api/v1/analysis/{first['session_id']}/baseline", params={"project": "demo"}).json()
+        assert saved["issues"] > 0
+
+        second = client.post(url, params={"baseline": "demo"}, files=_zip("\nimport os\nx = 1\n\n\n\nimport sys\n")).json()
+        assert second["baseline"]["found"] and second["baseline"]["existing"] == saved["issues"]
+        new = [issue for section in analysis.SECTIONS for issue in second["result"][section]["issues"]]
+        assert new and all("sys" in issue["message"] for issue in new)
+
+        assert client.post(url, params={"baseline": "../x"}, files=_zip("x = 1\n")).status_code == 400
@@ -0,0 +1,53 @@
+import shutil
+import zipfile
+
+from app.services.blob_store import BlobStore
+from app.services.fix_applier import atomic_write_text
+
+def test_sessions_share_blobs_until_written_and_gc_after_expiry(tmp_path):
+    archive = tmp_path / "upload.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        zf.writestr("pkg/a.py", "x = 1\n")
+        zf.writestr("pkg/copy_of_a.py", "x = 1\n")
+        zf.writestr("../escape.py", "y = 2\n")
+    store = BlobStore(tmp_path / "store")
+    first, second = tmp_path / "s1", tmp_path / "s2"
+
+    stats = store.extract(archive, first, "hash")
+    assert (stats.files, stats.new_blobs) == (3, 2)
+    assert (first / "escape.py").read_text() == "y = 2\n" and not (tmp_path / "escape.py").exists()
+    assert store.extract(archive, second, "hash").from_manifest
+    assert (first / "pkg/a.py").stat().st_ino == (second / "pkg/a.py").stat().st_ino
+
+    assert (first / "pkg/a.py").stat().st_mode & 0o777 == 0o444
+
+    atomic_write_text(second / "pkg/a.py", "x = 2\n")
+    assert (first / "pkg/a.py").read_text() == "x = 1\n"
+    assert (second / "pkg/a.py").stat().st_mode & 0o200
+
+    assert store.gc()["removed"] == 0
+    shutil.rmtree(first)
+    shutil.rmtree(second)
+    assert store.gc() == {"removed": 2, "freed_bytes": 12, "kept": 0, "manifests_removed": 0}
+    assert store.extract(archive, first, "hash").new_blobs == 2
+
+def test_expire_sessions_cancels_background_work_on_the_loop(tmp_path, monkeypatch):
+    import asyncio
+    from app.routers import analysis
+
+    monkeypatch.setattr(analysis, "get_blob_store", lambda: BlobStore(tmp_path / "blobs"))
+    tree = tmp_path / "session"
+    tree.mkdir()
+
+    async def scenario():
+        scan = asyncio.create_task(asyncio.sleep(60))
+        analysis.ACTIVE_SESSIONS["old"] = str(tree)
+        analysis.SESSION_STARTED["old"] = 0.0
+        analysis.FULL_SCANS["old"] = scan
+        stats = await analysis.expire_sessions(ttl=1)
+        await asyncio.sleep(0)
+        return stats, scan
+
+    stats, scan = asyncio.run(scenario())
+    assert stats["sessions"] == 1 and scan.cancelled()
+    assert not tree.exists() and "old" not in analysis.ACTIVE_SESSIONS and "old" not in analysis.FULL_SCANS
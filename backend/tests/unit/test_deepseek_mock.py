@@ -0,0 +1,41 @@
+import asyncio
+import json
+import urllib.request
+
+from app.models import Issue
+from app.services.explanation_engine import ExplanationEngine
+from benchmarks.deepseek_mock import MockConfig, start_mock
+
+def _post(url, body):
+    request = urllib.request.Request(url, json.dumps(body).encode(), {"Content-Type": "application/json"})
+    with urllib.request.urlopen(request) as response:
+        return response.read().decode()
+
+def test_engine_against_mock_and_record_replay(tmp_path):
+    upstream = start_mock(MockConfig(latency_ms=0, jitter_ms=0, seed=1))
+    cassette = tmp_path / "cassette.jsonl"
+    recorder = start_mock(MockConfig(latency_ms=0, jitter_ms=0), record=cassette, upstream=upstream.url)
+    replay = None
+    try:
+        engine = ExplanationEngine(profile_service=None)
+        engine.api_url = f"{recorder.url}/chat/completions"
+        profile = type("Profile", (), {"experience_level": "beginner"})()
+        issue = Issue(code="S101", message="Use of assert", file="a.py", line=3)
+
+        explanation = asyncio.run(engine._generate_deepseek_explanation(issue, profile))
+        assert explanation["source"] == "deepseek-chat" and explanation["fix"]
+        assert upstream.requests == 1 and len(cassette.read_text().splitlines()) == 1
+
+        replay = start_mock(MockConfig(latency_ms=0, jitter_ms=0), replay=cassette, strict=True)
+        engine.api_url = f"{replay.url}/chat/completions"
+        replayed = asyncio.run(engine._generate_deepseek_explanation(issue, profile))
+        assert replayed["why"] == explanation["why"]
+        assert replay.counters["replay_hits"] == 1
+
+        body = json.loads(cassette.read_text())["request"]
+        events = _post(f"{replay.url}/chat/completions", {**body, "stream": True})
+        assert events.rstrip().endswith("data: [DONE]")
+    finally:
+        for server in (upstream, recorder, replay):
+            if server is not None:
+                server.shutdown()
@@ -0,0 +1,98 @@
+from app.services.file_serving import LineIndex, merge_line_windows, parse_line_window, parse_range_header
+import pytest
+
+def test_line_index_byte_ranges(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_bytes(b"a\nbb\nccc\n")
+
+    index = LineIndex.build(path)
+    assert index.line_count == 3
+    assert index.byte_range(2, 3) == (2, 8)
+    assert index.byte_range(3, 10) == (5, 8)
+    assert index.byte_range(4, 5) is None
+
+def test_parse_range_header():
+    assert parse_range_header("bytes=2-4", 9) == (2, 4)
+    assert parse_range_header("bytes=-3", 9) == (6, 8)
+    assert parse_range_header("bytes=0-1,4-5", 9) is None
+    with pytest.raises(ValueError):
+        parse_range_header("bytes=20-", 9)
+
+def test_parse_line_window():
+    assert parse_line_window("10-20") == (10, 20)
+    assert parse_line_window("7") == (7, 7)
+    with pytest.raises(ValueError):
+        parse_line_window("20-10")
+
+def test_merge_line_windows():
+    assert merge_line_windows([10, 12, 40], context=2) == [(8, 14), (38, 42)]
+    assert merge_line_windows([1], context=5) == [(1, 6)]
+
+def test_raw_endpoint_validators_ranges_and_line_windows(tmp_path):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routers import analysis
+
+    (tmp_path / "mod.py").write_bytes(b"a\nbb\nccc\n")
+    analysis.ACTIVE_SESSIONS["raw-session"] = str(tmp_path)
+
+    def get(headers=None, **params):
+        return client.get("/api/v1/api/v1/files/raw", headers=headers or {},
+                          params={"path": "mod.py", "session_id": "raw-session", **params})
+
+    try:
+        with TestClient(app) as client:
+            full = get()
+            assert full.status_code == 200 and full.content == b"a\nbb\nccc\n"
+            etag = full.headers["etag"]
+            assert get({"if-none-match": etag}).status_code == 304
+
+            partial = get({"range": "bytes=2-4"})
+            assert partial.status_code == 206 and partial.content == b"bb\n"
+            assert partial.headers["content-range"] == "bytes 2-4/9"
+            assert get({"range": "bytes=2-4", "if-range": '"stale"'}).status_code == 200
+
+            unsatisfiable = get({"range": "bytes=20-"})
+            assert unsatisfiable.status_code == 416
+            assert unsatisfiable.headers["content-range"] == "bytes */9"
+
+            window = get(lines="2-3")
+            assert window.status_code == 200 and window.content == b"bb\nccc\n"
+            assert (window.headers["x-line-start"], window.headers["x-line-end"]) == ("2", "3")
+            assert window.headers["x-total-lines"] == "3"
+            past_end = get(lines="5-9")
+            assert past_end.status_code == 200 and past_end.content == b""
+            assert get(lines="3-1").status_code == 400
+    finally:
+        analysis.ACTIVE_SESSIONS.pop("raw-session", None)
+
+def test_batch_endpoint_validates_windows(tmp_path):
+    import json
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routers import analysis
+
+    (tmp_path / "mod.py").write_text("".join(f"l{i}\n" for i in range(1, 11)))
+    analysis.ACTIVE_SESSIONS["batch-session"] = str(tmp_path)
+
+    def post(**body):
+        return client.post("/api/v1/api/v1/files/batch", json={"session_id": "batch-session", **body})
+
+    try:
+        with TestClient(app) as client:
+            response = post(
+                files=[{"path": "mod.py", "start_line": 2, "end_line": 3}],
+                issues=[{"file": "mod.py", "line": 9}, {"file": "mod.py", "line": "2"}],
+                context_lines=1
+            )
+            records = sorted((json.loads(line) for line in response.iter_lines() if line),
+                             key=lambda record: record["start_line"])
+            assert [(r["start_line"], r["end_line"], r["content"]) for r in records] == [
+                (2, 3, "l2\nl3\n"), (8, 10, "l8\nl9\nl10\n")
+            ]
+
+            assert post(files=[{"path": "mod.py", "start_line": 4, "end_line": 2}]).status_code == 422
+            assert post(files=[{"path": "mod.py", "start_line": -5, "end_line": -3}]).status_code == 422
+            assert post(issues=[{"file": "mod.py", "line": 2}], context_lines=-3).status_code == 422
+    finally:
+        analysis.ACTIVE_SESSIONS.pop("batch-session", None)
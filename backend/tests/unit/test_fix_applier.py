@@ -0,0 +1,55 @@
+from app.services.fix_applier import Hunk, apply_hunks, atomic_write_text
+
+def test_apply_hunks_uses_original_line_numbers():
+    content = "a\nb\nc\nd\n"
+    hunks = [
+        Hunk(start=1, end=1, replacement="x1\nx2"),
+        Hunk(start=3, end=3, replacement="y"),
+        Hunk(start=3, end=4, replacement="overlap"),
+        Hunk(start=9, end=9, replacement="out of range"),
+    ]
+
+    new_content, applied, skipped = apply_hunks(content, hunks)
+
+    assert new_content == "x1\nx2\nb\ny\nd\n"
+    assert len(applied) == 2
+    assert [h.replacement for h in skipped] == ["overlap", "out of range"]
+
+def test_atomic_write_text(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("old\n")
+    atomic_write_text(path, "new\n")
+    assert path.read_text() == "new\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["module.py"]
+
+def test_apply_fixes_rejects_escaping_paths_and_bad_lines(tmp_path):
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.routers import analysis
+
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "mod.py").write_text("x = 1\n")
+    outside = tmp_path / "outside.py"
+    outside.write_text("keep\n")
+    analysis.ACTIVE_SESSIONS["fix-session"] = str(project)
+
+    def post(file_path, line):
+        return client.post("/api/v1/analysis/apply-fixes", json={
+            "session_id": "fix-session",
+            "reanalyze": False,
+            "fixes": [{"file_path": file_path, "issue": {"line": line}, "fix": "y = 2"}]
+        })
+
+    try:
+        with TestClient(app) as client:
+            assert post("../outside.py", 1).status_code == 400
+            assert post(str(outside), 1).status_code == 400
+            assert post("mod.py", "1").status_code == 400
+            assert post("mod.py", 0).status_code == 400
+            assert outside.read_text() == "keep\n"
+            assert post("./sub/../mod.py", 1).json()["files"][0]["file_path"] == "mod.py"
+            assert (project / "mod.py").read_text() == "y = 2\n"
+    finally:
+        analysis.ACTIVE_SESSIONS.pop("fix-session", None)
+        analysis.MODIFIED_FILES.pop("fix-session", None)
@@ -0,0 +1,28 @@
+from app.services.issue_dedup import dedupe_sections
+from app.services.parse_linter import combine_issues
+
+def _issue(linter, code, line, column=0, file="mod.py"):
+    return {"linter": linter, "code": code, "file": file, "line": line, "column": column, "message": code}
+
+def test_equivalent_codes_merge_into_one_issue_with_all_sources():
+    combined = combine_issues(
+        [_issue("ruff", "F401", 1, 7), _issue("ruff", "F401", 1, 11), _issue("ruff", "E501", 3)],
+        [_issue("pylint", "W0611", 1), _issue("pylint", "W0611", 1), _issue("pylint", "W0611", 2)]
+    )
+    # Two unused imports on line 1 stay two issues; line 2 has no partner
+    assert [(i["code"], i["line"]) for i in combined] == [("F401", 1), ("F401", 1), ("E501", 3), ("W0611", 2)]
+    assert combined[0]["sources"] == [
+        {"linter": "ruff", "code": "F401", "message": "F401"},
+        {"linter": "pylint", "code": "W0611", "message": "W0611"}
+    ]
+    assert "sources" not in combined[2]
+
+def test_cross_section_duplicates_keep_the_specialised_linter():
+    sections = dedupe_sections({
+        "security_scan": [_issue("bandit", "B307", 4)],
+        "main_analysis": [_issue("pylint", "W0123", 4), _issue("pylint", "R1260", 9), _issue("pylint", "W0123", 4, file="other.py")],
+        "complexity_analysis": [_issue("radon", "RADON-C", 9)]
+    })
+    assert [i["code"] for i in sections["security_scan"]] == ["B307"]
+    assert [i["file"] for i in sections["main_analysis"]] == ["other.py"]
+    assert [s["code"] for s in sections["complexity_analysis"][0]["sources"]] == ["RADON-C", "R1260"]
@@ -0,0 +1,53 @@
+import pytest
+
+from app.models.issue_table import IssueTable
+from app.services.issue_query import CursorConflict, CursorExpired, first_page, paginate
+
+def _result():
+    main = [{"type": "error", "file": f"m{i % 3}.py", "line": i, "message": "m", "code": "F401"} for i in range(7)]
+    security = [{"type": "security", "file": "s.py", "line": i, "message": "s", "code": "B101",
+                 "severity": "low"} for i in range(3)]
+    return {
+        "security_scan": {"issues": IssueTable.from_dicts(security)},
+        "main_analysis": {"issues": IssueTable.from_dicts(main)},
+        "complexity_analysis": {"issues": IssueTable()},
+    }
+
+def test_cursor_walks_every_section_once():
+    result = _result()
+    seen, cursor = [], None
+    while True:
+        page = paginate(result, cursor=cursor, limit=4)
+        seen.extend((issue["section"], issue["line"]) for issue in page["issues"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert page["total"] == 10
+    assert len(seen) == len(set(seen)) == 10
+    assert seen[3] == ("main_analysis", 0)
+
+def test_filters_and_bad_cursor():
+    page = paginate(_result(), section="main_analysis", file="m1.py", limit=100)
+
+    assert [issue["line"] for issue in page["issues"]] == [1, 4]
+    assert page["next_cursor"] is None
+    with pytest.raises(ValueError):
+        paginate(_result(), cursor="bm9wZTox")
+
+def test_cursors_are_bound_to_section_and_table():
+    result = _result()
+    first = first_page(result["main_analysis"], "main_analysis", 4)
+    rest = paginate(result, cursor=first["next_cursor"], limit=100)
+    assert [issue["line"] for issue in rest["issues"]] == [4, 5, 6]
+    assert {issue["section"] for issue in rest["issues"]} == {"main_analysis"}
+
+    with pytest.raises(CursorConflict):
+        paginate(result, section="security_scan", cursor=first["next_cursor"])
+    walk = paginate(result, limit=2)["next_cursor"]
+    with pytest.raises(CursorConflict):
+        paginate(result, section="security_scan", cursor=walk)
+
+    result["security_scan"]["issues"] = result["security_scan"]["issues"].take([0, 1, 2])
+    with pytest.raises(CursorExpired):
+        paginate(result, cursor=walk)
@@ -0,0 +1,40 @@
+from app.models.issue_table import IssueTable
+
+ISSUES = [
+    {"type": "error", "file": "a.py", "line": 3, "message": "unused", "code": "F401", "url": ""},
+    {"type": "warning", "file": "b.py", "line": 1, "message": "docstring", "code": "D100", "url": ""},
+    {"type": "security", "file": "a.py", "line": 9, "message": "pickle", "code": "B403",
+     "severity": "low", "confidence": "high"},
+]
+
+def test_round_trip_renders_flamingo_message_lazily():
+    table = IssueTable.from_dicts(ISSUES)
+
+    assert len(table) == 3
+    assert table.file.values.count("a.py") == 1
+    row = table.row(2)
+    assert row["confidence"] == "high"
+    assert row["flamingo_message"] == "[Security] B403: pickle"
+    assert {k: v for k, v in table.row(0).items() if k != "flamingo_message"} == ISSUES[0]
+
+def test_filter_and_group():
+    table = IssueTable.from_dicts(ISSUES)
+
+    assert table.filter(file="a.py") == [0, 2]
+    assert table.filter(code_prefix="D") == [1]
+    assert table.filter(file="a.py", type="security") == [2]
+    assert table.group_counts("file") == {"a.py": 2, "b.py": 1}
+    assert [row["file"] for row in table.drop_files({"a.py"})] == ["b.py"]
+
+def test_index_prefix_lines_and_invalidation():
+    table = IssueTable.from_dicts(ISSUES + [
+        {"type": "error", "file": "a.py", "line": 1, "message": "undefined", "code": "F821"},
+    ])
+
+    assert table.index.code_prefix_rows("F") == [0, 3]
+    assert table.index.lines("a.py", 1, 3) == [3, 0]
+    assert table.index.top("file", 1) == [("a.py", 3)]
+    assert [row["code"] for row in table.drop_code_prefixes(("F",))] == ["D100", "B403"]
+
+    table.append({"type": "warning", "file": "c.py", "line": 2, "message": "x", "code": "W0611"})
+    assert table.group_counts("file")["c.py"] == 1
@@ -0,0 +1,21 @@
+from app.services.linter_config import config_set_hash, configs_for_project, quick_ruff_config
+
+def test_project_and_preference_variants_get_their_own_hash():
+    default = configs_for_project()
+    embedded = configs_for_project("embedded")
+    tuned = configs_for_project(preferences={"ruff.ignore": "D100"})
+
+    assert default["ruff"] == embedded["ruff"]
+    assert default["pylint"].digest != embedded["pylint"].digest
+    assert default["ruff"].digest != tuned["ruff"].digest
+    assert "import-error" in embedded["pylint"].path.read_text()
+    assert config_set_hash(default) == config_set_hash(configs_for_project())
+    assert config_set_hash(default) != config_set_hash(embedded)
+
+def test_preferences_add_to_default_rule_lists():
+    tuned = configs_for_project("embedded", {"ruff.ignore": "D100", "pylint.disable": "fixme"})
+    ruff = tuned["ruff"].path.read_text()
+    assert "E501" in ruff and "D203" in ruff and "D100" in ruff
+    disabled = tuned["pylint"].path.read_text()
+    assert all(name in disabled for name in ("missing-docstring", "import-error", "fixme"))
+    assert quick_ruff_config(preferences={"ruff.select": "N"}).path.read_text().count('"N"') == 1
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.routers import analysis
+from app.services.linter_runner import MEMORY_LIMIT_MB, run_linter_process
+from app.services.parse_linter import LinterType
+
+def test_cancel_kills_the_linter_process_group(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    # The "linter" starts a grandchild, as pylint -j or a shell wrapper would
+    script = (
+        "import subprocess, sys, time;"
+        f"child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']);"
+        f"open({str(pid_file)!r}, 'w').write(str(child.pid));"
+        "time.sleep(60)"
+    )
+    cancel = threading.Event()
+    threading.Timer(1.0, cancel.set).start()
+    started = time.monotonic()
+    run = run_linter_process([sys.executable, "-c", script], LinterType.RUFF, tmp_path, tmp_path, 30, cancel)
+    assert run.cancelled and not run.timed_out
+    assert time.monotonic() - started < 10
+
+    grandchild = int(pid_file.read_text())
+    for _ in range(50):
+        # Reparented to init once its group is killed; gone when reaped
+        state = subprocess.run(["ps", "-o", "stat=", "-p", str(grandchild)], capture_output=True, text=True).stdout
+        if not state.strip() or state.startswith("Z"):
+            break
+        time.sleep(0.1)
+    else:
+        os.kill(grandchild, 9)
+        raise AssertionError("grandchild survived the cancel")
+
+def test_group_is_never_killed_after_the_child_is_reaped(tmp_path, monkeypatch):
+    from app.services import linter_runner
+
+    cancel = threading.Event()
+    wait_exited = linter_runner._wait_exited
+    kills = []
+
+    def exit_then_cancel(pid):
+        wait_exited(pid)
+        cancel.set()  # a disconnect lands between the child's exit and its reaping
+        time.sleep(0.2)
+
+    def record_kill(pgid):
+        # WNOWAIT|WNOHANG only succeeds while the child is still unreaped
+        kills.append(os.waitid(os.P_PID, pgid, os.WEXITED | os.WNOWAIT | os.WNOHANG) is not None)
+
+    monkeypatch.setattr(linter_runner, "_wait_exited", exit_then_cancel)
+    monkeypatch.setattr(linter_runner, "kill_group", record_kill)
+    run_linter_process([sys.executable, "-c", "pass"], LinterType.RUFF, tmp_path, tmp_path, 30, cancel)
+    assert kills == [True]
+
+def test_linter_runs_under_memory_limit(tmp_path):
+    script = (
+        "import resource, sys, time; time.sleep(0.5);"
+        "sys.stderr.write(str(resource.getrlimit(resource.RLIMIT_AS)[0]))"
+    )
+    run = run_linter_process([sys.executable, "-c", script], LinterType.RUFF, tmp_path, tmp_path, 30)
+    assert int(run.stderr) == MEMORY_LIMIT_MB * 1024 * 1024
+
+def test_client_disconnect_cancels_the_analysis():
+    class GoneRequest:
+        async def is_disconnected(self):
+            return True
+
+    cancelled = []
+
+    async def long_analysis():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(analysis.ClientDisconnected):
+        asyncio.run(analysis.cancel_on_disconnect(GoneRequest(), long_analysis()))
+    assert cancelled
@@ -0,0 +1,34 @@
+from app.services.metrics import Registry
+
+def test_render_prometheus_text():
+    registry = Registry()
+    runs = registry.counter("runs_total", "Runs", ["linter"])
+    latency = registry.histogram("latency_seconds", "Latency", ["source"], buckets=(0.1, 1.0))
+    registry.gauge("sessions", "Sessions", callback=lambda: 3)
+
+    runs.inc(linter="ruff")
+    runs.inc(2, linter="ruff")
+    latency.observe(0.05, source="template")
+    latency.observe(0.5, source="template")
+    text = registry.render()
+
+    assert 'runs_total{linter="ruff"} 3' in text
+    assert 'latency_seconds_bucket{source="template",le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{source="template",le="+Inf"} 2' in text
+    assert 'latency_seconds_count{source="template"} 2' in text
+    assert "sessions 3" in text
+
+def test_storage_gauges_are_measured_off_scrape_and_cached(tmp_path):
+    import asyncio
+    from app.routers import analysis
+
+    (tmp_path / "mod.py").write_bytes(b"x" * 10)
+    analysis.ACTIVE_SESSIONS["metrics-session"] = str(tmp_path)
+    try:
+        asyncio.run(analysis.refresh_storage_gauges(max_age=0))
+        assert analysis.TEMP_DIR_BYTES.value() >= 10
+        (tmp_path / "big.py").write_bytes(b"x" * 1000)
+        asyncio.run(analysis.refresh_storage_gauges(max_age=3600))
+        assert analysis.TEMP_DIR_BYTES.value() < 1000
+    finally:
+        analysis.ACTIVE_SESSIONS.pop("metrics-session", None)
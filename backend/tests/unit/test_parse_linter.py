@@ -0,0 +1,55 @@
+from app.models.issue import Issue
+from app.services.parse_linter import LinterType, parse_linter_stream
+from pathlib import Path
+import io
+import json
+
+BASE = Path("/work/project")
+
+def _parse(payload, linter, read_size=7):
+    stream = io.StringIO(payload)
+    return list(parse_linter_stream(lambda n: stream.read(min(n, read_size)), linter, BASE))
+
+def test_pylint_stream_survives_tiny_chunks():
+    payload = json.dumps([
+        {"type": "convention", "path": "pkg/a.py", "line": 12, "column": 4,
+         "message": "Missing docstring", "message-id": "C0116", "symbol": "missing-function-docstring"}
+    ] * 3, indent=4)
+
+    issues = _parse(payload, LinterType.PYLINT)
+
+    assert len(issues) == 3
+    assert issues[0]["file"] == "pkg/a.py"
+    assert issues[0]["line"] == 12
+    Issue(**issues[0])
+
+def test_bandit_and_ruff_paths_are_made_relative():
+    bandit = json.dumps({
+        "errors": [],
+        "metrics": {"/work/project/app.py": {"loc": 10}},
+        "results": [{"filename": "/work/project/app.py", "line_number": 3, "issue_text": "pickle",
+                     "test_id": "B403", "more_info": "", "issue_severity": "LOW",
+                     "issue_confidence": "HIGH"}]
+    })
+    ruff = json.dumps([{"filename": "/work/project/web/main.py", "code": "F401", "message": "unused",
+                        "location": {"row": 6, "column": 8}, "url": "u"}])
+
+    [bandit_issue] = _parse(bandit, LinterType.BANDIT)
+    [ruff_issue] = _parse("warning: preamble\n" + ruff, LinterType.RUFF)
+
+    assert bandit_issue["file"] == "app.py" and bandit_issue["severity"] == "low"
+    assert ruff_issue["file"] == "web/main.py" and ruff_issue["type"] == "error"
+    Issue(**bandit_issue)
+    Issue(**ruff_issue)
+
+def test_truncated_stream_keeps_complete_elements():
+    payload = json.dumps([{"type": "error", "path": "a.py", "line": n, "message": "m",
+                           "message-id": "E0602"} for n in range(1, 4)])
+    stream = io.StringIO(payload[:-30])
+    issues = []
+    try:
+        for issue in parse_linter_stream(stream.read, LinterType.PYLINT, BASE):
+            issues.append(issue)
+    except ValueError:
+        pass
+    assert [issue["line"] for issue in issues] == [1, 2]
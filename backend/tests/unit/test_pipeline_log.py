@@ -0,0 +1,24 @@
+import logging
+
+from app.services.pipeline_log import log_payload, log_summary
+
+def test_summary_and_sampled_payload(caplog):
+    log = logging.getLogger("app.test_pipeline_log")
+    built = []
+
+    def build():
+        built.append(1)
+        return {"issues": list(range(5000))}
+
+    with caplog.at_level(logging.INFO, logger=log.name):
+        log_summary(log, "analysis.completed", issues=3, duration_ms=1.5)
+        log_payload(log, "payload", build, rate=1.0)
+
+    assert caplog.records[0].getMessage() == "analysis.completed issues=3 duration_ms=1.5"
+    assert caplog.records[0].fields == {"issues": 3, "duration_ms": 1.5}
+    assert built == []  # DEBUG disabled: payload never built
+
+    with caplog.at_level(logging.DEBUG, logger=log.name):
+        log_payload(log, "payload", build, rate=1.0)
+    assert built == [1]
+    assert caplog.records[-1].getMessage().endswith("chars)")
@@ -0,0 +1,57 @@
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.project_diff import diff_trees, direct_importers
+
+V1 = {
+    "pkg/__init__.py": "",
+    "pkg/a.py": "import os\n",
+    "pkg/b.py": "from . import a\nimport sys\n",
+    "pkg/c.py": "from pkg.b import a\n",
+    "other.py": "import json\n",
+}
+
+def _write(root, files):
+    for rel, text in files.items():
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(text)
+
+def test_diff_and_direct_importers(tmp_path):
+    old, new = tmp_path / "old", tmp_path / "new"
+    _write(old, V1)
+    _write(new, {**V1, "pkg/a.py": "import os\nimport re\n", "added.py": "x = 1\n"})
+    (new / "other.py").unlink()
+
+    diff = diff_trees(old, new)
+    assert (diff.added, diff.modified, diff.removed, diff.unchanged) == (["added.py"], ["pkg/a.py"], ["other.py"], 3)
+    candidates = ["pkg/__init__.py", "pkg/b.py", "pkg/c.py"]
+    assert direct_importers(new, ["pkg/a.py"], candidates) == ["pkg/b.py"]
+    assert direct_importers(new, ["pkg/b.py"], candidates) == ["pkg/c.py"]
+
+def _zip(files):
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as zf:
+        for rel, text in files.items():
+            zf.writestr(rel, text)
+    return {"zip_file": ("project.zip", payload.getvalue(), "application/zip")}
+
+def _issues(response):
+    return sorted((section, issue["file"], issue["code"], issue.get("line"))
+                  for section, body in response["result"].items() if isinstance(body, dict) and "issues" in body
+                  for issue in body["issues"])
+
+def test_analyze_diff_matches_full_analysis():
+    v2 = {**V1, "pkg/a.py": "import os\nimport re\n"}
+    with TestClient(app) as client:
+        first = client.post("/api/v1/analysis/analyze-zip", files=_zip(V1)).json()
+        diff = client.post("/api/v1/analysis/analyze-diff", params={"previous_session_id": first["session_id"]},
+                           files=_zip(v2)).json()
+        full = client.post("/api/v1/analysis/analyze-zip", files=_zip(v2)).json()
+
+    statuses = {entry["file"]: entry["status"] for entry in diff["changes"]["files"]}
+    assert statuses == {"pkg/a.py": "modified", "pkg/b.py": "importer"}
+    assert diff["changes"]["unchanged"] == 4 and not diff["changes"]["full_analysis"]
+    assert _issues(diff) == _issues(full)
@@ -0,0 +1,37 @@
+import json
+
+from app.services.pylint_pool import PylintWorkerPool
+
+def test_pool_lints_and_recycles_workers(tmp_path):
+    (tmp_path / "mod.py").write_text('"""Module"""\nimport os\n')
+    pool = PylintWorkerPool(size=1, max_jobs=1)
+    try:
+        for _ in range(2):
+            result = pool.run(["--output-format=json", "mod.py"], tmp_path, timeout=60)
+            issues = json.loads(result.output)
+            assert [issue["message-id"] for issue in issues] == ["W0611"]
+            assert issues[0]["path"] == "mod.py"
+        assert pool.recycled == 2
+    finally:
+        pool.close()
+
+def test_busy_pool_and_fallback_share_one_deadline(tmp_path, monkeypatch):
+    import asyncio
+    import time
+    from app.routers import analysis
+    from app.services.pylint_pool import PoolUnavailable
+
+    class BusyPool:
+        def run(self, args, cwd, timeout, cancel=None, deadline=None):
+            time.sleep(max(0.0, deadline - time.monotonic()))
+            raise PoolUnavailable("No pylint worker became free")
+
+    def no_fallback(*args):
+        raise AssertionError("fallback started after the deadline")
+
+    (tmp_path / "mod.py").write_text("import os\n")
+    monkeypatch.setattr(analysis, "get_pylint_pool", lambda: BusyPool())
+    monkeypatch.setattr(analysis, "run_linter_process", no_fallback)
+    started = time.monotonic()
+    result = asyncio.run(analysis.run_single_linter(analysis.Linter.PYLINT, tmp_path, timeout=0.3))
+    assert result["partial"] and time.monotonic() - started < 0.6
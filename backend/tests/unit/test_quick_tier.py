@@ -0,0 +1,71 @@
+import io
+import json
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import analysis
+
+SOURCE = "import os\nimport subprocess\nsubprocess.call('ls', shell=True)\n"
+
+def _zip():
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as zf:
+        zf.writestr("mod.py", SOURCE)
+    return {"zip_file": ("project.zip", payload.getvalue(), "application/zip")}
+
+def test_quick_tier_upgrades_to_full_in_background():
+    analysis.RESULT_STORE.clear()
+    with TestClient(app) as client:
+        quick = client.post("/api/v1/analysis/analyze-zip", params={"tier": "quick"}, files=_zip()).json()
+        assert quick["full_scan"] == "pending" and quick["result"]["linter"] == "ruff"
+        assert quick["result"]["main_analysis"]["tier"] == "quick"
+        assert {i["code"] for i in quick["result"]["security_scan"]["issues"]} >= {"S602"}
+
+        with client.stream("GET", f"/api/v1/analysis/{quick['session_id']}/events") as response:
+            events = [json.loads(line[len("data: "):]) for line in response.iter_lines() if line.startswith("data: ")]
+        assert [e["full_scan"] for e in events] == ["pending", "done"]
+        assert events[-1]["tiers"] == {name: "full" for name in analysis.SECTIONS}
+
+        full = analysis.ACTIVE_ANALYSES[quick["session_id"]]["result"]
+        assert full["linter"] == "pylint"
+        assert "B602" in {i["code"] for i in full["security_scan"]["issues"]}
+
+def test_unknown_tier_is_rejected():
+    with TestClient(app) as client:
+        response = client.post("/api/v1/analysis/analyze-zip", params={"tier": "fast"}, files=_zip())
+    assert response.status_code == 422
+
+def test_stored_linter_preferences_apply(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "user_profiles").mkdir()
+    (tmp_path / "user_profiles" / "tuned.json").write_text(json.dumps({
+        "id": "tuned", "email": "tuned@example.com", "hashed_password": "x", "preferences": {"ruff.ignore": "S602"}
+    }))
+    analysis.RESULT_STORE.clear()
+    with TestClient(app) as client:
+        url = "/api/v1/analysis/analyze-zip"
+        tuned = client.post(url, params={"tier": "quick", "user_id": "tuned"}, files=_zip()).json()
+        assert "S602" not in {i["code"] for i in tuned["result"]["security_scan"]["issues"]}
+        assert not tuned["cached"]
+        assert client.post(url, params={"user_id": "nobody"}, files=_zip()).status_code == 404
+        assert client.post(url, params={"user_id": "../tuned"}, files=_zip()).status_code == 400
+
+def test_diff_against_quick_session_waits_for_full_scan():
+    analysis.RESULT_STORE.clear()
+    with TestClient(app) as client:
+        quick = client.post("/api/v1/analysis/analyze-zip", params={"tier": "quick"}, files=_zip()).json()
+        payload = io.BytesIO()
+        with zipfile.ZipFile(payload, "w") as zf:
+            zf.writestr("mod.py", SOURCE + "import sys\n")
+        diff = client.post(
+            "/api/v1/analysis/analyze-diff",
+            params={"previous_session_id": quick["session_id"]},
+            files={"zip_file": ("project.zip", payload.getvalue(), "application/zip")}
+        ).json()
+
+    assert diff.get("full_scan", "done") == "done" and diff["result"]["linter"] == "pylint"
+    assert {name: section["tier"] for name, section in diff["result"].items()
+            if isinstance(section, dict) and "tier" in section} == {name: "full" for name in analysis.SECTIONS}
+    assert "B602" in {i["code"] for i in diff["result"]["security_scan"]["issues"]}
@@ -1,4 +1,4 @@
-from app.routers.analysis import parse_radon_output
+from app.services.parse_linter import parse_radon_output
 from pathlib import Path
 import json
 
@@ -0,0 +1,43 @@
+import hashlib
+import io
+import zipfile
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import analysis
+from app.services.result_store import ResultStore, copy_hashing
+
+def test_store_is_bounded_and_clones_on_get():
+    store = ResultStore(max_entries=2)
+    for key in ("a", "b", "c"):
+        store.put((key,), {"result": {"main_analysis": {"issues": [key]}}})
+    assert len(store) == 2 and store.get(("a",)) is None
+
+    hit = store.get(("c",))
+    hit["result"]["main_analysis"]["issues"] = []
+    assert store.get(("c",))["result"]["main_analysis"]["issues"] == ["c"]
+
+def test_copy_hashing():
+    target = io.BytesIO()
+    assert copy_hashing(io.BytesIO(b"zip bytes"), target) == (hashlib.sha256(b"zip bytes").hexdigest(), 9)
+    assert target.getvalue() == b"zip bytes"
+
+def test_identical_upload_is_served_from_store(tmp_path):
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as zf:
+        zf.writestr("pkg/mod.py", "import os\n")
+    files = {"zip_file": ("project.zip", payload.getvalue(), "application/zip")}
+    analysis.RESULT_STORE.clear()
+
+    with TestClient(app) as client:
+        first = client.post("/api/v1/analysis/analyze-zip", files=files).json()
+        second = client.post("/api/v1/analysis/analyze-zip", files=files).json()
+        assert (first["cached"], second["cached"]) == (False, True)
+        assert second["session_id"] != first["session_id"]
+        assert second["result"]["main_analysis"] == first["result"]["main_analysis"]
+        assert second["temp_dir"] in analysis.PENDING_EXTRACTS
+
+        content = client.get("/api/v1/api/v1/files", params={"path": "pkg/mod.py", "session_id": second["session_id"]})
+        assert content.json() == {"content": "import os\n"}
+        assert second["temp_dir"] not in analysis.PENDING_EXTRACTS
@@ -0,0 +1,20 @@
+import json
+import sys
+
+from app.services.ast_checks import run_ast_checks
+from app.services.deadline import Deadline
+from app.services.linter_runner import run_linter_process
+from app.services.parse_linter import LinterType
+
+def test_timed_out_linter_keeps_streamed_issues(tmp_path):
+    issue = {"code": "F401", "filename": str(tmp_path / "mod.py"), "location": {"row": 1, "column": 8}, "message": "unused"}
+    script = f"import sys, time; sys.stdout.write({('[' + json.dumps(issue) + ',')!r}); sys.stdout.flush(); time.sleep(30)"
+    run = run_linter_process([sys.executable, "-c", script], LinterType.RUFF, tmp_path, tmp_path, timeout=1)
+    assert run.timed_out
+    assert [(i["code"], i["file"]) for i in run.issues] == [("F401", "mod.py")]
+
+def test_ast_stage_stops_at_deadline(tmp_path):
+    (tmp_path / "mod.py").write_text("eval('1')\n")
+    result = run_ast_checks(tmp_path, deadline=Deadline(0))
+    assert result.partial and result.unchecked == 1 and result.security == []
+    assert not run_ast_checks(tmp_path, deadline=Deadline(60)).partial
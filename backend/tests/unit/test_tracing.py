@@ -0,0 +1,26 @@
+from app.services import tracing
+
+def test_spans_nest_and_export_once_per_trace(monkeypatch):
+    exported = []
+    monkeypatch.setattr(tracing.exporter, "export", exported.append)
+    monkeypatch.setattr(tracing, "TRACE_SAMPLE_RATE", 1.0)
+
+    with tracing.span("request") as root:
+        with tracing.span("lint", linter="ruff"):
+            tracing.current_span().set(issues=3)
+
+    assert len(exported) == 1
+    request, lint = exported[0]
+    assert lint.parent_id == root.span_id and lint.trace_id == root.trace_id
+    assert lint.to_otlp()["attributes"][1] == {"key": "issues", "value": {"intValue": "3"}}
+
+def test_unsampled_trace_is_noop(monkeypatch):
+    exported = []
+    monkeypatch.setattr(tracing.exporter, "export", exported.append)
+    monkeypatch.setattr(tracing, "TRACE_SAMPLE_RATE", 0.0)
+
+    with tracing.span("request"):
+        with tracing.span("lint") as child:
+            assert child is tracing.NOOP_SPAN
+
+    assert exported == []
@@ -0,0 +1,20 @@
+from app.services.zip_stream import stream_project_zip
+import io
+import zipfile
+
+def test_stream_project_zip_reuses_upload_members(tmp_path):
+    upload = tmp_path / "upload.zip"
+    with zipfile.ZipFile(upload, "w", zipfile.ZIP_DEFLATED) as zipf:
+        zipf.writestr("pkg/a.py", "a = 1\n" * 100)
+        zipf.writestr("pkg/b.py", "b = 2\n")
+    with zipfile.ZipFile(upload) as zipf:
+        zipf.extractall(tmp_path)
+    (tmp_path / "pkg" / "b.py").write_text("b = 3\n")
+
+    archive = b"".join(stream_project_zip(tmp_path, upload, {"pkg/b.py"}))
+
+    with zipfile.ZipFile(io.BytesIO(archive)) as zipf:
+        assert zipf.testzip() is None
+        assert sorted(zipf.namelist()) == ["pkg/a.py", "pkg/b.py"]
+        assert zipf.read("pkg/a.py") == b"a = 1\n" * 100
+        assert zipf.read("pkg/b.py") == b"b = 3\n"